@@ -3,4 +3,10 @@
 Terminal-based arcade shooter scaffold per PRD.
 """
 
+import logging
+
+# Library-style logging: silent unless the application configures handlers
+# (curses owns the terminal, so nothing may go to stderr by default)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __all__ = []
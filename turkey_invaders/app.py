@@ -1,14 +1,29 @@
+import logging
 import os
 import time
 import curses
 
+from .core.actions import EXIT, LEFT, NO, NONE, PAUSE, QUIT, RIGHT, START, YES
+from .core.events import EventLog
+from .core.watchdog import SlowTickWatchdog
+from .render.ansi_renderer import AnsiRenderer, RawTerminal
 from .render.curses_renderer import CursesRenderer
+from .render.governor import RenderGovernor
+from .render.recorder import AsciicastRecorder
+from .render.spectator import SpectatorServer
 from .render.stdout_renderer import StdoutRenderer
+from .render.tee import TeeRenderer
 from .input import Input
 from .scenes.menu import MenuScene
 from .config import load_config
 
 
+log = logging.getLogger(__name__)
+
+# Most simulation time the loop may owe before it gives up on catching up
+MAX_DEBT_SECONDS = 0.25
+
+
 def main() -> None:
     """Launch the game.
 
@@ -17,14 +32,44 @@ def main() -> None:
     Optional envs:
       - TI_HEADLESS_SECONDS: duration to run (default: 0.2)
       - TI_TERM_WIDTH / TI_TERM_HEIGHT: viewport size (default: 80x24)
+      - TI_BACKEND: 'curses' or 'ansi' (raw termios + ANSI); overrides the
+        config's `backend`
+      - TI_RECORD: path of an asciicast v2 file to record the session into
+      - TI_SPECTATE: serve the session to `python -m turkey_invaders.watch`
+        ('1' for the default socket path, or a socket path)
+      - TI_SHOW_METRICS: draw the render governor's state in a corner
+      - TI_EVENTS: path of a gameplay event log (`.jsonl` for JSON lines,
+        anything else for the binary format)
+      - TI_WATCHDOG: path of a collapsed-stack file; ticks that overrun
+        their budget are sampled into it (flamegraph input)
+      - TI_WATCHDOG_MS: watchdog budget per tick (default: one frame)
     """
-    if _env_truthy("TI_HEADLESS"):
-        seconds = float(os.environ.get("TI_HEADLESS_SECONDS", "0.2"))
-        width = int(os.environ.get("TI_TERM_WIDTH", "80"))
-        height = int(os.environ.get("TI_TERM_HEIGHT", "24"))
-        _run_headless(seconds=seconds, width=width, height=height)
-    else:
-        curses.wrapper(_run)
+    events_path = os.environ.get("TI_EVENTS")
+    event_log = EventLog(events_path) if events_path else None
+    events = _SceneEvents(event_log) if event_log is not None else None
+    watchdog = _watchdog_from_env()
+    try:
+        if _env_truthy("TI_HEADLESS"):
+            seconds = float(os.environ.get("TI_HEADLESS_SECONDS", "0.2"))
+            width = int(os.environ.get("TI_TERM_WIDTH", "80"))
+            height = int(os.environ.get("TI_TERM_HEIGHT", "24"))
+            _run_headless(seconds=seconds, width=width, height=height, watchdog=watchdog, events=events)
+            return
+        cfg = load_config()
+        backend = os.environ.get("TI_BACKEND", "").lower() or cfg.backend
+        if backend == "ansi":
+            _run_ansi(cfg, watchdog, events)
+        else:
+            curses.wrapper(_run, cfg, watchdog, events)
+    finally:
+        if event_log is not None:
+            events.follow(None)
+            event_log.close()
+        if watchdog is not None:
+            watchdog.close()
+
+
+_FALSY = {"0", "false", "no", "off"}
 
 
 def _env_truthy(name: str) -> bool:
@@ -32,7 +77,55 @@ def _env_truthy(name: str) -> bool:
     return val.lower() in {"1", "true", "yes", "on"}
 
 
-def _run(stdscr) -> None:
+def _watchdog_from_env():
+    path = os.environ.get("TI_WATCHDOG")
+    if not path:
+        return None
+    try:
+        budget = float(os.environ.get("TI_WATCHDOG_MS", "")) / 1000.0
+    except ValueError:
+        budget = None  # the loop's tick length
+    return SlowTickWatchdog(path, budget=budget)
+
+
+class _SceneEvents:
+    """Keeps an event sink subscribed to the active scene's world bus."""
+
+    def __init__(self, sink) -> None:
+        self.sink = sink
+        self._bus = None
+
+    def follow(self, scene) -> None:
+        world = getattr(scene, "world", None)
+        bus = world.events if world is not None else None
+        if bus is self._bus:
+            return
+        if self._bus is not None:
+            self._bus.unsubscribe(self.sink)
+        if bus is not None:
+            bus.subscribe(self.sink)
+        self._bus = bus
+
+
+def _with_sinks(renderer):
+    """Wrap renderer in a TeeRenderer when frame sinks are requested."""
+    sinks = []
+    record_path = os.environ.get("TI_RECORD")
+    if record_path:
+        sinks.append(AsciicastRecorder(record_path))
+    spectate = os.environ.get("TI_SPECTATE", "")
+    if spectate and spectate.lower() not in _FALSY:
+        sinks.append(SpectatorServer(None if _env_truthy("TI_SPECTATE") else spectate))
+    return TeeRenderer(renderer, sinks) if sinks else renderer
+
+
+def _close_sinks(renderer) -> None:
+    close = getattr(renderer, "close", None)
+    if close is not None:
+        close()
+
+
+def _run(stdscr, cfg, watchdog=None, events=None) -> None:
     # Basic terminal setup
     stdscr.nodelay(True)
     stdscr.keypad(True)
@@ -41,11 +134,29 @@ def _run(stdscr) -> None:
     except Exception:
         pass
 
-    cfg = load_config()
     renderer = CursesRenderer(stdscr, scale=cfg.scale)
     input_sys = Input(stdscr, controls=cfg.controls)
+    _loop(renderer, input_sys, cfg, watchdog, events)
+
+
+def _run_ansi(cfg, watchdog=None, events=None) -> None:
+    """Interactive run on the raw-ANSI backend (no curses)."""
+    with RawTerminal() as term:
+        renderer = AnsiRenderer(term, scale=cfg.scale)
+        input_sys = Input(term, controls=cfg.controls)
+        _loop(renderer, input_sys, cfg, watchdog, events)
+
 
-    current_scene = MenuScene(config=cfg)
+def _loop(renderer, input_sys, cfg, watchdog=None, events=None) -> None:
+    renderer = _with_sinks(renderer)
+    try:
+        _loop_frames(renderer, input_sys, cfg, watchdog, events)
+    finally:
+        _close_sinks(renderer)
+
+
+def _loop_frames(renderer, input_sys, cfg, watchdog=None, events=None) -> None:
+    current_scene = MenuScene.shared(cfg)
     running = True
     # Global exit confirmation state
     confirm_exit = False
@@ -55,19 +166,39 @@ def _run(stdscr) -> None:
     tick = 1.0 / float(fps)
     last = time.monotonic()
     accumulator = 0.0
+    # Under render load, frames and overlays are shed before simulation time
+    governor = RenderGovernor(tick)
+    show_metrics = _env_truthy("TI_SHOW_METRICS")
+    if watchdog is not None and not watchdog.budget:
+        watchdog.budget = tick
 
-    # Allow a limited number of catch-up steps to avoid spiral-of-death
+    # Catch-up ticks per iteration; the rest of the debt carries over while
+    # renders are skipped, up to a bounded debt
     max_substeps = 4
+    max_debt = max(MAX_DEBT_SECONDS, max_substeps * tick)
+    logged_at, unlogged = float("-inf"), 0.0  # debt warnings go out at most once a second
     while running:
         now = time.monotonic()
         frame_time = now - last
         last = now
         accumulator += frame_time
+        if accumulator > max_debt:
+            # Persistently slower than real time: drop only the excess
+            dropped = accumulator - max_debt
+            accumulator = max_debt
+            governor.dropped += dropped
+            unlogged += dropped
+            if now - logged_at >= 1.0:
+                log.warning("simulation over %.0f ms behind real time; dropped %.0f ms",
+                            max_debt * 1000.0, unlogged * 1000.0)
+                logged_at, unlogged = now, 0.0
+        if watchdog is not None:
+            watchdog.begin_tick()
 
         # Input
         actions = input_sys.poll()
         # ESC -> open exit confirmation overlay
-        if 'exit' in actions:
+        if actions & EXIT:
             confirm_exit = True
             confirm_choice = 1
         if not confirm_exit:
@@ -80,47 +211,56 @@ def _run(stdscr) -> None:
                 current_scene.update(tick)
             accumulator -= tick
             steps += 1
-        if steps == max_substeps and accumulator >= tick:
-            # Drop leftover to keep real-time pace
-            accumulator = 0.0
 
-        # Render
-        renderer.begin_frame()
-        current_scene.render(renderer)
-        if confirm_exit:
-            _render_confirm_exit(renderer, confirm_choice)
-        renderer.end_frame()
+        # Render (the governor may skip this frame or ask for low detail);
+        # while ticks are still owed, renders are skipped to catch up
+        if governor.should_render(steps, behind=accumulator >= tick):
+            current_scene.low_detail = governor.low_detail
+            render_start = time.perf_counter()
+            renderer.begin_frame()
+            current_scene.render(renderer)
+            if confirm_exit:
+                _render_confirm_exit(renderer, confirm_choice)
+            if show_metrics:
+                _render_metrics(renderer, governor)
+            renderer.end_frame()
+            governor.record(time.perf_counter() - render_start)
 
         if confirm_exit:
             # Handle confirm input
-            if 'left' in actions or 'right' in actions:
+            if actions & (LEFT | RIGHT):
                 confirm_choice = 1 - confirm_choice
-            if 'yes' in actions:
+            if actions & YES:
                 confirm_choice = 0
-            if 'no' in actions:
+            if actions & NO:
                 confirm_choice = 1
-            if 'start' in actions:
+            if actions & START:
                 if confirm_choice == 0:
                     running = False
                 else:
                     confirm_exit = False
             # Also allow pressing 'quit' or 'pause' to cancel
-            if 'quit' in actions or 'pause' in actions:
+            if actions & (QUIT | PAUSE):
                 confirm_exit = False
         else:
             if getattr(current_scene, "exit_program", False):
                 running = False
             elif getattr(current_scene, "next_scene", None) is not None:
                 current_scene = current_scene.next_scene
+                if events is not None:
+                    events.follow(current_scene)
 
-        # Frame cap
+        if watchdog is not None:
+            watchdog.end_tick()
+
+        # Frame cap (no sleeping while ticks are owed)
         elapsed = time.monotonic() - now
         sleep_for = tick - elapsed
-        if sleep_for > 0:
+        if sleep_for > 0 and accumulator < tick:
             time.sleep(sleep_for)
 
 
-def _run_headless(*, seconds: float, width: int, height: int) -> None:
+def _run_headless(*, seconds: float, width: int, height: int, watchdog=None, events=None) -> None:
     """Minimal non-curses run that renders to stdout.
 
     Runs the main loop for a limited time without input.
@@ -131,9 +271,15 @@ def _run_headless(*, seconds: float, width: int, height: int) -> None:
         scale = int(os.environ.get("TI_SCALE", str(load_config().scale)))
     except Exception:
         scale = load_config().scale
-    renderer = StdoutRenderer(width=width, height=height, scale=scale)
+    renderer = _with_sinks(StdoutRenderer(width=width, height=height, scale=scale))
+    try:
+        _loop_headless(renderer, cfg, seconds, watchdog, events)
+    finally:
+        _close_sinks(renderer)
 
-    current_scene = MenuScene(config=cfg)
+
+def _loop_headless(renderer, cfg, seconds: float, watchdog=None, events=None) -> None:
+    current_scene = MenuScene.shared(cfg)
     running = True
     confirm_exit = False
     confirm_choice = 1
@@ -143,6 +289,8 @@ def _run_headless(*, seconds: float, width: int, height: int) -> None:
     last = time.monotonic()
     end_time = last + max(0.05, seconds)
     accumulator = 0.0
+    if watchdog is not None and not watchdog.budget:
+        watchdog.budget = tick
 
     # Allow a limited number of catch-up steps to avoid spiral-of-death
     max_substeps = 3
@@ -151,9 +299,11 @@ def _run_headless(*, seconds: float, width: int, height: int) -> None:
         frame_time = now - last
         last = now
         accumulator += frame_time
+        if watchdog is not None:
+            watchdog.begin_tick()
 
         # No input in headless mode
-        actions = set()
+        actions = NONE
         if not confirm_exit:
             current_scene.handle_actions(actions)
 
@@ -181,6 +331,11 @@ def _run_headless(*, seconds: float, width: int, height: int) -> None:
                 running = False
             elif getattr(current_scene, "next_scene", None) is not None:
                 current_scene = current_scene.next_scene
+                if events is not None:
+                    events.follow(current_scene)
+
+        if watchdog is not None:
+            watchdog.end_tick()
 
         # Frame cap
         elapsed = time.monotonic() - now
@@ -189,6 +344,12 @@ def _run_headless(*, seconds: float, width: int, height: int) -> None:
             time.sleep(sleep_for)
 
 
+def _render_metrics(r, governor: RenderGovernor) -> None:
+    w, h = r.get_size()
+    text = governor.summary()
+    r.draw_text(max(0, w - len(text) - 1), h - 1, text, color_pair=2)
+
+
 def _render_confirm_exit(r, choice: int) -> None:
     w, h = r.get_size()
     options = ["Yes", "No"]
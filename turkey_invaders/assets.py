@@ -0,0 +1,122 @@
+"""Asset registry with background preloading.
+
+Wave packs are read, parsed and normalized once, off the game thread, while
+the menu is showing (`registry.preload()`). Scenes then ask the registry for
+the compiled pack, so starting a game does no disk I/O. A request for an
+asset that is still loading waits for the loader instead of reading the file
+a second time.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .core.paths import PathTable, bake_paths
+
+
+DEFAULT_WAVES_PATH = os.path.join(os.path.dirname(__file__), "data", "waves.json")
+
+_FALLBACK_SEED = 1337
+_FALLBACK_WAVES = ({"id": "wave1", "type": "formation", "rows": 1, "cols": 6, "speed": 2.0},)
+
+
+@dataclass(frozen=True)
+class WavePack:
+    """Parsed wave file: name (file stem), RNG seed, wave specs and baked paths.
+
+    Wave dicts and path tables are shared between spawners and must be
+    treated as read-only.
+    """
+
+    name: str
+    path: str
+    seed: int
+    waves: Tuple[Dict[str, Any], ...]
+    paths: Dict[str, PathTable] = field(default_factory=dict)
+
+    @property
+    def path_list(self) -> Tuple[PathTable, ...]:
+        """Paths ordered by id (snapshots refer to paths by id)."""
+        return tuple(self.paths.values())
+
+
+def load_wave_pack(path: Optional[str] = None) -> WavePack:
+    """Read a waves file and bake its paths.
+
+    Falls back to a single formation wave if the file cannot be read; a bad
+    path entry is dropped on its own.
+    """
+    path = path or DEFAULT_WAVES_PATH
+    name = os.path.splitext(os.path.basename(path))[0]
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        seed = int(data.get("seed", _FALLBACK_SEED))
+        waves = tuple(data.get("waves", [])) or _FALLBACK_WAVES
+        paths = bake_paths(data.get("paths") or {})
+    except Exception:
+        seed, waves, paths = _FALLBACK_SEED, _FALLBACK_WAVES, {}
+    return WavePack(name=name, path=path, seed=seed, waves=waves, paths=paths)
+
+
+class AssetRegistry:
+    """Thread-safe cache of compiled assets keyed by absolute path."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._packs: Dict[str, WavePack] = {}
+        self._loading: Dict[str, threading.Event] = {}
+
+    def preload(self, *wave_paths: str) -> threading.Thread:
+        """Load the given wave packs (default pack if none) in a daemon thread."""
+        paths = [os.path.abspath(p) for p in (wave_paths or (DEFAULT_WAVES_PATH,))]
+        with self._lock:
+            paths = [p for p in paths if p not in self._packs and p not in self._loading]
+            for p in paths:
+                self._loading[p] = threading.Event()
+        t = threading.Thread(target=self._load_all, args=(paths,), name="asset-preload", daemon=True)
+        t.start()
+        return t
+
+    def wave_pack(self, path: Optional[str] = None) -> WavePack:
+        """Compiled wave pack; loads synchronously if it was never preloaded."""
+        key = os.path.abspath(path or DEFAULT_WAVES_PATH)
+        with self._lock:
+            pack = self._packs.get(key)
+            pending = self._loading.get(key)
+            if pack is None and pending is None:
+                pending = self._loading[key] = threading.Event()
+                owner = True
+            else:
+                owner = False
+        if pack is not None:
+            return pack
+        if owner:
+            self._load_all([key])
+        else:
+            pending.wait()
+        with self._lock:
+            return self._packs[key]
+
+    def is_loaded(self, path: Optional[str] = None) -> bool:
+        return os.path.abspath(path or DEFAULT_WAVES_PATH) in self._packs
+
+    def clear(self) -> None:
+        with self._lock:
+            self._packs.clear()
+
+    def _load_all(self, paths: List[str]) -> None:
+        for p in paths:
+            pack = load_wave_pack(p)  # never raises; falls back on bad files
+            with self._lock:
+                self._packs[p] = pack
+                done = self._loading.pop(p, None)
+            if done is not None:
+                done.set()
+
+
+# Process-wide registry used by scenes
+registry = AssetRegistry()
@@ -0,0 +1,785 @@
+"""Lockstep batch of N independent games in shared NumPy arrays.
+
+`BatchSimulation` advances N copies of `Simulation` with one vectorized
+tick. Entity state lives in (N, capacity) columns whose slot order matches
+each scalar world's entity list, so id allocation, collision order and RNG
+draws line up with the scalar rules in `entities/` and `systems/`. Only the
+RNG-driven parts (spawns, drop rolls) loop in Python, and only over the envs
+that need them on a given tick.
+
+NumPy is an optional dependency used by this module only.
+
+Cross-check mode (`cross_check=True`) steps a scalar `Simulation` per env
+alongside the batch and raises `DesyncError` on the first difference:
+
+    python -m turkey_invaders.batch --envs 32 --steps 3000 --cross-check
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .assets import registry
+from .config import DEFAULT_CONFIG
+from .core.fixed import FRAC_BITS, FRAC_MASK, HALF, scale, to_fixed
+from .core.paths import PATH_HZ, wobble_table
+from .core.world import World
+from .simulation import (
+    BOMB, DOWN, FIRE, LEFT, RIGHT, UP,
+    EMPTY, ENEMY, PLAYER, POWERUP_BOMB, POWERUP_POWER, PROJ_ENEMY, PROJ_PLAYER,
+    Simulation,
+)
+from .systems.scoring import KILL_POINTS
+from .systems.spawner import Spawner
+
+
+# Slot kinds
+K_NONE = 0
+K_GRUNT = 1
+K_DIVE = 2
+K_SHOOTER = 3
+K_PATH = 4
+K_PROJ_PLAYER = 5
+K_PROJ_ENEMY = 6
+K_POWERUP_POWER = 7
+K_POWERUP_BOMB = 8
+K_ENEMY_LAST = K_PATH  # enemy kinds are K_GRUNT..K_ENEMY_LAST
+
+# Slot kind -> observation code
+_OBS_OF_KIND = np.array(
+    [EMPTY, ENEMY, ENEMY, ENEMY, ENEMY, PROJ_PLAYER, PROJ_ENEMY, POWERUP_POWER, POWERUP_BOMB], dtype=np.uint8
+)
+
+# Mirrors of the scalar entity constants (speeds in core.fixed units)
+_PLAYER_SPEED = to_fixed(20.0)
+_PLAYER_FIRE_CD = 0.16
+_PLAYER_INVULN = 1.5
+_PLAYER_SHOT_VY = to_fixed(-18.0)
+_ENEMY_SHOT_VY = to_fixed(1.0)
+_SHOOTER_DESCENT = to_fixed(0.5)
+_POWERUP_FALL = to_fixed(4.0)
+
+# Per-slot columns: name -> dtype
+_COLUMNS: Dict[str, Any] = {
+    "kind": np.int8,
+    "eid": np.int64,
+    "x": np.int64,
+    "y": np.int64,
+    "ax": np.int64,
+    "ay": np.int64,
+    "vy": np.int64,
+    "dir": np.int64,
+    "speed": np.int64,
+    "idx": np.int64,
+    "path": np.int64,
+    "ox": np.int64,
+    "oy": np.int64,
+    "pa": np.int64,
+    "cooldown": np.float64,
+    "fire_interval": np.float64,
+    "hp": np.int64,
+    "alive": np.bool_,
+    "wave": np.int64,
+}
+
+_STATE_COLUMNS = tuple(c for c in _COLUMNS if c not in ("kind", "eid", "x", "y"))
+
+
+class DesyncError(AssertionError):
+    """Batch state diverged from the scalar reference in cross-check mode."""
+
+
+class BatchSimulation:
+    """N lockstep games sharing struct-of-arrays state.
+
+    `step(actions)` takes an int array of per-env action masks (same bits as
+    `Simulation.step`) and returns (obs, reward, done, info) where obs is a
+    preallocated (N, height, width) uint8 array filled in place.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        *,
+        width: int = 80,
+        height: int = 24,
+        fps: int = 60,
+        drops: Optional[Dict[str, float]] = None,
+        waves_path: Optional[str] = None,
+        max_steps: int = 0,
+        life_penalty: int = 50,
+        capacity: int = 64,
+        cross_check: bool = False,
+    ) -> None:
+        self.n = max(1, int(n))
+        self.width = max(10, int(width))
+        self.height = max(6, int(height))
+        self.fps = fps
+        self.dt = 1.0 / float(max(1, fps))
+        drops = drops if drops is not None else DEFAULT_CONFIG["drops"]
+        self.p_power = float(drops.get("power", 0.20))
+        self.p_bomb = float(drops.get("bomb", 0.05))
+        self.max_steps = int(max_steps)
+        self.life_penalty = int(life_penalty)
+
+        # Wave pack is parsed once and shared by every env
+        template = Spawner(World(), pack=registry.wave_pack(waves_path))
+        self.waves: List[Dict[str, Any]] = list(template.waves)
+        self.default_seed = template.seed
+        self.pack = template.pack
+        self.path_ids = {name: t.id for name, t in template.paths.items()}
+        self._compile_waves()
+        self._compile_paths(template.path_list)
+
+        n = self.n
+        self.capacity = max(8, int(capacity))
+        for name, dtype in _COLUMNS.items():
+            setattr(self, name, np.zeros((n, self.capacity), dtype=dtype))
+        self.count = np.zeros(n, dtype=np.int64)
+        self.next_id = np.ones(n, dtype=np.int64)
+
+        # Player
+        self.px = np.zeros(n, dtype=np.int64)
+        self.py = np.zeros(n, dtype=np.int64)
+        self.pmx = np.zeros(n, dtype=np.int64)
+        self.pmy = np.zeros(n, dtype=np.int64)
+        self.pcooldown = np.zeros(n, dtype=np.float64)
+        self.power = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.invuln = np.zeros(n, dtype=np.float64)
+        self.bombs = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+
+        # Spawner cursor
+        self.wave_index = np.zeros(n, dtype=np.int64)
+        self.wave_timer = np.zeros(n, dtype=np.float64)
+        self.spawn_accum = np.zeros(n, dtype=np.float64)
+        self.spawned_once = np.zeros(n, dtype=np.bool_)
+        self.spawned = np.zeros(n, dtype=np.int64)
+        self.rngs: List[random.Random] = [random.Random(self.default_seed) for _ in range(n)]
+
+        self.obs = np.zeros((n, self.height, self.width), dtype=np.uint8)
+        self.reward = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=np.bool_)
+        self.tick = 0
+        self._env = np.arange(n, dtype=np.int64)
+
+        self.reference: List[Simulation] = []
+        if cross_check:
+            self.reference = [
+                Simulation(width=self.width, height=self.height, fps=fps, drops=drops,
+                           waves_path=waves_path, max_steps=max_steps, life_penalty=life_penalty)
+                for _ in range(n)
+            ]
+        self.reset()
+
+    # --- public API ---
+    def reset(self, seeds: Optional[Sequence[int]] = None) -> np.ndarray:
+        n = self.n
+        if seeds is None:
+            seeds = [self.default_seed] * n
+        if len(seeds) != n:
+            raise ValueError(f"expected {n} seeds, got {len(seeds)}")
+        for name in _COLUMNS:
+            getattr(self, name).fill(0)
+        self.count.fill(0)
+        # Id 1 belongs to the player in every env
+        self.next_id.fill(2)
+        self.px.fill(self.width // 2)
+        self.py.fill(self.height - 2)
+        self.pmx.fill(HALF)
+        self.pmy.fill(HALF)
+        self.pcooldown.fill(0.0)
+        self.power.fill(0)
+        self.lives.fill(3)
+        self.invuln.fill(0.0)
+        self.bombs.fill(1)
+        self.score.fill(0)
+        self.wave_index.fill(0)
+        self.wave_timer.fill(0.0)
+        self.spawn_accum.fill(0.0)
+        self.spawned_once.fill(False)
+        self.spawned.fill(0)
+        self.rngs = [random.Random(int(s)) for s in seeds]
+        self.reward.fill(0)
+        self.done.fill(False)
+        self.tick = 0
+        for sim, seed in zip(self.reference, seeds):
+            sim.reset(int(seed))
+        self._observe()
+        if self.reference:
+            self.verify()
+        return self.obs
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.n,):
+            actions = np.broadcast_to(actions, (self.n,))
+        score_before = self.score.copy()
+        lives_before = self.lives.copy()
+        self._hit = np.zeros(self.n, dtype=np.bool_)
+
+        self._apply_actions(actions)
+        updated = self.count.copy()
+        self._update_player()
+        self._update_entities(updated)
+        self._update_spawner()
+        self._collide()
+        self._award_kills()
+        self._remove_dead()
+        self.tick += 1
+
+        self.reward[:] = (self.score - score_before) - self.life_penalty * (lives_before - self.lives)
+        self.done[:] = (self.lives <= 0) | (self.wave_index >= len(self.waves))
+        if 0 < self.max_steps <= self.tick:
+            self.done[:] = True
+        self._observe()
+
+        if self.reference:
+            for sim, a in zip(self.reference, actions.tolist()):
+                sim.step(int(a))
+            self.verify()
+        info = {"score": self.score, "lives": self.lives, "power": self.power,
+                "bombs": self.bombs, "wave": self.wave_index}
+        return self.obs, self.reward, self.done, info
+
+    def verify(self) -> None:
+        """Compare every env against its scalar reference; raise on mismatch."""
+        for i, sim in enumerate(self.reference):
+            problem = self._diff_env(i, sim)
+            if problem:
+                raise DesyncError(f"env {i} tick {self.tick}: {problem}")
+
+    # --- waves ---
+    def _compile_paths(self, tables) -> None:
+        # Path tables padded into (paths, longest) arrays for fancy indexing
+        longest = max((t.length for t in tables), default=1)
+        self._p_dx = np.zeros((max(1, len(tables)), longest), dtype=np.int64)
+        self._p_dy = np.zeros_like(self._p_dx)
+        self._p_len = np.ones(max(1, len(tables)), dtype=np.int64)
+        self._p_end = np.zeros((max(1, len(tables)), 2), dtype=np.int64)
+        for t in tables:
+            self._p_dx[t.id, :t.length] = t.dx
+            self._p_dy[t.id, :t.length] = t.dy
+            self._p_len[t.id] = t.length
+            self._p_end[t.id] = (t.end_dx, t.end_dy)
+        self._wobble = np.zeros(0, dtype=np.int64)
+
+    def _compile_waves(self) -> None:
+        waves = self.waves
+        n = len(waves) + 1  # trailing sentinel for finished envs
+        self._w_formation = np.zeros(n, dtype=np.bool_)
+        self._w_rate = np.zeros(n, dtype=np.float64)
+        self._w_count = np.zeros(n, dtype=np.int64)
+        for i, wave in enumerate(waves):
+            if wave.get("type") == "formation":
+                self._w_formation[i] = True
+            else:
+                self._w_rate[i] = float(wave.get("spawn_rate", 1.0))
+                self._w_count[i] = int(wave.get("count", 10))
+
+    # --- slot storage ---
+    def _grow(self, need: int) -> None:
+        cap = self.capacity
+        while cap < need:
+            cap *= 2
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((self.n, cap), dtype=old.dtype)
+            new[:, : self.capacity] = old
+            setattr(self, name, new)
+        self.capacity = cap
+
+    def _append(self, envs: np.ndarray, kind, x, y, **cols) -> np.ndarray:
+        """Append one slot per entry of `envs`, preserving order within each env.
+
+        Allocates entity ids in the same order. Returns (envs, slots).
+        """
+        k = len(envs)
+        if k == 0:
+            return np.zeros(0, dtype=np.int64)
+        order = np.argsort(envs, kind="stable")
+        sorted_envs = envs[order]
+        first = np.searchsorted(sorted_envs, sorted_envs, side="left")
+        rank = np.empty(k, dtype=np.int64)
+        rank[order] = np.arange(k) - first
+        slots = self.count[envs] + rank
+        if int(slots.max()) >= self.capacity:
+            self._grow(int(slots.max()) + 1)
+        added = np.bincount(envs, minlength=self.n)
+        self.kind[envs, slots] = kind
+        self.eid[envs, slots] = self.next_id[envs] + rank
+        self.x[envs, slots] = x
+        self.y[envs, slots] = y
+        for name in _STATE_COLUMNS:
+            getattr(self, name)[envs, slots] = 0
+        for name in ("ax", "ay", "pa"):
+            getattr(self, name)[envs, slots] = HALF
+        self.hp[envs, slots] = 1
+        self.alive[envs, slots] = True
+        for name, value in cols.items():
+            getattr(self, name)[envs, slots] = value
+        self.count += added
+        self.next_id += added
+        return slots
+
+    def _append_one(self, env: int, kind: int, x: int, y: int, **cols) -> None:
+        self._append(np.array([env], dtype=np.int64), kind, x, y, **cols)
+
+    # --- tick phases ---
+    def _apply_actions(self, actions: np.ndarray) -> None:
+        self._ix = (actions & RIGHT != 0).astype(np.int64) - (actions & LEFT != 0)
+        self._iy = (actions & DOWN != 0).astype(np.int64) - (actions & UP != 0)
+
+        # Fire (Player.fire)
+        firing = (actions & FIRE != 0) & (self.pcooldown <= 0.0)
+        if firing.any():
+            self.pcooldown[firing] = _PLAYER_FIRE_CD
+            envs = np.flatnonzero(firing)
+            power = self.power[envs]
+            shots = np.where(power <= 0, 1, np.where(power == 1, 2, 3))
+            rep = np.repeat(envs, shots)
+            first = np.repeat(np.cumsum(shots) - shots, shots)
+            idx = np.arange(len(rep)) - first
+            pw = self.power[rep]
+            offset = np.where(pw <= 0, 0, np.where(pw == 1, idx * 2 - 1, idx - 1))
+            sx = np.clip(self.px[rep] + offset, None, self.width - 2)
+            sx = np.maximum(1, sx)
+            self._append(rep, K_PROJ_PLAYER, sx, self.py[rep] - 1, vy=_PLAYER_SHOT_VY)
+
+        # Bomb (Player.use_bomb)
+        bombing = (actions & BOMB != 0) & (self.bombs > 0)
+        if bombing.any():
+            live = self._slots() & (self.kind == K_PROJ_ENEMY) & self.alive & bombing[:, None]
+            cleared = live.sum(axis=1)
+            self.alive[live] = False
+            self.bombs -= cleared > 0
+
+    def _slots(self) -> np.ndarray:
+        return np.arange(self.capacity)[None, :] < self.count[:, None]
+
+    def _update_player(self) -> None:
+        dt = self.dt
+        step = scale(_PLAYER_SPEED, dt)
+        self.pmx += self._ix * step
+        self.pmy += self._iy * step
+
+        m = self.pcooldown > 0
+        self.pcooldown[m] -= dt
+        m = self.invuln > 0
+        self.invuln[m] -= dt
+        self._clamp_player()
+        for acc, pos in ((self.pmx, self.px), (self.pmy, self.py)):
+            pos += acc >> FRAC_BITS
+            acc &= FRAC_MASK
+        self._clamp_player()
+
+    def _clamp_player(self) -> None:
+        self.px[:] = np.maximum(1, np.minimum(max(1, self.width - 2), self.px))
+        self.py[:] = np.maximum(1, np.minimum(max(1, self.height - 2), self.py))
+
+    @staticmethod
+    def _carry(acc: np.ndarray, pos: np.ndarray, mask: np.ndarray, rate, dt: float, sign=1) -> None:
+        """Advance the masked fractions by `rate` (scalar or per slot) and carry whole cells."""
+        if isinstance(rate, np.ndarray):
+            a = acc[mask] + np.rint(rate[mask] * dt).astype(np.int64)
+        else:
+            a = acc[mask] + scale(rate, dt)
+        cells = a >> FRAC_BITS
+        pos[mask] += sign[mask] * cells if isinstance(sign, np.ndarray) else sign * cells
+        acc[mask] = a & FRAC_MASK
+
+    def _update_entities(self, updated: np.ndarray) -> None:
+        dt = self.dt
+        w, h = self.width, self.height
+        slots = np.arange(self.capacity)[None, :] < updated[:, None]
+        kind = self.kind
+        x, y = self.x, self.y
+
+        # GruntEnemy
+        g = slots & (kind == K_GRUNT)
+        if g.any():
+            self._carry(self.ax, x, g, self.speed, dt, self.dir)
+            left = g & (x <= 1)
+            right = g & ~left & (x >= w - 2)
+            x[left] = 1
+            self.dir[left] = 1
+            x[right] = w - 2
+            self.dir[right] = -1
+            y[left | right] += 1
+            self._breach(g)
+
+        # DiveEnemy
+        d = slots & (kind == K_DIVE)
+        if d.any():
+            target = np.broadcast_to(self.px[:, None], x.shape)
+            x[d] += np.sign(target[d] - x[d])
+            self._carry(self.ay, y, d, self.speed, dt)
+            # Same precomputed table as DiveEnemy
+            need = int(self.idx[d].max()) + 1
+            if need > len(self._wobble):
+                self._wobble = np.asarray(wobble_table(dt, need), dtype=np.int64)
+            x[d] += self._wobble[self.idx[d]]
+            self.idx[d] += 1
+            x[d] = np.maximum(1, np.minimum(w - 2, x[d]))
+            self._breach(d)
+
+        # PathEnemy
+        q = slots & (kind == K_PATH)
+        if q.any():
+            self._carry(self.pa, self.idx, q, self.speed * PATH_HZ, dt)
+            wrap = q & (self.idx >= self._p_len[self.path])
+            if wrap.any():
+                pw = self.path[wrap]
+                laps, self.idx[wrap] = np.divmod(self.idx[wrap], self._p_len[pw])
+                end = self._p_end[pw]
+                self.ox[wrap] += laps * end[:, 0]
+                self.oy[wrap] += laps * end[:, 1]
+            pid, st = self.path[q], self.idx[q]
+            x[q] = np.maximum(1, np.minimum(w - 2, self.ox[q] + self._p_dx[pid, st]))
+            y[q] = self.oy[q] + self._p_dy[pid, st]
+            self._breach(q)
+
+        # ShooterEnemy
+        s = slots & (kind == K_SHOOTER)
+        if s.any():
+            self._carry(self.ax, x, s, self.speed, dt, self.dir)
+            bounce = s & ((x <= 1) | (x >= w - 2))
+            x[s & (x <= 1)] = 1
+            x[s & (x >= w - 2)] = w - 2
+            self.dir[bounce] *= -1
+            self.cooldown[s] -= dt
+            fire = s & (self.cooldown <= 0)
+            shots = None
+            if fire.any():
+                self.cooldown[fire] = self.fire_interval[fire]
+                envs, cols = np.nonzero(fire)
+                shots = (envs, x[envs, cols].copy(), y[envs, cols] + 1)
+            self._carry(self.ay, y, s, _SHOOTER_DESCENT, dt)
+            self._breach(s)
+            if shots is not None:
+                # Spawned after the update pass, in slot order per env
+                self._append(shots[0], K_PROJ_ENEMY, shots[1], shots[2], vy=_ENEMY_SHOT_VY)
+
+        # Projectile
+        p = slots & ((kind == K_PROJ_PLAYER) | (kind == K_PROJ_ENEMY))
+        if p.any():
+            self._carry(self.ay, y, p, self.vy, dt)
+            self.alive[p & ((y < 1) | (y >= h - 1))] = False
+
+        # PowerUp
+        u = slots & ((kind == K_POWERUP_POWER) | (kind == K_POWERUP_BOMB))
+        if u.any():
+            self._carry(self.ay, y, u, _POWERUP_FALL, dt)
+            self.alive[u & (y >= h - 1)] = False
+
+    def _breach(self, mask: np.ndarray) -> None:
+        """Enemies reaching the player zone hit the player and die."""
+        b = mask & (self.y >= self.height - 2)
+        if b.any():
+            self._hit |= b.any(axis=1)
+            self.alive[b] = False
+
+    def _update_spawner(self) -> None:
+        dt = self.dt
+        nwaves = len(self.waves)
+        active = self.wave_index < nwaves
+        if not active.any():
+            return
+        wi = np.minimum(self.wave_index, nwaves)
+        self.wave_timer[active] += dt
+        formation = active & self._w_formation[wi]
+        for env in np.flatnonzero(formation & ~self.spawned_once).tolist():
+            self._spawn_formation(env, self.waves[int(wi[env])])
+        self.spawned_once[formation] = True
+
+        stream = active & ~self._w_formation[wi]
+        if stream.any():
+            self.spawn_accum[stream] += self._w_rate[wi[stream]] * dt
+            due = stream & (self.spawn_accum >= 1.0) & (self.spawned < self._w_count[wi])
+            for env in np.flatnonzero(due).tolist():
+                wave = self.waves[int(wi[env])]
+                left = int(self._w_count[wi[env]]) - int(self.spawned[env])
+                while self.spawn_accum[env] >= 1.0 and left > 0:
+                    self.spawn_accum[env] -= 1.0
+                    self._spawn_one(env, wave)
+                    self.spawned[env] += 1
+                    left -= 1
+
+        # Wave completion
+        slots = self._slots()
+        has_enemy = (slots & (self.kind >= K_GRUNT) & (self.kind <= K_ENEMY_LAST)).any(axis=1)
+        all_in = formation | (self.spawned >= self._w_count[wi])
+        advance = active & all_in & ~has_enemy & (self.wave_timer > 0.1)
+        self.wave_index[advance] += 1
+        self.wave_timer[advance] = 0.0
+        self.spawn_accum[advance] = 0.0
+        self.spawned_once[advance] = False
+        self.spawned[advance] = 0
+
+    def _spawn_formation(self, env: int, wave: Dict[str, Any]) -> None:
+        w = self.width
+        rows = int(wave.get("rows", 1))
+        cols = int(wave.get("cols", max(3, (w - 2) // 4)))
+        speed = to_fixed(float(wave.get("speed", 2.0)))
+        spacing_x = max(2, (w - 2) // (cols + 1))
+        if rows <= 0 or cols <= 0:
+            return
+        r, c = np.divmod(np.arange(rows * cols, dtype=np.int64), cols)
+        envs = np.full(rows * cols, env, dtype=np.int64)
+        self._append(envs, K_GRUNT, 1 + (c + 1) * spacing_x, 2 + r * 2,
+                     speed=speed, dir=1, wave=int(self.wave_index[env]))
+
+    def _spawn_one(self, env: int, wave: Dict[str, Any]) -> None:
+        rng = self.rngs[env]
+        x = rng.randint(1, max(1, self.width - 2))
+        wave_no = int(self.wave_index[env])
+        etype = wave.get("type", "dive")
+        pid = self.path_ids.get(wave.get("path", "")) if etype == "path" else None
+        if pid is not None:
+            self._append_one(env, K_PATH, x, 1, speed=to_fixed(float(wave.get("speed", 1.0))), path=pid, ox=x, oy=1,
+                             wave=wave_no)
+            return
+        if etype == "dive":
+            self._append_one(env, K_DIVE, x, 1, speed=to_fixed(float(wave.get("speed", 3.0))), wave=wave_no)
+            return
+        if etype == "mixed":
+            patterns = wave.get("patterns", [{"type": "grunt", "weight": 3}, {"type": "shooter", "weight": 1}])
+            choice = _weighted_choice(rng, patterns)
+            if choice == "dive":
+                self._append_one(env, K_DIVE, x, 1, speed=to_fixed(float(wave.get("speed", 3.0))), wave=wave_no)
+                return
+            if choice == "shooter":
+                fire_interval = float(wave.get("fire_interval", 2.0))
+                self._append_one(env, K_SHOOTER, x, 1, speed=to_fixed(float(wave.get("speed", 2.0))),
+                                 dir=rng.choice([-1, 1]), cooldown=fire_interval,
+                                 fire_interval=fire_interval, wave=wave_no)
+                return
+        self._append_one(env, K_GRUNT, x, 1, speed=to_fixed(float(wave.get("speed", 2.0))), dir=1, wave=wave_no)
+
+    def _collide(self) -> None:
+        slots = self._slots()
+        kind = self.kind
+        at_player = (self.x == self.px[:, None]) & (self.y == self.py[:, None])
+        enemy = slots & (kind >= K_GRUNT) & (kind <= K_ENEMY_LAST)
+
+        # Enemy contact and enemy projectiles vs player
+        contact = (enemy | (slots & (kind == K_PROJ_ENEMY))) & at_player
+        self._hit |= contact.any(axis=1)
+        self.alive[contact] = False
+
+        # Player hit, applied once per tick (invulnerability absorbs the rest)
+        hit = self._hit & ~(self.invuln > 0)
+        self.lives[hit] -= 1
+        self.invuln[hit] = _PLAYER_INVULN
+        self.power[hit & (self.power > 0)] -= 1
+
+        # Player projectiles vs enemies: each hits the first enemy in slot order
+        proj = slots & (kind == K_PROJ_PLAYER)
+        if proj.any() and enemy.any():
+            m = int(self.count.max())
+            key = self.y[:, :m] * self.width + self.x[:, :m]
+            match = (key[:, :, None] == key[:, None, :]) & proj[:, :m, None] & enemy[:, None, :m]
+            hits = match.any(axis=2)
+            if hits.any():
+                envs, pslots = np.nonzero(hits)
+                target = match[envs, pslots].argmax(axis=1)
+                self.alive[envs, pslots] = False
+                np.subtract.at(self.hp, (envs, target), 1)
+                dead = enemy & (self.hp <= 0)
+                self.alive[dead] = False
+
+        # Player vs power-ups
+        pu = slots & at_player
+        got_power = (pu & (kind == K_POWERUP_POWER)).sum(axis=1)
+        got_bomb = (pu & (kind == K_POWERUP_BOMB)).sum(axis=1)
+        self.power[:] = np.where(got_power > 0, np.minimum(5, self.power + got_power), self.power)
+        self.bombs[:] = np.where(got_bomb > 0, np.minimum(9, self.bombs + got_bomb), self.bombs)
+        self.alive[pu & (kind >= K_POWERUP_POWER)] = False
+
+    def _award_kills(self) -> None:
+        slots = self._slots()
+        dead = slots & (self.kind >= K_GRUNT) & (self.kind <= K_ENEMY_LAST) & ~self.alive
+        kills = dead.sum(axis=1)
+        self.score += KILL_POINTS * kills
+        p_power, p_bomb = self.p_power, self.p_bomb
+        drop_env: List[int] = []
+        drop_kind: List[int] = []
+        drop_x: List[int] = []
+        drop_y: List[int] = []
+        for env in np.flatnonzero(kills).tolist():
+            rng = self.rngs[env]
+            for slot in np.flatnonzero(dead[env]).tolist():
+                roll = rng.random()
+                if roll < p_power:
+                    k = K_POWERUP_POWER
+                elif roll < p_power + p_bomb:
+                    k = K_POWERUP_BOMB
+                else:
+                    continue
+                drop_env.append(env)
+                drop_kind.append(k)
+                drop_x.append(int(self.x[env, slot]))
+                drop_y.append(int(self.y[env, slot]))
+        if drop_env:
+            self._append(np.array(drop_env, dtype=np.int64), np.array(drop_kind, dtype=np.int8),
+                         np.array(drop_x), np.array(drop_y))
+
+    def _remove_dead(self) -> None:
+        keep = self._slots() & self.alive
+        order = np.argsort(~keep, axis=1, kind="stable")
+        for name in _COLUMNS:
+            col = getattr(self, name)
+            col[:] = np.take_along_axis(col, order, axis=1)
+        self.count[:] = keep.sum(axis=1)
+        tail = ~self._slots()
+        self.kind[tail] = K_NONE
+        self.alive[tail] = False
+
+    def _observe(self) -> None:
+        obs = self.obs
+        obs.fill(EMPTY)
+        env = self._env
+        obs[env, self.py, self.px] = PLAYER
+        slots = self._slots()
+        inside = slots & (self.x >= 0) & (self.x < self.width) & (self.y >= 0) & (self.y < self.height)
+        envs, cols = np.nonzero(inside)
+        obs[envs, self.y[envs, cols], self.x[envs, cols]] = _OBS_OF_KIND[self.kind[envs, cols]]
+
+    # --- cross-check ---
+    def _diff_env(self, i: int, sim: Simulation) -> str:
+        pl = sim.player
+        player = (
+            (pl.x, pl.y, pl._mx, pl._my, pl._cooldown, pl.power, pl.lives, pl.invuln, pl.bombs),
+            (int(self.px[i]), int(self.py[i]), int(self.pmx[i]), int(self.pmy[i]),
+             float(self.pcooldown[i]), int(self.power[i]), int(self.lives[i]),
+             float(self.invuln[i]), int(self.bombs[i])),
+        )
+        if player[0] != player[1]:
+            return f"player {player[0]} != {player[1]}"
+        if sim.score != int(self.score[i]):
+            return f"score {sim.score} != {int(self.score[i])}"
+        sp = sim.spawner
+        cursor = (
+            (sp.wave_index, sp.timer, sp.spawn_accum, sp._spawned_once, sp.spawned),
+            (int(self.wave_index[i]), float(self.wave_timer[i]), float(self.spawn_accum[i]),
+             bool(self.spawned_once[i]), int(self.spawned[i])),
+        )
+        if cursor[0] != cursor[1]:
+            return f"spawner {cursor[0]} != {cursor[1]}"
+        if sp.rng.getstate() != self.rngs[i].getstate():
+            return "spawner rng state"
+        if sim.world._next_id != int(self.next_id[i]):
+            return f"next_id {sim.world._next_id} != {int(self.next_id[i])}"
+        ents = [e for e in sim.world.entities if e is not pl]
+        if len(ents) != int(self.count[i]):
+            return f"entity count {len(ents)} != {int(self.count[i])}"
+        for slot, e in enumerate(ents):
+            want = _scalar_row(e)
+            got = self._row(i, slot)
+            if want != got:
+                return f"slot {slot} (id {e.id}) {want} != {got}"
+        if bytes(sim.obs) != self.obs[i].tobytes():
+            return "observation grid"
+        return ""
+
+    def _row(self, i: int, slot: int) -> Tuple:
+        k = int(self.kind[i, slot])
+        base = (k, int(self.eid[i, slot]), int(self.x[i, slot]), int(self.y[i, slot]),
+                int(self.hp[i, slot]), bool(self.alive[i, slot]))
+        if k == K_GRUNT:
+            return base + (int(self.ax[i, slot]), int(self.dir[i, slot]), int(self.wave[i, slot]))
+        if k == K_DIVE:
+            return base + (int(self.ay[i, slot]), int(self.idx[i, slot]), int(self.wave[i, slot]))
+        if k == K_PATH:
+            return base + (int(self.path[i, slot]), int(self.ox[i, slot]), int(self.oy[i, slot]),
+                           int(self.idx[i, slot]), int(self.pa[i, slot]), int(self.wave[i, slot]))
+        if k == K_SHOOTER:
+            return base + (int(self.ax[i, slot]), int(self.ay[i, slot]), int(self.dir[i, slot]),
+                           float(self.cooldown[i, slot]), int(self.wave[i, slot]))
+        return base + (int(self.ay[i, slot]),)
+
+
+def _scalar_kind(e) -> int:
+    name = type(e).__name__
+    if name == "GruntEnemy":
+        return K_GRUNT
+    if name == "DiveEnemy":
+        return K_DIVE
+    if name == "ShooterEnemy":
+        return K_SHOOTER
+    if name == "PathEnemy":
+        return K_PATH
+    return {
+        "proj_player": K_PROJ_PLAYER,
+        "proj_enemy": K_PROJ_ENEMY,
+        "powerup_power": K_POWERUP_POWER,
+        "powerup_bomb": K_POWERUP_BOMB,
+    }.get(e.kind, K_NONE)
+
+
+def _scalar_row(e) -> Tuple:
+    k = _scalar_kind(e)
+    base = (k, e.id, e.x, e.y, e.hp, e.alive)
+    if k == K_GRUNT:
+        return base + (e._ax, e.dir, e._wave)
+    if k == K_DIVE:
+        return base + (e._ay, e._step, e._wave)
+    if k == K_PATH:
+        return base + (e.path_id, e._ox, e._oy, e._step, e._pa, e._wave)
+    if k == K_SHOOTER:
+        return base + (e._ax, e._ay, e.dir, e._cooldown, e._wave)
+    return base + (e._ay,)
+
+
+def _weighted_choice(rng: random.Random, items: List[Dict[str, Any]]) -> str:
+    # Same draw as Spawner._weighted_choice
+    total = sum(int(i.get("weight", 1)) for i in items)
+    pick = rng.uniform(0, total)
+    upto = 0.0
+    for i in items:
+        w = int(i.get("weight", 1))
+        if upto + w >= pick:
+            return str(i.get("type", "grunt"))
+        upto += w
+    return str(items[-1].get("type", "grunt"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m turkey_invaders.batch",
+                                 description="Run N lockstep games with random actions.")
+    ap.add_argument("--envs", type=int, default=256)
+    ap.add_argument("--steps", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--cross-check", action="store_true", help="verify against scalar Simulation each tick")
+    ap.add_argument("--leaderboard", metavar="PATH", help="record final scores in this leaderboard database")
+    args = ap.parse_args(argv)
+
+    batch = BatchSimulation(args.envs, cross_check=args.cross_check)
+    seeds = [args.seed + i for i in range(args.envs)]
+    batch.reset(seeds)
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        batch.step(rng.integers(0, 64, size=args.envs))
+    elapsed = time.perf_counter() - start
+    env_steps = args.envs * args.steps
+    print(f"{env_steps} env-steps in {elapsed:.2f}s ({env_steps / elapsed:,.0f}/s)"
+          + (" cross-check ok" if args.cross_check else ""))
+    if args.leaderboard:
+        from .leaderboard import Leaderboard
+
+        rows = [(int(batch.score[i]), seeds[i], batch.pack, int(batch.wave_index[i])) for i in range(args.envs)]
+        with Leaderboard(args.leaderboard) as board:
+            board.add_many(rows)
+            print(f"recorded {len(rows)} scores; median {board.percentile(50, batch.pack)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
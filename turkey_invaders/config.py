@@ -3,12 +3,17 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "fps": 60,
     "scale": 1,
+    "backend": "curses",
+    "workers": 0,
+    # Logical playfield size; 0 means "the terminal size". Larger values
+    # give a scrolling stage with a camera that follows the player.
+    "world": {"width": 0, "height": 0},
     "controls": {
         "left": ["LEFT", "a"],
         "right": ["RIGHT", "d"],
@@ -21,6 +26,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "exit": ["ESC"],
         "start": ["ENTER", "SPACE"],
         "options": ["o"],
+        "endless": ["e"],
         "help": ["h"],
         "yes": ["y", "Y"],
         "no": ["n", "N"],
@@ -71,6 +77,28 @@ class Config:
             s = 1
         return max(1, min(4, s))
 
+    @property
+    def workers(self) -> int:
+        """Entity update threads (0/1: serial, -1: one per CPU)."""
+        try:
+            return int(self.data.get("workers", 0))
+        except Exception:
+            return 0
+
+    @property
+    def world_size(self) -> Tuple[int, int]:
+        """Configured (width, height) of the playfield; 0 = terminal size."""
+        world = self.data.get("world") or {}
+        try:
+            return max(0, int(world.get("width", 0))), max(0, int(world.get("height", 0)))
+        except Exception:
+            return 0, 0
+
+    @property
+    def backend(self) -> str:
+        """Interactive terminal backend: 'curses' (default) or 'ansi'."""
+        return str(self.data.get("backend", "curses")).lower()
+
     def save(self) -> None:
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
         with open(self.path, "w", encoding="utf-8") as f:
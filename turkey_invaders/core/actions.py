@@ -0,0 +1,59 @@
+"""Action bitmask shared by input, scenes, the headless simulation and replays.
+
+`Input.poll()` returns one int per frame with a bit set for every action
+whose key was pressed; scenes test it with `actions & FIRE`. The low six
+bits (`GAMEPLAY_MASK`) are the in-game controls and are exactly what
+`Simulation.step()` takes and what replays store per tick, so a recorded
+mask can be fed to either. The other bits are menu and meta actions.
+"""
+from __future__ import annotations
+
+from typing import Dict, List
+
+
+NONE = 0
+
+# Gameplay controls (Simulation.step / replay records)
+LEFT = 1 << 0
+RIGHT = 1 << 1
+UP = 1 << 2
+DOWN = 1 << 3
+FIRE = 1 << 4
+BOMB = 1 << 5
+
+# Menus and meta
+PAUSE = 1 << 6
+QUIT = 1 << 7
+EXIT = 1 << 8
+START = 1 << 9
+OPTIONS = 1 << 10
+ENDLESS = 1 << 11
+HELP = 1 << 12
+YES = 1 << 13
+NO = 1 << 14
+
+GAMEPLAY_MASK = LEFT | RIGHT | UP | DOWN | FIRE | BOMB
+
+# Names used in the `controls` config section
+ACTION_BITS: Dict[str, int] = {
+    "left": LEFT,
+    "right": RIGHT,
+    "up": UP,
+    "down": DOWN,
+    "fire": FIRE,
+    "bomb": BOMB,
+    "pause": PAUSE,
+    "quit": QUIT,
+    "exit": EXIT,
+    "start": START,
+    "options": OPTIONS,
+    "endless": ENDLESS,
+    "help": HELP,
+    "yes": YES,
+    "no": NO,
+}
+
+
+def action_names(mask: int) -> List[str]:
+    """Config names of the bits set in `mask` (for logs and debugging)."""
+    return [name for name, bit in ACTION_BITS.items() if mask & bit]
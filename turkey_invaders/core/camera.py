@@ -0,0 +1,30 @@
+"""Camera viewport over a world that may be larger than the screen."""
+from __future__ import annotations
+
+from typing import Tuple
+
+
+class Camera:
+    """Top-left world cell of the visible area and its size.
+
+    `follow()` keeps a target centred horizontally and three quarters of the
+    way down the view (the player sits near the bottom), clamped so the view
+    never leaves the world. When the world is no larger than the view the
+    camera stays at (0, 0) and world and screen coordinates coincide.
+    """
+
+    def __init__(self) -> None:
+        self.x = 0
+        self.y = 0
+        self.width = 0
+        self.height = 0
+
+    def follow(self, tx: int, ty: int, view_w: int, view_h: int, world_w: int, world_h: int) -> None:
+        self.width, self.height = view_w, view_h
+        self.x = max(0, min(world_w - view_w, tx - view_w // 2))
+        self.y = max(0, min(world_h - view_h, ty - (view_h * 3) // 4))
+
+    def rect(self, margin_x: int = 0, margin_y: int = 0) -> Tuple[int, int, int, int]:
+        """View rectangle (x0, y0, x1, y1), exclusive, grown by the margins."""
+        return (self.x - margin_x, self.y - margin_y,
+                self.x + self.width + margin_x, self.y + self.height + margin_y)
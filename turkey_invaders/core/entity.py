@@ -4,7 +4,8 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+# eq=False: entities compare (and hash) by identity, so list.remove() is a pointer scan
+@dataclass(eq=False)
 class BaseEntity:
     id: int
     kind: str
@@ -17,16 +18,19 @@ class BaseEntity:
     hp: int = 1
     alive: bool = True
 
+    # sprite() depends only on class and kind, so renderers may cache it
+    sprite_static = True
+
     def bbox(self) -> Tuple[int, int, int, int]:
         return self.x, self.y, self.w, self.h
 
     def update(self, dt: float, world) -> None:  # pragma: no cover - base no-op
         pass
 
-    def on_hit(self, damage: int, source: str) -> None:
+    def on_hit(self, damage: int, source: str) -> bool:
+        """Apply damage; True if it was lethal (the caller records the death)."""
         self.hp -= damage
-        if self.hp <= 0:
-            self.alive = False
+        return self.hp <= 0
 
     def sprite(self) -> Tuple[str, int | None, bool]:  # char, color_pair, bold
         return "?", None, False
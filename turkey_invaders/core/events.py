@@ -0,0 +1,225 @@
+"""Gameplay event bus.
+
+Systems report what happened (kills, player hits, drops, pickups, bombs,
+wave transitions) with `world.events.emit(...)`. Records have a fixed binary
+layout and are packed into a preallocated ring buffer; subscribers receive
+the new records as memoryviews when the tick ends (or when the ring fills).
+With no subscribers `emit` returns immediately and no buffer is allocated.
+
+`EventLog` is a subscriber that writes batches to JSONL or a binary log from
+a background thread, so long sessions can be analysed without touching
+frame time.
+"""
+from __future__ import annotations
+
+import json
+import queue
+import struct
+import threading
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+
+# Event types
+KILL = 1  # eid/x/y of the enemy, arg = points
+PLAYER_HIT = 2  # arg = lives left
+DROP = 3  # eid/x/y of the new power-up, arg = ITEM_*
+PICKUP = 4  # eid/x/y of the power-up, arg = ITEM_*
+BOMB = 5  # arg = bullets cleared
+WAVE = 6  # arg = index of the wave that starts next
+
+EVENT_NAMES = {
+    KILL: "kill",
+    PLAYER_HIT: "player_hit",
+    DROP: "drop",
+    PICKUP: "pickup",
+    BOMB: "bomb",
+    WAVE: "wave",
+}
+
+ITEM_POWER = 1
+ITEM_BOMB = 2
+
+# tick u32, type u16, pad, x i32, y i32, eid u32, arg i32
+RECORD = struct.Struct("<IH2xiiIi")
+
+LOG_MAGIC = b"TIEV"
+LOG_VERSION = 1
+_LOG_HEADER = struct.Struct("<4sHH")  # magic, version, record size
+
+
+class Event(NamedTuple):
+    tick: int
+    type: int
+    x: int
+    y: int
+    eid: int
+    arg: int
+
+
+def iter_events(data) -> Iterator[Event]:
+    """Decode packed records (a subscriber view or a binary log body)."""
+    for rec in RECORD.iter_unpack(data):
+        yield Event(*rec)
+
+
+Subscriber = Callable[[memoryview], None]
+
+
+class EventBus:
+    """Ring buffer of fixed-size event records with batch delivery."""
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self.capacity = max(1, int(capacity))
+        self.tick = 0
+        self._subs: List[Subscriber] = []
+        self._buf: Optional[bytearray] = None
+        self._view: Optional[memoryview] = None
+        self._n = 0  # records emitted so far
+        self._flushed = 0  # records delivered so far
+
+    @property
+    def active(self) -> bool:
+        return bool(self._subs)
+
+    def subscribe(self, fn: Subscriber) -> None:
+        """Call `fn(view)` with each batch of new records; copy what you keep."""
+        if self._buf is None:
+            self._buf = bytearray(self.capacity * RECORD.size)
+            self._view = memoryview(self._buf)
+        self._subs.append(fn)
+
+    def unsubscribe(self, fn: Subscriber) -> None:
+        self.flush()
+        if fn in self._subs:
+            self._subs.remove(fn)
+
+    def emit(self, etype: int, eid: int = 0, x: int = 0, y: int = 0, arg: int = 0) -> None:
+        if not self._subs:
+            return
+        RECORD.pack_into(self._buf, (self._n % self.capacity) * RECORD.size, self.tick, etype, x, y, eid, arg)
+        self._n += 1
+        if self._n - self._flushed >= self.capacity:
+            self.flush()
+
+    def end_tick(self) -> None:
+        """Deliver this tick's records and advance the tick counter."""
+        if self._n != self._flushed:
+            self.flush()
+        self.tick += 1
+
+    def flush(self) -> None:
+        start, end = self._flushed, self._n
+        if start == end:
+            return
+        self._flushed = end
+        cap, size = self.capacity, RECORD.size
+        a = start % cap
+        pending = end - start
+        if a + pending <= cap:
+            spans = [(a, a + pending)]
+        else:
+            spans = [(a, cap), (0, a + pending - cap)]
+        for lo, hi in spans:
+            view = self._view[lo * size:hi * size]
+            for fn in self._subs:
+                fn(view)
+            view.release()
+
+    def recent(self, n: int = 64) -> List[Event]:
+        """The last `n` records still in the ring (oldest first)."""
+        if self._buf is None:
+            return []
+        n = min(n, self._n, self.capacity)
+        cap, size = self.capacity, RECORD.size
+        out = []
+        for i in range(self._n - n, self._n):
+            out.append(Event(*RECORD.unpack_from(self._buf, (i % cap) * size)))
+        return out
+
+
+# Longest close() waits for queue space while the writer is still alive
+_CLOSE_TIMEOUT = 1.0
+
+class EventLog:
+    """Background event writer; subscribe it to a bus (each World has its own).
+
+    `fmt` is "jsonl" or "bin" (default: by file extension). The game thread
+    only copies each batch into a bounded queue; if the writer falls behind,
+    batches are dropped and counted in `dropped` (events, not batches).
+    """
+
+    def __init__(self, path: str, *, fmt: Optional[str] = None, queue_size: int = 256) -> None:
+        self.path = path
+        self.fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".json")) else "bin")
+        if self.fmt not in ("jsonl", "bin"):
+            raise ValueError(f"unknown event log format: {self.fmt}")
+        self.events = 0
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._closed = False
+        # Opened here so a bad path fails at startup, not in the writer
+        if self.fmt == "bin":
+            self._file = open(path, "wb")
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+        self._thread.start()
+
+    def __call__(self, view: memoryview) -> None:
+        n = len(view) // RECORD.size
+        try:
+            self._queue.put_nowait(view.tobytes())
+        except queue.Full:
+            self.dropped += n
+            return
+        self.events += n
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if not self._thread.is_alive():
+            # Writer died (e.g. on a write error); nothing will drain the queue
+            self._file.close()
+            return
+        try:
+            self._queue.put(None, timeout=_CLOSE_TIMEOUT)
+        except queue.Full:
+            return
+        self._thread.join()
+
+    def _run(self) -> None:
+        if self.fmt == "bin":
+            with self._file as f:
+                f.write(_LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, RECORD.size))
+                while True:
+                    batch = self._queue.get()
+                    if batch is None:
+                        break
+                    f.write(batch)
+                    if self._queue.empty():
+                        f.flush()
+        else:
+            with self._file as f:
+                while True:
+                    batch = self._queue.get()
+                    if batch is None:
+                        break
+                    lines = []
+                    for ev in iter_events(batch):
+                        rec = ev._asdict()
+                        rec["type"] = EVENT_NAMES.get(ev.type, ev.type)
+                        lines.append(json.dumps(rec, separators=(",", ":")))
+                    f.write("\n".join(lines) + "\n")
+                    if self._queue.empty():
+                        f.flush()
+
+
+def read_log(path: str) -> Iterator[Event]:
+    """Iterate the events of a binary log written by `EventLog`."""
+    with open(path, "rb") as f:
+        magic, version, size = _LOG_HEADER.unpack(f.read(_LOG_HEADER.size))
+        if magic != LOG_MAGIC or version != LOG_VERSION or size != RECORD.size:
+            raise ValueError(f"{path}: not a v{LOG_VERSION} event log")
+        data = f.read()
+    yield from iter_events(data[: len(data) - len(data) % RECORD.size])
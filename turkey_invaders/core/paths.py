@@ -0,0 +1,180 @@
+"""Precomputed motion paths.
+
+Wave packs declare named paths; each is baked once at load into a fixed-step
+table of integer (dx, dy) offsets from the spawn point, sampled at `PATH_HZ`.
+A path enemy only advances an index into its table, so every pattern costs
+the same per tick and new patterns need no new entity classes.
+
+Entry `i` is the offset after `i / PATH_HZ` seconds (entry 0 is the spawn
+point itself). When an enemy runs off the end of its table it moves its
+origin by the path's end offset and starts over, so paths repeat seamlessly
+(e.g. a sine sweep that keeps descending).
+
+Path specs (all times in seconds, distances in cells, +y is down):
+
+    spline       points [[x, y], ...] (relative to the first), duration
+    sine         amplitude, period, speed (rows per second)
+    loop         radius, period, speed (rows per second)
+    dive_return  depth, down, hold, up, advance (rows kept per cycle), drift
+                 (columns per second)
+"""
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+PATH_HZ = 60
+
+# Upper bound on one table, to keep a typo in a pack from eating memory
+MAX_STEPS = 60 * PATH_HZ
+
+
+class PathTable:
+    """Baked offsets of one path. Treat as read-only; shared across enemies."""
+
+    __slots__ = ("id", "name", "dx", "dy", "length", "end_dx", "end_dy")
+
+    def __init__(self, id_: int, name: str, points: Sequence[Tuple[float, float]], end: Tuple[float, float]) -> None:
+        self.id = id_
+        self.name = name
+        self.dx = array("i", (int(round(x)) for x, _ in points))
+        self.dy = array("i", (int(round(y)) for _, y in points))
+        self.length = len(self.dx)
+        self.end_dx = int(round(end[0]))
+        self.end_dy = int(round(end[1]))
+
+    def __repr__(self) -> str:
+        return f"PathTable({self.name!r}, steps={self.length}, end=({self.end_dx}, {self.end_dy}))"
+
+
+def _smooth(u: float) -> float:
+    u = max(0.0, min(1.0, u))
+    return u * u * (3.0 - 2.0 * u)
+
+
+def _spline(spec: Dict[str, Any]) -> Tuple[float, Callable[[float], Tuple[float, float]]]:
+    pts = [(float(p[0]), float(p[1])) for p in spec.get("points", [])]
+    if len(pts) < 2:
+        raise ValueError("spline needs at least two points")
+    x0, y0 = pts[0]
+    pts = [(x - x0, y - y0) for x, y in pts]
+    duration = float(spec.get("duration", 2.0))
+    segs = len(pts) - 1
+    # Catmull-Rom through every point; ends are padded by repeating them
+    ctrl = [pts[0]] + pts + [pts[-1]]
+
+    def at(t: float) -> Tuple[float, float]:
+        u = min(max(t / duration, 0.0), 1.0) * segs
+        i = min(int(u), segs - 1)
+        s = u - i
+        p0, p1, p2, p3 = ctrl[i], ctrl[i + 1], ctrl[i + 2], ctrl[i + 3]
+        s2, s3 = s * s, s * s * s
+        return tuple(  # type: ignore[return-value]
+            0.5 * (2 * b + (c - a) * s + (2 * a - 5 * b + 4 * c - d) * s2 + (3 * b - a - 3 * c + d) * s3)
+            for a, b, c, d in zip(p0, p1, p2, p3)
+        )
+
+    return duration, at
+
+
+def _sine(spec: Dict[str, Any]) -> Tuple[float, Callable[[float], Tuple[float, float]]]:
+    amp = float(spec.get("amplitude", 4.0))
+    period = float(spec.get("period", 2.0))
+    speed = float(spec.get("speed", 1.0))
+    return period, lambda t: (amp * math.sin(2.0 * math.pi * t / period), speed * t)
+
+
+def _loop(spec: Dict[str, Any]) -> Tuple[float, Callable[[float], Tuple[float, float]]]:
+    r = float(spec.get("radius", 3.0))
+    period = float(spec.get("period", 2.0))
+    speed = float(spec.get("speed", 1.0))
+
+    def at(t: float) -> Tuple[float, float]:
+        a = 2.0 * math.pi * t / period
+        return r * math.sin(a), r * (1.0 - math.cos(a)) + speed * t
+
+    return period, at
+
+
+def _dive_return(spec: Dict[str, Any]) -> Tuple[float, Callable[[float], Tuple[float, float]]]:
+    depth = float(spec.get("depth", 8.0))
+    down = float(spec.get("down", 1.0))
+    hold = float(spec.get("hold", 0.5))
+    up = float(spec.get("up", 1.0))
+    advance = float(spec.get("advance", 1.0))
+    drift = float(spec.get("drift", 0.0))
+
+    def at(t: float) -> Tuple[float, float]:
+        if t < down:
+            y = depth * _smooth(t / down)
+        elif t < down + hold:
+            y = depth
+        else:
+            y = depth + (advance - depth) * _smooth((t - down - hold) / up)
+        return drift * t, y
+
+    return down + hold + up, at
+
+
+_BAKERS: Dict[str, Callable[[Dict[str, Any]], Tuple[float, Callable[[float], Tuple[float, float]]]]] = {
+    "spline": _spline,
+    "sine": _sine,
+    "loop": _loop,
+    "dive_return": _dive_return,
+}
+
+
+def bake_path(name: str, spec: Dict[str, Any], id_: int = 0) -> PathTable:
+    """Sample one path spec into a table; raises ValueError on a bad spec."""
+    baker = _BAKERS.get(str(spec.get("type")))
+    if baker is None:
+        raise ValueError(f"unknown path type {spec.get('type')!r}")
+    duration, at = baker(spec)
+    steps = int(round(duration * PATH_HZ))
+    if not 0 < steps <= MAX_STEPS:
+        raise ValueError(f"path duration {duration} out of range")
+    points = [at(i / PATH_HZ) for i in range(steps)]
+    return PathTable(id_, name, points, at(duration))
+
+
+def bake_paths(specs: Dict[str, Dict[str, Any]]) -> Dict[str, PathTable]:
+    """Bake every valid path; ids follow sorted names so they are stable."""
+    tables: Dict[str, PathTable] = {}
+    for name in sorted(specs):
+        try:
+            tables[name] = bake_path(name, specs[name], len(tables))
+        except (ValueError, TypeError, IndexError, ZeroDivisionError):
+            continue  # a broken path only disables waves that use it
+    return tables
+
+
+# --- DiveEnemy wobble ---
+# Sideways wobble round(1.2 * sin(4t)) after each update at timestep dt, with
+# t accumulated by repeated addition exactly as the enemy used to do it.
+_wobble: Dict[float, Tuple[array, float]] = {}
+_wobble_lock = threading.Lock()
+
+
+def wobble_table(dt: float, n: int) -> array:
+    """Wobble offsets for the first `n` or more dive updates at `dt`.
+
+    Tables grow by copy-on-extend, so a returned array is never mutated and
+    is safe to read from any thread.
+    """
+    entry = _wobble.get(dt)
+    if entry is not None and n <= len(entry[0]):
+        return entry[0]
+    with _wobble_lock:
+        values, t = _wobble.get(dt, (array("b"), 0.0))
+        if n <= len(values):
+            return values
+        more: List[int] = []
+        for _ in range(max(n, 2 * len(values), 1024) - len(values)):
+            t += dt
+            more.append(int(round(1.2 * math.sin(t * 4.0))))
+        values = values + array("b", more)
+        _wobble[dt] = (values, t)
+        return values
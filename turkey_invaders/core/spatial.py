@@ -0,0 +1,111 @@
+"""Uniform-grid spatial index for worlds larger than the screen.
+
+Entities are bucketed by the grid cell holding their origin. The index is
+not told about moves automatically: whoever moves entities calls `move(e)`
+afterwards (the activity zones do this for everything they update), while
+`World.add` and `World.remove_dead` keep membership current. Queries return
+entities in id order, which is the order they sit in `World.entities`, so
+systems that switch from a full scan to a query see the same sequence.
+All current entities are one cell in size; queries match on origin only.
+"""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .entity import BaseEntity
+
+
+Cell = Tuple[int, int]
+
+_by_id = attrgetter("id")
+
+
+class SpatialGrid:
+    def __init__(self, cell_w: int = 16, cell_h: int = 8) -> None:
+        self.cell_w = max(1, int(cell_w))
+        self.cell_h = max(1, int(cell_h))
+        self._cells: Dict[Cell, List[BaseEntity]] = {}
+        self._where: Dict[int, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def cell_of(self, x: int, y: int) -> Cell:
+        return x // self.cell_w, y // self.cell_h
+
+    def insert(self, e: BaseEntity) -> None:
+        key = (e.x // self.cell_w, e.y // self.cell_h)
+        self._where[e.id] = key
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [e]
+        else:
+            bucket.append(e)
+
+    def remove(self, e: BaseEntity) -> None:
+        key = self._where.pop(e.id, None)
+        if key is None:
+            return
+        bucket = self._cells[key]
+        bucket.remove(e)
+        if not bucket:
+            del self._cells[key]
+
+    def move(self, e: BaseEntity) -> None:
+        """Re-bucket `e` after its position changed (no-op within a cell)."""
+        key = (e.x // self.cell_w, e.y // self.cell_h)
+        old = self._where.get(e.id)
+        if old == key:
+            return
+        if old is not None:
+            bucket = self._cells[old]
+            bucket.remove(e)
+            if not bucket:
+                del self._cells[old]
+        self._where[e.id] = key
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [e]
+        else:
+            bucket.append(e)
+
+    def rebuild(self, entities: Iterable[BaseEntity]) -> None:
+        self._cells.clear()
+        self._where.clear()
+        for e in entities:
+            self.insert(e)
+
+    def cells(self) -> Iterable[Tuple[Cell, List[BaseEntity]]]:
+        """Every non-empty cell and its bucket (do not modify while iterating)."""
+        return self._cells.items()
+
+    def cells_in(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[Tuple[Cell, List[BaseEntity]]]:
+        """Non-empty cells overlapping the rectangle [x0, x1) x [y0, y1)."""
+        if x1 <= x0 or y1 <= y0:
+            return
+        cells = self._cells
+        cx0, cy0 = x0 // self.cell_w, y0 // self.cell_h
+        cx1, cy1 = (x1 - 1) // self.cell_w, (y1 - 1) // self.cell_h
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            # Rectangle spans more cells than are occupied: walk the occupied ones
+            for key, bucket in cells.items():
+                if cx0 <= key[0] <= cx1 and cy0 <= key[1] <= cy1:
+                    yield key, bucket
+            return
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield (cx, cy), bucket
+
+    def query(self, x0: int, y0: int, x1: int, y1: int) -> List[BaseEntity]:
+        """Entities with origin in [x0, x1) x [y0, y1), in id order."""
+        out: List[BaseEntity] = []
+        for _, bucket in self.cells_in(x0, y0, x1, y1):
+            for e in bucket:
+                if x0 <= e.x < x1 and y0 <= e.y < y1:
+                    out.append(e)
+        if len(out) > 1:
+            out.sort(key=_by_id)
+        return out
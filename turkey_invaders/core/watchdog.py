@@ -0,0 +1,100 @@
+"""Slow-tick watchdog: sample Python stacks only while a tick overruns.
+
+The main loop brackets each tick (input, updates, render) with
+`begin_tick()` / `end_tick()`. `begin_tick` arms a one-shot
+`ITIMER_REAL` for the tick budget and `end_tick` disarms it, so a tick that
+finishes in time costs two `setitimer` calls and nothing else. When a tick
+runs past its budget the timer fires and keeps firing every `interval`
+seconds until the tick ends; each SIGALRM records the main thread's stack
+at the point it was interrupted (scene update, collisions, entity
+`update()` methods, `renderer.end_frame()`, ...).
+
+Stacks are aggregated and written in the collapsed format that
+flamegraph.pl, inferno and speedscope read: one line per distinct stack,
+frames root first as `module.qualname` joined by ';', then the sample
+count. Only the main thread is sampled (signal handlers run there); with
+worker threads the samples show it waiting on the pool.
+
+Unix only: where `setitimer` is missing, or when constructed off the main
+thread, the watchdog stays disabled and both calls are no-ops.
+"""
+from __future__ import annotations
+
+import signal
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+
+class SlowTickWatchdog:
+    def __init__(self, path: Optional[str] = None, *, budget: Optional[float] = None,
+                 interval: float = 0.001) -> None:
+        self.path = path
+        self.budget = budget  # seconds; None until the loop sets its tick length
+        self.interval = max(1e-4, float(interval))
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.slow_ticks = 0
+        self.worst = 0.0  # longest slow tick seen, seconds
+        self._tick_samples = 0
+        self._t0 = 0.0
+        self._labels: Dict[object, str] = {}
+        self._previous = None
+        self.enabled = False
+        if not hasattr(signal, "setitimer"):
+            return
+        try:
+            self._previous = signal.signal(signal.SIGALRM, self._on_alarm)
+        except ValueError:
+            return  # not the main thread
+        self.enabled = True
+
+    def begin_tick(self) -> None:
+        if not self.enabled or not self.budget:
+            return
+        self._tick_samples = 0
+        self._t0 = time.perf_counter()
+        signal.setitimer(signal.ITIMER_REAL, self.budget, self.interval)
+
+    def end_tick(self) -> None:
+        if not self.enabled or not self.budget:
+            return
+        signal.setitimer(signal.ITIMER_REAL, 0.0)
+        if self._tick_samples:
+            self.slow_ticks += 1
+            self.worst = max(self.worst, time.perf_counter() - self._t0)
+
+    def _on_alarm(self, signum, frame) -> None:  # noqa: ARG002
+        labels = self._labels
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                name = getattr(code, "co_qualname", code.co_name)
+                label = labels[code] = f"{frame.f_globals.get('__name__', '?')}.{name}".replace(";", ":")
+            stack.append(label)
+            frame = frame.f_back
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.samples += 1
+        self._tick_samples += 1
+
+    def collapsed(self) -> str:
+        """Samples so far in collapsed-stack format (one `a;b;c count` line per stack)."""
+        lines = [f"{';'.join(stack)} {n}" for stack, n in sorted(self.stacks.items())]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def write(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.collapsed())
+
+    def close(self) -> None:
+        """Disarm, restore the previous SIGALRM handler and write the samples."""
+        if self.enabled:
+            signal.setitimer(signal.ITIMER_REAL, 0.0)
+            signal.signal(signal.SIGALRM, self._previous or signal.SIG_DFL)
+            self.enabled = False
+        self.write()
@@ -1,33 +1,99 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
 from .entity import BaseEntity
+from .events import EventBus
+from .spatial import SpatialGrid
+
+
+# Death causes recorded with World.kill()
+CAUSE_SHOT = "shot"  # destroyed by player fire
+CAUSE_CONTACT = "contact"  # collided with the player
+CAUSE_SPENT = "spent"  # projectile used up by a hit
+CAUSE_BREACH = "breach"  # enemy reached the player zone
+CAUSE_ESCAPED = "escaped"  # left the playfield
+CAUSE_BOMB = "bomb"  # cleared by a bomb
+CAUSE_PICKUP = "pickup"  # power-up collected
+
+# Deaths per tick up to which remove_dead() scans instead of filtering
+_SCAN_DEATHS = 6
 
 
 class World:
     def __init__(self) -> None:
         self.entities: List[BaseEntity] = []
         self.by_kind: Dict[str, List[BaseEntity]] = {}
+        # This tick's deaths in the order they happened; consumed by
+        # scoring and cleared by remove_dead()
+        self.deaths: List[Tuple[BaseEntity, str]] = []
         self._next_id = 1
         # Initialize common ad-hoc attributes used by systems/scenes
         self.player = None  # set by scene when player is created
         self.width = 0
         self.height = 0
+        self.events: EventBus = EventBus()
+        # Optional spatial index for worlds larger than the screen; kept in
+        # sync by add/remove_dead (movers re-bucket with index.move)
+        self.index: Optional[SpatialGrid] = None
+        # Entities added, moved, hit or killed since a state digest last
+        # looked (None: nobody is tracking; see touch())
+        self.changed: Optional[Set[BaseEntity]] = None
 
     def next_id(self) -> int:
         nid = self._next_id
         self._next_id += 1
         return nid
 
+    def touch(self, e: BaseEntity) -> None:
+        """Note that `e`'s position, hp or liveness changed (for digests)."""
+        changed = self.changed
+        if changed is not None:
+            changed.add(e)
+
     def add(self, e: BaseEntity) -> None:
+        self.touch(e)
         self.entities.append(e)
         self.by_kind.setdefault(e.kind, []).append(e)
+        if self.index is not None:
+            self.index.insert(e)
+
+    def kill(self, e: BaseEntity, cause: str) -> None:
+        """Mark `e` dead and queue it (once) for scoring, drops and removal."""
+        if not e.alive:
+            return
+        e.alive = False
+        self.deaths.append((e, cause))
+        self.touch(e)
 
     def remove_dead(self) -> None:
-        self.entities = [e for e in self.entities if e.alive]
-        self.by_kind = {}
-        for e in self.entities:
-            self.by_kind.setdefault(e.kind, []).append(e)
+        """Remove this tick's queued deaths, keeping the survivors' order.
+
+        A handful of deaths is removed with `list.remove` (a pointer scan per
+        death); past `_SCAN_DEATHS` of them, each list is filtered once
+        instead, so a bomb clearing k entities costs O(N), not O(k*N).
+        """
+        deaths = self.deaths
+        if not deaths:
+            return
+        entities, by_kind, index = self.entities, self.by_kind, self.index
+        if len(deaths) <= _SCAN_DEATHS:
+            for e, _ in deaths:
+                entities.remove(e)
+                by_kind[e.kind].remove(e)
+        else:
+            entities[:] = [e for e in entities if e.alive]
+            for kind in {e.kind for e, _ in deaths}:
+                members = by_kind[kind]
+                members[:] = [e for e in members if e.alive]
+        if index is not None:
+            for e, _ in deaths:
+                index.remove(e)
+        deaths.clear()
+
+    def attach_index(self, index: SpatialGrid) -> None:
+        """Start maintaining `index` (rebuilt from the current entities)."""
+        index.rebuild(self.entities)
+        self.index = index
 
     def width_height(self) -> tuple[int, int]:
         # Provided by scene/renderer; stored ad-hoc as attributes for simplicity
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import math
 import random
 from typing import Tuple
 
 from ..core.entity import BaseEntity
+from ..core.fixed import FRAC_BITS, FRAC_MASK, HALF, scale, to_fixed
+from ..core.paths import PATH_HZ, PathTable, wobble_table
+from ..core.world import CAUSE_BREACH
 from .projectile import Projectile
 
 
+SHOOTER_DESCENT = to_fixed(0.5)  # cells per second
+
 class Enemy(BaseEntity):
     def __init__(self, id_: int, x: int, y: int, hp: int = 1) -> None:
         super().__init__(id=id_, kind="enemy", x=x, y=y, w=1, h=1, hp=hp)
@@ -19,16 +23,16 @@ class Enemy(BaseEntity):
 class GruntEnemy(Enemy):
     def __init__(self, id_: int, x: int, y: int, speed: float = 2.0) -> None:
         super().__init__(id_, x, y, hp=1)
-        self.speed = speed
+        self.speed = to_fixed(speed)  # 1/65536 cells per second
         self.dir = 1
-        self._ax = 0.0
+        self._ax = HALF
 
     def update(self, dt: float, world) -> None:
         # Horizontal sweep bounce within borders, step down occasionally
-        self._ax += self.speed * dt
-        while self._ax >= 1.0:
-            self._ax -= 1.0
-            self.x += self.dir
+        x0, y0 = self.x, self.y
+        ax = self._ax + scale(self.speed, dt)
+        self.x += self.dir * (ax >> FRAC_BITS)
+        self._ax = ax & FRAC_MASK
         if self.x <= 1:
             self.x = 1
             self.dir = 1
@@ -37,52 +41,58 @@ class GruntEnemy(Enemy):
             self.x = world.width - 2
             self.dir = -1
             self.y += 1
+        if self.x != x0 or self.y != y0:
+            world.touch(self)
         if self.y >= world.height - 2:
             # Reached player zone
-            world.player.on_player_hit()
-            self.alive = False
+            world.player.on_player_hit(world)
+            world.kill(self, CAUSE_BREACH)
 
 
 class DiveEnemy(Enemy):
     def __init__(self, id_: int, x: int, y: int, speed: float = 3.0) -> None:
         super().__init__(id_, x, y, hp=1)
-        self.speed = speed
-        self.t = 0.0
-        self._ay = 0.0
+        self.speed = to_fixed(speed)  # 1/65536 cells per second
+        self._step = 0
+        self._ay = HALF
 
     def update(self, dt: float, world) -> None:
-        self.t += dt
-        # Curve roughly toward player X using a sine wobble
+        # Curve roughly toward player X using a precomputed sine wobble
+        x0, y0 = self.x, self.y
         target_x = world.player.x
         dx = 1 if target_x > self.x else -1 if target_x < self.x else 0
         self.x += dx
-        self._ay += self.speed * dt
-        while self._ay >= 1.0:
-            self._ay -= 1.0
-            self.y += 1
-        self.x += int(round(1.2 * math.sin(self.t * 4.0)))
+        ay = self._ay + scale(self.speed, dt)
+        self.y += ay >> FRAC_BITS
+        self._ay = ay & FRAC_MASK
+        self.x += wobble_table(dt, self._step + 1)[self._step]
+        self._step += 1
         self.x = max(1, min(world.width - 2, self.x))
+        if self.x != x0 or self.y != y0:
+            world.touch(self)
         if self.y >= world.height - 2:
-            world.player.on_player_hit()
-            self.alive = False
+            world.player.on_player_hit(world)
+            world.kill(self, CAUSE_BREACH)
 
 
 class ShooterEnemy(Enemy):
-    def __init__(self, id_: int, x: int, y: int, speed: float = 2.0, fire_interval: float = 2.0) -> None:
+    def __init__(self, id_: int, x: int, y: int, speed: float = 2.0, fire_interval: float = 2.0,
+                 rng: random.Random | None = None) -> None:
         super().__init__(id_, x, y, hp=1)
-        self.speed = speed
-        self.dir = random.choice([-1, 1])
+        self.speed = to_fixed(speed)  # 1/65536 cells per second
+        # Draw the patrol direction from the spawner's seeded RNG when given
+        self.dir = (rng or random).choice([-1, 1])
         self.fire_interval = fire_interval
         self._cooldown = fire_interval
-        self._ax = 0.0
-        self._ay = 0.0
+        self._ax = HALF
+        self._ay = HALF
 
     def update(self, dt: float, world) -> None:
         # Horizontal patrol
-        self._ax += self.speed * dt
-        while self._ax >= 1.0:
-            self._ax -= 1.0
-            self.x += self.dir
+        x0, y0 = self.x, self.y
+        ax = self._ax + scale(self.speed, dt)
+        self.x += self.dir * (ax >> FRAC_BITS)
+        self._ax = ax & FRAC_MASK
         if self.x <= 1:
             self.x = 1
             self.dir *= -1
@@ -99,10 +109,50 @@ class ShooterEnemy(Enemy):
             world.add(Projectile(pid, self.x, self.y + 1, owner="enemy", vy=+1))
 
         # Advance slowly downward
-        self._ay += 0.5 * dt
-        while self._ay >= 1.0:
-            self._ay -= 1.0
-            self.y += 1
+        ay = self._ay + scale(SHOOTER_DESCENT, dt)
+        self.y += ay >> FRAC_BITS
+        self._ay = ay & FRAC_MASK
+        if self.x != x0 or self.y != y0:
+            world.touch(self)
+        if self.y >= world.height - 2:
+            world.player.on_player_hit(world)
+            world.kill(self, CAUSE_BREACH)
+
+
+class PathEnemy(Enemy):
+    """Follows a baked path (see core.paths) from its spawn point.
+
+    `speed` is the playback rate: 1.0 plays the path in real time. It is
+    stored in 1/65536 units like other speeds, and `_pa` is the fraction of the
+    way to the next path sample.
+    """
+
+    def __init__(self, id_: int, x: int, y: int, path: PathTable, speed: float = 1.0) -> None:
+        super().__init__(id_, x, y, hp=1)
+        self.path = path
+        self.path_id = path.id
+        self.speed = to_fixed(speed)
+        self._ox = x
+        self._oy = y
+        self._step = 0
+        self._pa = HALF
+
+    def update(self, dt: float, world) -> None:
+        path = self.path
+        pa = self._pa + scale(self.speed * PATH_HZ, dt)
+        self._pa = pa & FRAC_MASK
+        step = self._step + (pa >> FRAC_BITS)
+        if step >= path.length:
+            # Chain the next repetition(s) onto the end of this one
+            laps, step = divmod(step, path.length)
+            self._ox += laps * path.end_dx
+            self._oy += laps * path.end_dy
+        self._step = step
+        x = max(1, min(world.width - 2, self._ox + path.dx[step]))
+        y = self._oy + path.dy[step]
+        if x != self.x or y != self.y:
+            self.x, self.y = x, y
+            world.touch(self)
         if self.y >= world.height - 2:
-            world.player.on_player_hit()
-            self.alive = False
+            world.player.on_player_hit(world)
+            world.kill(self, CAUSE_BREACH)
@@ -2,22 +2,28 @@ from __future__ import annotations
 
 from typing import Tuple
 
+from ..core import events
 from ..core.entity import BaseEntity
+from ..core.fixed import FRAC_BITS, FRAC_MASK, HALF, scale, to_fixed
+from ..core.world import CAUSE_BOMB
+from .projectile import Projectile
 
 
 class Player(BaseEntity):
+    sprite_static = False  # blinks while invulnerable
+
     def __init__(self, id_: int, x: int, y: int) -> None:
         super().__init__(id=id_, kind="player", x=x, y=y, w=1, h=1, hp=1)
-        self.speed = 20.0  # cells per second
+        self.speed = to_fixed(20.0)  # 1/65536 cells per second
         self.fire_cd = 0.16
         self._cooldown = 0.0
         self.power = 0
         self.lives = 3
         self.invuln = 0.0
         self.bombs = 1
-        # sub-cell movement accumulators for dt-based movement
-        self._mx = 0.0
-        self._my = 0.0
+        # sub-cell position (1/65536 cell) for dt-based movement
+        self._mx = HALF
+        self._my = HALF
 
     def update(self, dt: float, world) -> None:
         if self._cooldown > 0:
@@ -26,26 +32,21 @@ class Player(BaseEntity):
             self.invuln -= dt
 
         # Clamp to playfield width
+        x0, y0 = self.x, self.y
         w, h = world.width, world.height
         self.x = max(1, min(max(1, w - 2), self.x))
         self.y = max(1, min(max(1, h - 2), self.y))
 
-        # Apply sub-cell movement accumulators into whole-cell steps
-        while self._mx <= -1.0:
-            self._mx += 1.0
-            self.x -= 1
-        while self._mx >= 1.0:
-            self._mx -= 1.0
-            self.x += 1
-        while self._my <= -1.0:
-            self._my += 1.0
-            self.y -= 1
-        while self._my >= 1.0:
-            self._my -= 1.0
-            self.y += 1
+        # Carry whole cells out of the sub-cell fractions
+        self.x += self._mx >> FRAC_BITS
+        self._mx &= FRAC_MASK
+        self.y += self._my >> FRAC_BITS
+        self._my &= FRAC_MASK
         # Re-clamp in case of boundary crossing
         self.x = max(1, min(max(1, w - 2), self.x))
         self.y = max(1, min(max(1, h - 2), self.y))
+        if self.x != x0 or self.y != y0:
+            world.touch(self)
 
     def move_intent(self, ix: int, iy: int, dt: float) -> None:
         """Accumulate movement intent scaled by speed and dt.
@@ -53,9 +54,9 @@ class Player(BaseEntity):
         ix/iy: -1,0,1 directional intents for this frame.
         """
         if ix:
-            self._mx += float(ix) * self.speed * dt
+            self._mx += ix * scale(self.speed, dt)
         if iy:
-            self._my += float(iy) * self.speed * dt
+            self._my += iy * scale(self.speed, dt)
 
     def can_fire(self) -> bool:
         return self._cooldown <= 0.0
@@ -63,13 +64,45 @@ class Player(BaseEntity):
     def did_fire(self) -> None:
         self._cooldown = self.fire_cd
 
-    def on_player_hit(self) -> None:
+    def fire(self, world) -> None:
+        """Spawn this frame's shots and restart the fire cooldown."""
+        self.did_fire()
+        # Fire pattern based on power (0:1, 1:2, >=2:3)
+        if self.power <= 0:
+            xs = (self.x,)
+        elif self.power == 1:
+            xs = (self.x - 1, self.x + 1)
+        else:
+            xs = (self.x - 1, self.x, self.x + 1)
+        for x in xs:
+            x = max(1, min(world.width - 2, x))
+            pid = world.next_id()
+            world.add(Projectile(pid, x, self.y - 1, owner="player", vy=-18.0))
+
+    def use_bomb(self, world) -> bool:
+        """Clear enemy bullets; only consumes a bomb if something was cleared."""
+        if self.bombs <= 0:
+            return False
+        cleared = 0
+        for p in list(world.by_kind.get('proj_enemy', [])):
+            if p.alive:
+                world.kill(p, CAUSE_BOMB)
+                cleared += 1
+        if cleared > 0:
+            self.bombs -= 1
+            world.events.emit(events.BOMB, self.id, self.x, self.y, cleared)
+            return True
+        return False
+
+    def on_player_hit(self, world=None) -> None:
         if self.invuln > 0:
             return
         self.lives -= 1
         self.invuln = 1.5
         if self.power > 0:
             self.power -= 1
+        if world is not None:
+            world.events.emit(events.PLAYER_HIT, self.id, self.x, self.y, self.lives)
 
     def sprite(self) -> Tuple[str, int | None, bool]:
         # Blink while invulnerable
@@ -3,22 +3,26 @@ from __future__ import annotations
 from typing import Tuple
 
 from ..core.entity import BaseEntity
+from ..core.fixed import FRAC_BITS, FRAC_MASK, HALF, scale, to_fixed
+from ..core.world import CAUSE_ESCAPED
 
 
+FALL_SPEED = to_fixed(4.0)  # cells per second
+
 class PowerUp(BaseEntity):
     def __init__(self, id_: int, x: int, y: int, kind: str) -> None:
         super().__init__(id=id_, kind=f"powerup_{kind}", x=x, y=y, w=1, h=1, hp=1)
         self.type = kind  # 'power' or 'bomb'
-        self._ay = 0.0
+        self._ay = HALF
 
     def update(self, dt: float, world) -> None:
-        # Fall at 4 cells/sec using accumulator
-        self._ay += 4.0 * dt
-        while self._ay >= 1.0:
-            self._ay -= 1.0
-            self.y += 1
+        ay = self._ay + scale(FALL_SPEED, dt)
+        if ay >> FRAC_BITS:
+            self.y += ay >> FRAC_BITS
+            world.touch(self)
             if self.y >= world.height - 1:
-                self.alive = False
+                world.kill(self, CAUSE_ESCAPED)
+        self._ay = ay & FRAC_MASK
 
     def sprite(self) -> Tuple[str, int | None, bool]:
         ch = "P" if self.type == "power" else "B"
@@ -3,28 +3,28 @@ from __future__ import annotations
 from typing import Tuple
 
 from ..core.entity import BaseEntity
+from ..core.fixed import FRAC_BITS, FRAC_MASK, HALF, scale, to_fixed
+from ..core.world import CAUSE_ESCAPED
 
 
 class Projectile(BaseEntity):
     def __init__(self, id_: int, x: int, y: int, owner: str, vy: float) -> None:
         super().__init__(id=id_, kind="proj_" + owner, x=x, y=y, w=1, h=1, hp=1)
         self.owner = owner  # 'player' or 'enemy'
-        self.vy = vy  # cells per second (float)
-        self._ay = 0.0
+        self.vy = to_fixed(vy)  # 1/65536 cells per second
+        self._ay = HALF  # sub-cell fraction (1/65536 cell)
         self.damage = 1
 
     def update(self, dt: float, world) -> None:
-        self._ay += self.vy * dt
-        # Move in whole-cell steps using accumulator
-        while self._ay <= -1.0:
-            self._ay += 1.0
-            self.y -= 1
-        while self._ay >= 1.0:
-            self._ay -= 1.0
-            self.y += 1
+        ay = self._ay + scale(self.vy, dt)
+        # Whole cells moved (floor, so also upward), keep the fraction
+        if ay >> FRAC_BITS:
+            self.y += ay >> FRAC_BITS
+            world.touch(self)
+        self._ay = ay & FRAC_MASK
         # Remove if out of bounds
         if self.y < 1 or self.y >= world.height - 1:
-            self.alive = False
+            world.kill(self, CAUSE_ESCAPED)
 
     def sprite(self) -> Tuple[str, int | None, bool]:
         return ("|" if self.owner == "player" else "!"), None, False
@@ -1,13 +1,15 @@
 """Input system mapping curses keys to actions.
 
-Produces a set of high-level actions per frame for scenes to consume.
-Configurable via controls mapping.
+Produces one action bitmask (see `core.actions`) per frame for scenes to
+consume. Configurable via controls mapping.
 """
 from __future__ import annotations
 
 import curses
 from typing import List
 
+from .core.actions import ACTION_BITS, PAUSE, QUIT
+
 
 KEY_NAME_MAP = {
     # Arrows and special
@@ -55,30 +57,33 @@ class Input:
         self.stdscr = stdscr
         self._bindings = self._compile_bindings(controls or {})
 
-    def _compile_bindings(self, controls: dict) -> dict[int, str]:
-        bindings: dict[int, str] = {}
+    def _compile_bindings(self, controls: dict) -> dict[int, int]:
+        bindings: dict[int, int] = {}
         for action, names in controls.items():
+            bit = ACTION_BITS.get(action)
+            if bit is None:
+                continue  # unknown action name in a user config
             codes = _names_to_codes(list(names)) if isinstance(names, list) else _names_to_codes([str(names)])
             for code in codes:
                 # Do not override earlier bindings; this lets 'fire' keep SPACE
                 # even if a later action (like 'start') also binds SPACE.
-                bindings.setdefault(code, action)
+                bindings.setdefault(code, bit)
         # Always include some sane defaults
-        for code, action in (
-            (ord('Q'), 'quit'), (ord('q'), 'quit'),
-            (ord('P'), 'pause'), (ord('p'), 'pause'),
+        for code, bit in (
+            (ord('Q'), QUIT), (ord('q'), QUIT),
+            (ord('P'), PAUSE), (ord('p'), PAUSE),
         ):
-            bindings.setdefault(code, action)
+            bindings.setdefault(code, bit)
         return bindings
 
-    def poll(self) -> List[str]:
-        actions: List[str] = []
+    def poll(self) -> int:
+        """Drain pending keys into one action bitmask (0 if none)."""
+        actions = 0
+        bindings = self._bindings
+        getch = self.stdscr.getch
         while True:
-            ch = self.stdscr.getch()
+            ch = getch()
             if ch == -1:
                 break
-            # Lookup by bindings
-            action = self._bindings.get(ch)
-            if action:
-                actions.append(action)
+            actions |= bindings.get(ch, 0)
         return actions
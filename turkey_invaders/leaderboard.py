@@ -0,0 +1,206 @@
+"""Local leaderboard store backed by SQLite (WAL mode).
+
+Scores live in `~/.local/share/turkey_invaders/highscores.sqlite3` by default.
+`scores` is indexed on score, seed and (wave_pack, score) for top-K reads; a
+trigger-maintained `score_hist` table (count per distinct score) answers
+percentile and count queries without scanning millions of rows. Batch
+runners should use `add_many()` or `writer()` so inserts are grouped into
+transactions.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_PACK = "default"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    seed INTEGER,
+    wave_pack TEXT NOT NULL DEFAULT 'default',
+    wave INTEGER NOT NULL DEFAULT 0,
+    name TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores(score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_seed ON scores(seed);
+CREATE INDEX IF NOT EXISTS scores_by_pack ON scores(wave_pack, score DESC);
+CREATE TABLE IF NOT EXISTS score_hist (
+    wave_pack TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (wave_pack, score)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS scores_hist_insert AFTER INSERT ON scores BEGIN
+    INSERT INTO score_hist (wave_pack, score, n) VALUES (NEW.wave_pack, NEW.score, 1)
+    ON CONFLICT (wave_pack, score) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scores_hist_delete AFTER DELETE ON scores BEGIN
+    UPDATE score_hist SET n = n - 1 WHERE wave_pack = OLD.wave_pack AND score = OLD.score;
+    DELETE FROM score_hist WHERE wave_pack = OLD.wave_pack AND score = OLD.score AND n <= 0;
+END;
+"""
+
+_INSERT = "INSERT INTO scores (score, seed, wave_pack, wave, name, created) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def _data_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".local", "share", "turkey_invaders")
+
+
+def default_path() -> str:
+    return os.path.join(_data_dir(), "highscores.sqlite3")
+
+
+@dataclass
+class ScoreEntry:
+    score: int
+    seed: Optional[int]
+    wave_pack: str
+    wave: int
+    name: str
+    created: float
+
+
+class Leaderboard:
+    """High-score store; one instance per thread (sqlite3 connections are not shared)."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or default_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Autocommit; transactions are opened explicitly for batches
+        self.conn = sqlite3.connect(self.path, isolation_level=None, timeout=5.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "Leaderboard":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- writes ---
+    def add(self, score: int, *, seed: Optional[int] = None, wave_pack: str = DEFAULT_PACK,
+            wave: int = 0, name: str = "") -> None:
+        self.conn.execute(_INSERT, (int(score), seed, wave_pack, int(wave), name, time.time()))
+
+    def add_many(self, rows: Iterable[Sequence]) -> int:
+        """Insert (score, seed, wave_pack, wave[, name]) rows in one transaction."""
+        now = time.time()
+        params = [
+            (int(r[0]), r[1], r[2] if len(r) > 2 else DEFAULT_PACK, int(r[3]) if len(r) > 3 else 0,
+             r[4] if len(r) > 4 else "", now)
+            for r in rows
+        ]
+        if not params:
+            return 0
+        with self._transaction():
+            self.conn.executemany(_INSERT, params)
+        return len(params)
+
+    def writer(self, batch_size: int = 1000) -> "ScoreWriter":
+        """Buffered writer that commits every `batch_size` rows."""
+        return ScoreWriter(self, batch_size)
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+    # --- reads ---
+    def top(self, k: int = 10, wave_pack: Optional[str] = None) -> List[ScoreEntry]:
+        cols = "score, seed, wave_pack, wave, name, created"
+        if wave_pack is None:
+            cur = self.conn.execute(f"SELECT {cols} FROM scores ORDER BY score DESC LIMIT ?", (k,))
+        else:
+            cur = self.conn.execute(
+                f"SELECT {cols} FROM scores WHERE wave_pack = ? ORDER BY score DESC LIMIT ?", (wave_pack, k)
+            )
+        return [ScoreEntry(*row) for row in cur]
+
+    def count(self, wave_pack: Optional[str] = None) -> int:
+        if wave_pack is None:
+            row = self.conn.execute("SELECT COALESCE(SUM(n), 0) FROM score_hist").fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT COALESCE(SUM(n), 0) FROM score_hist WHERE wave_pack = ?", (wave_pack,)
+            ).fetchone()
+        return int(row[0])
+
+    def percentile(self, p: float, wave_pack: Optional[str] = None) -> Optional[int]:
+        """Score at percentile p (0-100, nearest-rank), or None when empty."""
+        hist = self._histogram(wave_pack)
+        total = sum(n for _, n in hist)
+        if total == 0:
+            return None
+        rank = max(1, -(-int(round(max(0.0, min(100.0, p)) * total)) // 100))
+        seen = 0
+        for score, n in hist:
+            seen += n
+            if seen >= rank:
+                return score
+        return hist[-1][0]
+
+    def percent_rank(self, score: int, wave_pack: Optional[str] = None) -> float:
+        """Percentage of stored scores strictly below `score`."""
+        hist = self._histogram(wave_pack)
+        total = sum(n for _, n in hist)
+        if total == 0:
+            return 0.0
+        below = sum(n for s, n in hist if s < score)
+        return 100.0 * below / total
+
+    def _histogram(self, wave_pack: Optional[str]) -> List[Tuple[int, int]]:
+        if wave_pack is None:
+            cur = self.conn.execute("SELECT score, SUM(n) FROM score_hist GROUP BY score ORDER BY score")
+        else:
+            cur = self.conn.execute(
+                "SELECT score, n FROM score_hist WHERE wave_pack = ? ORDER BY score", (wave_pack,)
+            )
+        return [(int(s), int(n)) for s, n in cur]
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> None:
+        self.conn.execute("BEGIN")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+class ScoreWriter:
+    """Groups single-score inserts from batch runners into transactions."""
+
+    def __init__(self, board: Leaderboard, batch_size: int = 1000) -> None:
+        self.board = board
+        self.batch_size = max(1, int(batch_size))
+        self._rows: List[Tuple] = []
+
+    def add(self, score: int, *, seed: Optional[int] = None, wave_pack: str = DEFAULT_PACK,
+            wave: int = 0, name: str = "") -> None:
+        self._rows.append((score, seed, wave_pack, wave, name))
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self._rows = self._rows, []
+        self.board.add_many(rows)
+
+    def __enter__(self) -> "ScoreWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
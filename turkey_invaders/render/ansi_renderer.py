@@ -0,0 +1,353 @@
+"""Raw-ANSI terminal backend (alternative to curses).
+
+`RawTerminal` puts the TTY into raw mode with termios, switches to the
+alternate screen, and offers a curses-compatible `getch()` over a
+non-blocking fd so `Input` works unchanged. `AnsiRenderer` draws into an
+`ArrayRenderer` back buffer and, on `end_frame`, writes one precomputed byte
+buffer with only the changed spans, run-length color changes and
+synchronized-update markers: one `write()` per frame. `AnsiEncoder` is the
+reusable frame-delta encoder behind it (also used by the recorder).
+"""
+from __future__ import annotations
+
+import curses
+import fcntl
+import os
+import select
+import signal
+import termios
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .array_renderer import _UTF32, ATTR_BOLD, ATTR_COLOR_MASK, ArrayRenderer
+
+
+CSI = "\x1b["
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+ERASE_EOL = "\x1b[K"
+
+# Unchanged cells worth rewriting rather than paying for a cursor move
+_MAX_GAP = 6
+
+# Same palette as CursesRenderer's color pairs (default background)
+_PAIR_FG = {1: 33, 2: 36, 3: 31}
+
+# Escape sequence tails -> curses key codes
+_CSI_KEYS = {
+    "A": curses.KEY_UP,
+    "B": curses.KEY_DOWN,
+    "C": curses.KEY_RIGHT,
+    "D": curses.KEY_LEFT,
+    "H": curses.KEY_HOME,
+    "F": curses.KEY_END,
+}
+
+
+def sgr(attr: int) -> str:
+    """SGR sequence for a packed attribute byte (always resets first)."""
+    codes = ["0"]
+    if attr & ATTR_BOLD:
+        codes.append("1")
+    fg = _PAIR_FG.get(attr & ATTR_COLOR_MASK)
+    if fg is not None:
+        codes.append(str(fg))
+    return CSI + ";".join(codes) + "m"
+
+
+class RawTerminal:
+    """Raw-mode TTY with a non-blocking, curses-style `getch()`.
+
+    ISIG is left on so Ctrl-C still interrupts, as under curses' cbreak mode.
+    Use as a context manager; the terminal is restored on exit, along with
+    the SIGWINCH handler that was installed when it opened (a renderer on
+    this terminal may replace it).
+    """
+
+    def __init__(self, fd_in: int = 0, fd_out: int = 1) -> None:
+        self.fd_in = fd_in
+        self.fd_out = fd_out
+        self._saved_attrs = None
+        self._saved_flags: Optional[int] = None
+        self._saved_winch = None
+        self._pending: List[int] = []
+        self._drained = False
+
+    def __enter__(self) -> "RawTerminal":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        self._saved_attrs = termios.tcgetattr(self.fd_in)
+        attrs = termios.tcgetattr(self.fd_in)
+        attrs[0] &= ~(termios.BRKINT | termios.ICRNL | termios.INPCK | termios.ISTRIP | termios.IXON)
+        attrs[1] &= ~termios.OPOST
+        attrs[2] |= termios.CS8
+        attrs[3] &= ~(termios.ECHO | termios.ICANON | termios.IEXTEN)
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 0
+        termios.tcsetattr(self.fd_in, termios.TCSAFLUSH, attrs)
+        self._saved_flags = fcntl.fcntl(self.fd_in, fcntl.F_GETFL)
+        fcntl.fcntl(self.fd_in, fcntl.F_SETFL, self._saved_flags | os.O_NONBLOCK)
+        if hasattr(signal, "SIGWINCH"):
+            self._saved_winch = signal.getsignal(signal.SIGWINCH)
+        # Alternate screen, hide cursor, clear
+        self.write(b"\x1b[?1049h\x1b[?25l\x1b[0m\x1b[2J")
+
+    def close(self) -> None:
+        try:
+            self.write(b"\x1b[0m\x1b[?25h\x1b[?1049l")
+        except OSError:
+            pass
+        if self._saved_flags is not None:
+            fcntl.fcntl(self.fd_in, fcntl.F_SETFL, self._saved_flags)
+            self._saved_flags = None
+        if self._saved_attrs is not None:
+            termios.tcsetattr(self.fd_in, termios.TCSAFLUSH, self._saved_attrs)
+            self._saved_attrs = None
+        if self._saved_winch is not None:
+            try:
+                signal.signal(signal.SIGWINCH, self._saved_winch)
+            except ValueError:
+                pass  # not in the main thread
+            self._saved_winch = None
+
+    def size(self) -> tuple[int, int]:
+        """Terminal size as (columns, rows)."""
+        try:
+            sz = os.get_terminal_size(self.fd_out)
+            return sz.columns, sz.lines
+        except OSError:
+            return 80, 24
+
+    def write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            try:
+                n = os.write(self.fd_out, view)
+            except BlockingIOError:
+                # stdout shares the tty's file description with the
+                # non-blocking stdin; wait until it drains rather than spin
+                select.select([], [self.fd_out], [])
+                continue
+            view = view[n:]
+
+    def getch(self) -> int:
+        """Next key code, or -1 when no input is pending (never blocks).
+
+        Reads at most once per drain so a poll loop costs one syscall.
+        """
+        if not self._pending:
+            if self._drained:
+                self._drained = False
+                return -1
+            try:
+                data = os.read(self.fd_in, 1024)
+            except (BlockingIOError, InterruptedError):
+                data = b""
+            self._drained = len(data) < 1024
+            if not data:
+                self._drained = False
+                return -1
+            self._pending = self._decode(data)
+            self._pending.reverse()
+            if not self._pending:
+                return -1
+        return self._pending.pop()
+
+    @staticmethod
+    def _decode(data: bytes) -> List[int]:
+        text = data.decode("utf-8", errors="ignore")
+        keys: List[int] = []
+        i, n = 0, len(text)
+        while i < n:
+            ch = text[i]
+            if ch == "\x1b" and i + 1 < n and text[i + 1] in "[O":
+                # CSI / SS3: parameters then a final byte in @..~
+                j = i + 2
+                while j < n and not ("@" <= text[j] <= "~"):
+                    j += 1
+                if j < n:
+                    code = _CSI_KEYS.get(text[j])
+                    if code is not None:
+                        keys.append(code)
+                i = j + 1
+                continue
+            keys.append(ord(ch))
+            i += 1
+        return keys
+
+
+class AnsiEncoder:
+    """Turns successive glyph/attribute frames into ANSI byte deltas.
+
+    Keeps its own copy of the last encoded frame. `encode` emits one cursor
+    move per changed row span (short unchanged gaps are bridged), SGR only
+    where the attribute changes, and erase-in-line for blank row tails. A
+    size change or `reset()` forces a full redraw on the next frame.
+    """
+
+    def __init__(self, *, scale: int = 1, sync: bool = True) -> None:
+        self.scale = max(1, int(scale))
+        self.sync = sync
+        self.width = 0
+        self.height = 0
+        # Output clip in terminal cells (defaults to the scaled frame size)
+        self.term_width = 0
+        self.term_height = 0
+        self._sgr: Dict[int, str] = {}
+        self._full = True
+        self._front_glyphs = array("I")
+        self._front_attrs = array("B")
+
+    def reset(self) -> None:
+        self._full = True
+
+    def encode(self, glyphs: array, attrs: array, width: int, height: int) -> bytes:
+        """Bytes that turn the previously encoded frame into this one."""
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self._front_glyphs = array("I", glyphs)
+            self._front_attrs = array("B", attrs)
+            self._full = True
+        w, h, s = width, height, self.scale
+        tw = self.term_width or w * s
+        th = self.term_height or h * s
+        fg, fa = self._front_glyphs, self._front_attrs
+        gb = memoryview(glyphs).cast("B")
+        fb = memoryview(fg).cast("B")
+        av, fav = memoryview(attrs), memoryview(fa)
+        full = self._full
+        self._full = False
+        out: List[str] = [SYNC_BEGIN] if self.sync else []
+        mark = len(out)
+        if full:
+            out.append("\x1b[0m\x1b[2J")
+        cur_attr = -1
+        for y in range(h):
+            start = y * w
+            end = start + w
+            if not full and gb[start * 4:end * 4] == fb[start * 4:end * 4] and av[start:end] == fav[start:end]:
+                continue
+            spans = [(start, end)] if full else _changed_spans(glyphs, attrs, fg, fa, start, end)
+            for lo, hi in spans:
+                col = (lo - start) * s + 1
+                if col > tw:
+                    continue
+                # Blank tail up to the row end: erase-in-line instead of spaces
+                erase = ""
+                if hi == end:
+                    t = hi
+                    while t > lo and glyphs[t - 1] == 32 and attrs[t - 1] == 0:
+                        t -= 1
+                    if hi - t > 3:
+                        hi = t
+                        # Rows are already blank right after a full clear
+                        erase = "" if full else ERASE_EOL
+                if lo == hi and not erase:
+                    continue
+                if s > 1:
+                    # Each copy of a scaled row must start with its own SGR
+                    cur_attr = -1
+                text, cur_attr = self._encode_span(gb, attrs, lo, hi, cur_attr)
+                text += erase
+                for k in range(s):
+                    row = y * s + k + 1
+                    if row > th:
+                        break
+                    out.append(f"{CSI}{row};{col}H")
+                    out.append(text)
+        fb.release()
+        gb.release()
+        fg[:] = glyphs
+        fa[:] = attrs
+        if len(out) == mark:
+            return b""
+        if self.sync:
+            out.append(SYNC_END)
+        return "".join(out).encode("utf-8")
+
+    def _encode_span(self, gb: memoryview, attrs: array, lo: int, hi: int, cur_attr: int) -> Tuple[str, int]:
+        s = self.scale
+        parts: List[str] = []
+        i = lo
+        while i < hi:
+            a = attrs[i]
+            j = i + 1
+            while j < hi and attrs[j] == a:
+                j += 1
+            if a != cur_attr:
+                seq = self._sgr.get(a)
+                if seq is None:
+                    seq = self._sgr[a] = sgr(a)
+                parts.append(seq)
+                cur_attr = a
+            chunk = gb[i * 4:j * 4].tobytes().decode(_UTF32)
+            if s > 1:
+                chunk = "".join(ch * s for ch in chunk)
+            parts.append(chunk)
+            i = j
+        return "".join(parts), cur_attr
+
+
+def _changed_spans(glyphs: array, attrs: array, fg: array, fa: array, start: int, end: int) -> List[Tuple[int, int]]:
+    """Differing cell ranges in [start, end); short unchanged gaps are bridged
+    since rewriting them is cheaper than another cursor move."""
+    spans: List[Tuple[int, int]] = []
+    lo = -1
+    last = -1
+    for i in range(start, end):
+        if glyphs[i] != fg[i] or attrs[i] != fa[i]:
+            if lo < 0:
+                lo = i
+            elif i - last > _MAX_GAP:
+                spans.append((lo, last + 1))
+                lo = i
+            last = i
+    if lo >= 0:
+        spans.append((lo, last + 1))
+    return spans
+
+
+class AnsiRenderer(ArrayRenderer):
+    """Diffing renderer that emits raw ANSI through a `RawTerminal`.
+
+    Draw calls land in the back buffer (see ArrayRenderer); `end_frame`
+    encodes the delta against the previous frame with `AnsiEncoder` and
+    writes it with a single syscall.
+    """
+
+    def __init__(self, term, *, scale: int = 1, write: Optional[Callable[[bytes], None]] = None) -> None:
+        self.term = term
+        self._write = write or term.write
+        cols, rows = term.size()
+        scale = max(1, int(scale))
+        self.encoder = AnsiEncoder(scale=scale)
+        self.encoder.term_width, self.encoder.term_height = cols, rows
+        super().__init__(width=max(1, cols // scale), height=max(1, rows // scale), scale=scale)
+        self._resized = False
+        try:
+            signal.signal(signal.SIGWINCH, self._on_winch)
+        except (ValueError, AttributeError):
+            pass  # not in the main thread / platform without SIGWINCH
+
+    def _on_winch(self, signum, frame) -> None:  # noqa: ARG002
+        self._resized = True
+
+    def begin_frame(self) -> None:
+        if self._resized:
+            self._resized = False
+            cols, rows = self.term.size()
+            self.encoder.term_width, self.encoder.term_height = cols, rows
+            self.resize(max(1, cols // self.scale), max(1, rows // self.scale))
+            self.encoder.reset()
+        super().begin_frame()
+
+    def end_frame(self) -> None:
+        super().end_frame()
+        data = self.encoder.encode(self._glyphs, self._attrs, self.width, self.height)
+        if data:
+            self._write(data)
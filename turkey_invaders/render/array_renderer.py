@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Dict, Tuple
+
+
+# Attribute byte layout: low 6 bits color pair, top bit bold
+ATTR_COLOR_MASK = 0x3F
+ATTR_BOLD = 0x80
+
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def pack_attr(color_pair: int | None, bold: bool) -> int:
+    return ((color_pair or 0) & ATTR_COLOR_MASK) | (ATTR_BOLD if bold else 0)
+
+
+class ArrayRenderer:
+    """Renderer that draws into preallocated glyph/attribute arrays.
+
+    Glyphs are uint32 code points and attributes are uint8 (see `pack_attr`),
+    one per logical cell, row-major. `glyphs` and `attrs` are memoryviews over
+    the live buffers, so tests, bots and recorders can read frames without
+    copying or building strings. `begin_frame` clears both in place.
+    """
+
+    def __init__(self, *, width: int = 80, height: int = 24, scale: int = 1) -> None:
+        # scale is accepted for protocol parity; cells stay logical
+        self.scale = max(1, int(scale))
+        self.frame = 0
+        self._attr_runs: Dict[int, memoryview] = {}
+        self._alloc(max(1, width), max(1, height))
+
+    def _alloc(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        n = width * height
+        self._glyphs = array("I", [ord(" ")]) * n
+        self._attrs = array("B", bytes(n))
+        self._blank_glyphs = array("I", self._glyphs)
+        self._blank_attrs = array("B", self._attrs)
+        self._glyph_bytes = memoryview(self._glyphs).cast("B")
+        self.glyphs = memoryview(self._glyphs)
+        self.attrs = memoryview(self._attrs)
+        self._attr_runs.clear()
+
+    def resize(self, width: int, height: int) -> None:
+        """Reallocate for a new size; previously handed-out views go stale."""
+        width, height = max(1, width), max(1, height)
+        if (width, height) == (self.width, self.height):
+            return
+        self.glyphs.release()
+        self.attrs.release()
+        self._glyph_bytes.release()
+        self._alloc(width, height)
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def begin_frame(self) -> None:
+        self._glyphs[:] = self._blank_glyphs
+        self._attrs[:] = self._blank_attrs
+
+    def draw_text(self, x: int, y: int, text: str, color_pair: int | None = None, bold: bool = False) -> None:
+        if y < 0 or y >= self.height:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        if x >= self.width:
+            return
+        text = text[: self.width - x]
+        n = len(text)
+        if not n:
+            return
+        off = y * self.width + x
+        self._glyph_bytes[off * 4:(off + n) * 4] = text.encode(_UTF32)
+        attr = pack_attr(color_pair, bold)
+        run = self._attr_runs.get(attr)
+        if run is None:
+            run = self._attr_runs[attr] = memoryview(bytes((attr,)) * self.width)
+        self.attrs[off:off + n] = run[:n]
+
+    def end_frame(self) -> None:
+        self.frame += 1
+
+    # --- helpers for tests and tooling (these do build strings) ---
+    def cell(self, x: int, y: int) -> Tuple[str, int]:
+        i = y * self.width + x
+        return chr(self._glyphs[i]), self._attrs[i]
+
+    def row_text(self, y: int) -> str:
+        start = y * self.width
+        return self._glyph_bytes[start * 4:(start + self.width) * 4].tobytes().decode(_UTF32)
+
+    def frame_text(self) -> str:
+        return "\n".join(self.row_text(y).rstrip() for y in range(self.height))
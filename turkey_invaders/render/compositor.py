@@ -0,0 +1,169 @@
+"""Row compositor for the playfield layer.
+
+Scenes with many entities write glyphs straight into a per-row cell buffer
+instead of issuing one `draw_text` per entity, then `flush()` hands each row
+to the renderer as one write per run of equal attributes. Blank cells inside
+a row join whichever run they sit in, so a row of same-colored sprites is a
+single call however many entities it holds: draw cost scales with the rows
+in use, not the entity count.
+
+Sprites are looked up in tables cached per (class, kind); entities whose
+look depends on state (`sprite_static = False`, e.g. the blinking player)
+still call `sprite()`, but the result is mapped through a per-state table.
+Particle effects (`particles.py`) are composited into the same buffer.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from .array_renderer import ATTR_BOLD, ATTR_COLOR_MASK, pack_attr
+from .particles import GLYPHS as _PARTICLE_GLYPHS
+
+
+_BLANK = -1
+
+
+class RowCompositor:
+    def __init__(self) -> None:
+        self.width = 0
+        self.height = 0
+        self.top = 0  # rows above this belong to someone else (e.g. the HUD)
+        self.writes = 0  # draw calls issued by the last flush
+        self._glyphs: List[List[str]] = []
+        self._attrs: List[List[int]] = []
+        # Per dirty row: [lo, hi, attr of the first cell, mixed attrs?]
+        self._dirty: Dict[int, List] = {}
+        self._sprites: Dict[Tuple[type, str], Tuple[str, int]] = {}
+        self._states: Dict[Tuple, Tuple[str, int]] = {}
+
+    def begin(self, width: int, height: int, *, top: int = 0) -> None:
+        """Start a frame at the given logical size (rows are left clean by flush).
+
+        Nothing is composited into rows above `top`, so a scrolled playfield
+        never writes over lines drawn directly (the HUD).
+        """
+        self.top = max(0, top)
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self._glyphs = [[" "] * width for _ in range(height)]
+            self._attrs = [[_BLANK] * width for _ in range(height)]
+            self._dirty.clear()
+
+    def put(self, x: int, y: int, text: str, color_pair: int | None = None, bold: bool = False) -> None:
+        """Write `text` into the buffer (clipped), like a renderer's draw_text."""
+        if y < self.top or y >= self.height:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        text = text[: self.width - x]
+        if not text:
+            return
+        attr = pack_attr(color_pair, bold)
+        end = x + len(text)
+        self._glyphs[y][x:end] = text
+        self._attrs[y][x:end] = [attr] * len(text)
+        self._mark(y, x, end - 1, attr)
+
+    def draw_entities(self, entities: Iterable, ox: int = 0, oy: int = 0) -> None:
+        """Composite entity sprites; later entities win on shared cells.
+
+        (ox, oy) is the world cell shown at the top-left (the camera).
+        """
+        w, h, top = self.width, self.height, self.top
+        glyphs, attrs, dirty = self._glyphs, self._attrs, self._dirty
+        sprites = self._sprites
+        for e in entities:
+            x, y = e.x - ox, e.y - oy
+            if not (0 <= x < w and top <= y < h):
+                continue
+            cell = sprites.get((e.__class__, e.kind))
+            if cell is None:
+                cell = self._sprite(e)
+            ch, attr = cell
+            glyphs[y][x] = ch
+            attrs[y][x] = attr
+            d = dirty.get(y)
+            if d is None:
+                dirty[y] = [x, x, attr, False]
+                continue
+            if x < d[0]:
+                d[0] = x
+            elif x > d[1]:
+                d[1] = x
+            if attr != d[2]:
+                d[3] = True
+
+    def draw_particles(self, particles, ox: int = 0, oy: int = 0) -> None:
+        """Composite live particles from a `ParticleSystem`'s arrays.
+
+        Call before `draw_entities` so sprites stay on top of debris.
+        """
+        if not particles.live:
+            return
+        w, h, top = self.width, self.height, self.top
+        glyphs, attrs = self._glyphs, self._attrs
+        life, ttl, px, py, pa = particles.life, particles.ttl, particles.x, particles.y, particles.attr
+        ramp = len(_PARTICLE_GLYPHS)
+        for i in range(particles.capacity):
+            t = life[i]
+            if t <= 0.0:
+                continue
+            fx, fy = px[i] - ox, py[i] - oy
+            if not (0.0 <= fx < w and top <= fy < h):
+                continue
+            x, y = int(fx), int(fy)
+            k = int((1.0 - t / ttl[i]) * ramp)
+            attr = pa[i]
+            glyphs[y][x] = _PARTICLE_GLYPHS[k if k < ramp else ramp - 1]
+            attrs[y][x] = attr
+            self._mark(y, x, x, attr)
+
+    def flush(self, r) -> int:
+        """Draw every dirty row to `r` and clear it; returns the writes issued."""
+        writes = 0
+        glyphs, attrs = self._glyphs, self._attrs
+        for y, (lo, hi, attr, mixed) in self._dirty.items():
+            g, a = glyphs[y], attrs[y]
+            if not mixed:
+                _draw(r, lo, y, "".join(g[lo:hi + 1]), attr)
+                writes += 1
+            else:
+                start, cur = lo, a[lo]
+                for x in range(lo + 1, hi + 1):
+                    ax = a[x]
+                    if ax != cur and ax != _BLANK:
+                        _draw(r, start, y, "".join(g[start:x]), cur)
+                        writes += 1
+                        start, cur = x, ax
+                _draw(r, start, y, "".join(g[start:hi + 1]), cur)
+                writes += 1
+            n = hi + 1 - lo
+            g[lo:hi + 1] = [" "] * n
+            a[lo:hi + 1] = [_BLANK] * n
+        self._dirty.clear()
+        self.writes = writes
+        return writes
+
+    def _mark(self, y: int, lo: int, hi: int, attr: int) -> None:
+        d = self._dirty.get(y)
+        if d is None:
+            self._dirty[y] = [lo, hi, attr, False]
+            return
+        d[0] = min(d[0], lo)
+        d[1] = max(d[1], hi)
+        if attr != d[2]:
+            d[3] = True
+
+    def _sprite(self, e) -> Tuple[str, int]:
+        ch, color, bold = e.sprite()
+        cell = self._states.get((ch, color, bold))
+        if cell is None:
+            cell = self._states[(ch, color, bold)] = (ch[:1] or " ", pack_attr(color, bold))
+        if getattr(e, "sprite_static", True):
+            self._sprites[(e.__class__, e.kind)] = cell
+        return cell
+
+
+def _draw(r, x: int, y: int, text: str, attr: int) -> None:
+    r.draw_text(x, y, text, color_pair=(attr & ATTR_COLOR_MASK) or None, bold=bool(attr & ATTR_BOLD))
@@ -4,6 +4,11 @@ import curses
 from typing import Tuple
 
 
+def _color_pair_bits(n: int) -> int:
+    """`curses.color_pair()` without a terminal: the pair number in bits 8-15."""
+    return (n & 0xFF) << 8
+
+
 class CursesRenderer:
     """Minimal curses-based renderer with a simple API."""
 
@@ -13,8 +18,18 @@ class CursesRenderer:
         self.scale = max(1, int(scale))
         self.height = max(1, self.term_height // self.scale)
         self.width = max(1, self.term_width // self.scale)
-        curses.start_color()
-        curses.use_default_colors()
+        # Without initscr() (e.g. a FakeScreen in benchmarks) curses' module
+        # functions raise; fall back to the standard pair encoding and a
+        # plain refresh so the draw path stays the same
+        self._color_pair = curses.color_pair
+        self._terminal = True
+        try:
+            curses.start_color()
+            curses.use_default_colors()
+        except curses.error:
+            self._color_pair = _color_pair_bits
+            self._terminal = False
+            return
         try:
             curses.init_pair(1, curses.COLOR_YELLOW, -1)  # HUD/Title
             curses.init_pair(2, curses.COLOR_CYAN, -1)    # Player
@@ -29,6 +44,9 @@ class CursesRenderer:
         self.width = max(1, self.term_width // self.scale)
 
     def end_frame(self) -> None:
+        if not self._terminal:
+            self.stdscr.refresh()
+            return
         try:
             self.stdscr.noutrefresh()
             curses.doupdate()
@@ -47,7 +65,7 @@ class CursesRenderer:
             x = 0
         if x >= self.width:
             return
-        attr = curses.color_pair(color_pair) if color_pair else 0
+        attr = self._color_pair(color_pair) if color_pair else 0
         if bold:
             attr |= curses.A_BOLD
         # Scale horizontally by repeating characters
@@ -0,0 +1,71 @@
+"""Stand-in for a curses window, for running `CursesRenderer` without a TTY.
+
+`FakeScreen` implements the handful of window methods the renderer and
+`Input` use and counts what a terminal would have been sent: `addnstr`
+calls, bytes written (UTF-8, after the `n` clip) and refreshes. Text is not
+stored unless `keep=True`, so the counters cost next to nothing and a
+benchmark measures the renderer rather than the stand-in.
+"""
+from __future__ import annotations
+
+import curses
+from typing import List, Tuple
+
+
+class FakeScreen:
+    def __init__(self, width: int = 80, height: int = 24, *, keep: bool = False) -> None:
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+        self.keep = keep
+        self.calls = 0
+        self.bytes = 0
+        self.refreshes = 0
+        self.erases = 0
+        # (y, x, text, attr) per addnstr when keep=True; cleared by erase()
+        self.writes: List[Tuple[int, int, str, int]] = []
+
+    def reset_counters(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+        self.refreshes = 0
+        self.erases = 0
+
+    def resize(self, width: int, height: int) -> None:
+        self.width = max(1, int(width))
+        self.height = max(1, int(height))
+
+    # --- curses window protocol -------------------------------------------
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    def erase(self) -> None:
+        self.erases += 1
+        if self.keep:
+            self.writes.clear()
+
+    clear = erase
+
+    def addnstr(self, y: int, x: int, text: str, n: int, attr: int = 0) -> None:
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise curses.error("addnstr() returned ERR")
+        if n < len(text):
+            text = text[:n]
+        self.calls += 1
+        self.bytes += len(text.encode("utf-8"))
+        if self.keep:
+            self.writes.append((y, x, text, attr))
+
+    def noutrefresh(self) -> None:
+        self.refreshes += 1
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+    def keypad(self, flag: bool) -> None:  # noqa: ARG002
+        pass
+
+    def nodelay(self, flag: bool) -> None:  # noqa: ARG002
+        pass
+
+    def getch(self) -> int:
+        return -1
@@ -0,0 +1,123 @@
+"""Adaptive render-rate governor.
+
+The simulation always advances in fixed ticks; only presentation degrades.
+The governor tracks an exponential moving average of render cost and picks a
+level:
+
+    level 0: every tick, full detail
+    level 1: every tick, low detail (scenes skip non-essential overlays)
+    level k: every k-th tick, low detail (k = 2 .. max_interval)
+
+It steps one level down when the amortized render cost (EMA / interval) is
+over budget, and one level up after `recover_after` consecutive renders in
+which the next better level would comfortably fit.
+
+When the loop still owes simulation ticks after its catch-up steps
+(`behind`), renders are skipped so the ticks are paid back, but never for
+more than `max_catchup` ticks in a row. Simulation time the loop had to
+give up on (its debt bound) is reported in `dropped`.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+class RenderGovernor:
+    def __init__(
+        self,
+        tick: float,
+        *,
+        budget_share: float = 0.5,
+        max_interval: int = 4,
+        recover_after: int = 30,
+        smoothing: float = 0.2,
+        max_catchup: int = 8,
+    ) -> None:
+        # Render time allowed per simulation tick (amortized)
+        self.budget = tick * budget_share
+        self.max_level = max(1, int(max_interval))
+        self.recover_after = max(1, int(recover_after))
+        self.smoothing = smoothing
+        self.max_catchup = max(1, int(max_catchup))
+        self.level = 0
+        self.ema = 0.0
+        self.rendered = 0
+        self.skipped = 0
+        self.catchup = 0  # renders skipped to pay back owed ticks
+        self.dropped = 0.0  # simulation seconds dropped by the loop's debt bound
+        self.degrades = 0
+        self.recovers = 0
+        self._since_render = 0
+        self._calm = 0
+
+    @property
+    def interval(self) -> int:
+        return max(1, self.level)
+
+    @property
+    def low_detail(self) -> bool:
+        return self.level > 0
+
+    def should_render(self, ticks: int, behind: bool = False) -> bool:
+        """Call once per loop iteration with the ticks just simulated.
+
+        `behind`: the loop still owes ticks after this iteration's updates.
+        """
+        self._since_render += ticks
+        if behind and self._since_render < self.max_catchup:
+            self.skipped += 1
+            self.catchup += 1
+            return False
+        if self.level <= 1 or self._since_render >= self.interval:
+            self._since_render = 0
+            return True
+        self.skipped += 1
+        return False
+
+    def record(self, seconds: float) -> None:
+        """Feed the cost of the frame that was just rendered."""
+        self.rendered += 1
+        if self.rendered == 1:
+            self.ema = seconds
+        else:
+            self.ema += self.smoothing * (seconds - self.ema)
+        if self.ema / self.interval > self.budget:
+            self._calm = 0
+            if self.level < self.max_level:
+                self.level += 1
+                self.degrades += 1
+            return
+        if self.level == 0:
+            return
+        # Would the next better level fit with some headroom?
+        better = max(1, self.level - 1)
+        if self.ema / better < self.budget * 0.7:
+            self._calm += 1
+            if self._calm >= self.recover_after:
+                self._calm = 0
+                self.level -= 1
+                self.recovers += 1
+        else:
+            self._calm = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "level": self.level,
+            "interval": self.interval,
+            "low_detail": self.low_detail,
+            "render_ms": round(self.ema * 1000.0, 3),
+            "budget_ms": round(self.budget * 1000.0, 3),
+            "rendered": self.rendered,
+            "skipped": self.skipped,
+            "catchup": self.catchup,
+            "dropped_ms": round(self.dropped * 1000.0, 3),
+            "degrades": self.degrades,
+            "recovers": self.recovers,
+        }
+
+    def summary(self) -> str:
+        """One-line status for a debug overlay."""
+        text = f"R1/{self.interval} L{self.level} {self.ema * 1000.0:.1f}ms"
+        if self.dropped:
+            text += f" lost {self.dropped * 1000.0:.0f}ms"
+        return text
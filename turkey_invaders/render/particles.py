@@ -0,0 +1,117 @@
+"""Pooled particle effects (explosion debris, hit sparks, bomb rings).
+
+Particles are purely visual and never enter the `World`: they live in
+fixed-capacity parallel arrays (position, velocity, lifetime, attribute)
+used as a ring. A new particle takes the slot after the last
+one written, so when the pool is full the oldest particle is evicted.
+`update()` advances every slot in one pass over the arrays and
+`RowCompositor.draw_particles()` writes the live ones straight into the
+playfield's cell buffer, so a burst costs no objects and no extra draw
+calls.
+
+The system subscribes to the world's event bus (`on_events`) and turns
+kills, player hits and bombs into bursts. It draws from its own RNG, so
+effects never disturb the gameplay random stream.
+"""
+from __future__ import annotations
+
+import math
+import random
+from array import array
+
+from ..core import events
+from .array_renderer import pack_attr
+
+
+# Glyph ramp, brightest first; a particle steps down it as it fades
+GLYPHS = "*+.'"
+
+_GRAVITY = 6.0  # cells/s^2, pulls debris down a little
+_DIRECTIONS = 16
+
+_ATTR_DEBRIS = pack_attr(1, True)
+_ATTR_HIT = pack_attr(3, True)
+_ATTR_BOMB = pack_attr(2, False)
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = 512, *, seed: int | None = None) -> None:
+        self.capacity = max(1, int(capacity))
+        n = self.capacity
+        self.x = array("d", bytes(8 * n))
+        self.y = array("d", bytes(8 * n))
+        self.vx = array("d", bytes(8 * n))
+        self.vy = array("d", bytes(8 * n))
+        self.life = array("d", bytes(8 * n))  # seconds left; <= 0 is a free slot
+        self.ttl = array("d", [1.0]) * n  # starting lifetime, for the fade
+        self.attr = array("B", bytes(n))
+        self.live = 0  # live particles (an upper bound between updates)
+        self._head = 0
+        self._rng = random.Random(seed)
+        step = 2.0 * math.pi / _DIRECTIONS
+        self._dirs = [(math.cos(i * step), math.sin(i * step)) for i in range(_DIRECTIONS)]
+
+    def clear(self) -> None:
+        n = self.capacity
+        self.life[:] = array("d", bytes(8 * n))
+        self.live = 0
+        self._head = 0
+
+    def emit(self, x: float, y: float, vx: float, vy: float, life: float, attr: int) -> None:
+        """Start one particle, overwriting the oldest slot if the pool is full."""
+        i = self._head
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.ttl[i] = life
+        self.attr[i] = attr
+        self._head = i + 1 if i + 1 < self.capacity else 0
+        if self.live < self.capacity:
+            self.live += 1
+
+    def burst(self, x: int, y: int, count: int, *, speed: float = 8.0, life: float = 0.5,
+              attr: int = _ATTR_DEBRIS) -> None:
+        """Spray `count` particles outward from cell (x, y)."""
+        rng = self._rng
+        dirs = self._dirs
+        offset = rng.randrange(_DIRECTIONS)
+        cx, cy = x + 0.5, y + 0.5
+        for k in range(count):
+            dx, dy = dirs[(offset + k * _DIRECTIONS // max(1, count)) % _DIRECTIONS]
+            s = speed * (0.5 + rng.random())
+            # Halve vertical speed: terminal cells are about twice as tall as wide
+            self.emit(cx, cy, dx * s, dy * s * 0.5, life * (0.6 + 0.8 * rng.random()), attr)
+
+    def on_events(self, view: memoryview) -> None:
+        """Event bus subscriber: bursts for kills, player hits and bombs."""
+        for rec in events.RECORD.iter_unpack(view):
+            etype = rec[1]
+            if etype == events.KILL:
+                self.burst(rec[2], rec[3], 8)
+            elif etype == events.PLAYER_HIT:
+                self.burst(rec[2], rec[3], 12, speed=10.0, life=0.7, attr=_ATTR_HIT)
+            elif etype == events.BOMB:
+                self.burst(rec[2], rec[3], _DIRECTIONS, speed=20.0, life=0.4, attr=_ATTR_BOMB)
+
+    def update(self, dt: float) -> None:
+        """Advance every live particle in one pass over the arrays."""
+        if not self.live:
+            return
+        x, y, vx, vy, life = self.x, self.y, self.vx, self.vy, self.life
+        g = _GRAVITY * dt
+        live = 0
+        for i in range(self.capacity):
+            t = life[i]
+            if t <= 0.0:
+                continue
+            t -= dt
+            life[i] = t
+            if t <= 0.0:
+                continue
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            vy[i] += g
+            live += 1
+        self.live = live
@@ -0,0 +1,151 @@
+"""Streaming asciicast (asciinema v2) recorder.
+
+Attach an `AsciicastRecorder` to a `TeeRenderer` to record whatever the game
+draws, on any backend. The game thread only copies the mirrored frame into a
+pooled buffer and hands it to a background writer; the writer encodes the
+changed regions with `AnsiEncoder` and appends timestamped events. When the
+pool is exhausted the frame is dropped; because the writer always diffs
+against the last frame it encoded, the next recorded frame carries the
+dropped changes with it (frames merge instead of queueing up).
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from array import array
+from typing import Optional
+
+from .ansi_renderer import AnsiEncoder
+
+
+# Longest close() waits on the writer for a pool buffer or queue slot
+_CLOSE_TIMEOUT = 1.0
+
+
+class FrameCopy:
+    """Reusable copy of a frame's glyph/attribute buffers (pooled by sinks)."""
+
+    __slots__ = ("glyphs", "attrs", "width", "height", "t")
+
+    def __init__(self) -> None:
+        self.glyphs = array("I")
+        self.attrs = array("B")
+        self.width = 0
+        self.height = 0
+        self.t = 0.0
+
+    def load(self, frame, t: float) -> None:
+        if (frame.width, frame.height) != (self.width, self.height):
+            self.width, self.height = frame.width, frame.height
+            n = frame.width * frame.height
+            self.glyphs = array("I", bytes(4 * n))
+            self.attrs = array("B", bytes(n))
+        memoryview(self.glyphs)[:] = frame.glyphs
+        memoryview(self.attrs)[:] = frame.attrs
+        self.t = t
+
+
+class AsciicastRecorder:
+    """Frame sink writing an asciicast v2 file from a background thread."""
+
+    def __init__(self, path: str, *, queue_size: int = 8, title: str = "Turkey Invaders") -> None:
+        self.path = path
+        self.title = title
+        self.frames = 0
+        self.dropped = 0
+        self._start: Optional[float] = None
+        self._free: "queue.Queue[FrameCopy]" = queue.Queue()
+        # Sized to the pool, so handing off a pooled frame never blocks
+        self._work: "queue.Queue[Optional[FrameCopy]]" = queue.Queue(maxsize=max(1, queue_size) + 1)
+        for _ in range(max(1, queue_size)):
+            self._free.put(FrameCopy())
+        self._last_dropped = None
+        self._closed = False
+        # Opened here so a bad path fails at startup, not in the writer
+        self._out = open(path, "w", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="asciicast-writer", daemon=True)
+        self._thread.start()
+
+    # --- game thread ---
+    def on_frame(self, frame) -> None:
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            self._last_dropped = (frame, now - self._start)
+            return
+        self._last_dropped = None
+        buf.load(frame, now - self._start)
+        self.frames += 1
+        self._work.put_nowait(buf)
+
+    def close(self) -> None:
+        """Flush the final frame (even if it was dropped) and stop the writer.
+
+        Never blocks on a writer that died (e.g. on a write error): its pool
+        buffers are gone, so waits are timed and skipped once it is dead.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._last_dropped is not None and self._thread.is_alive():
+            frame, t = self._last_dropped
+            try:
+                buf = self._free.get(timeout=_CLOSE_TIMEOUT)
+            except queue.Empty:
+                buf = None
+            if buf is not None:
+                buf.load(frame, t)
+                try:
+                    self._work.put(buf, timeout=_CLOSE_TIMEOUT)
+                except queue.Full:
+                    pass
+        if self._thread.is_alive():
+            try:
+                self._work.put(None, timeout=_CLOSE_TIMEOUT)
+            except queue.Full:
+                return
+            self._thread.join()
+        else:
+            self._out.close()
+
+    # --- writer thread ---
+    def _run(self) -> None:
+        encoder = AnsiEncoder(scale=1, sync=False)
+        out = self._out
+        size = None
+        try:
+            while True:
+                buf = self._work.get()
+                if buf is None:
+                    break
+                try:
+                    if size is None:
+                        header = {
+                            "version": 2,
+                            "width": buf.width,
+                            "height": buf.height,
+                            "timestamp": int(time.time()),
+                            "title": self.title,
+                            "env": {"TERM": os.environ.get("TERM", "xterm-256color")},
+                        }
+                        out.write(json.dumps(header) + "\n")
+                        size = (buf.width, buf.height)
+                    elif (buf.width, buf.height) != size:
+                        size = (buf.width, buf.height)
+                        out.write(json.dumps([round(buf.t, 6), "r", f"{size[0]}x{size[1]}"]) + "\n")
+                    data = encoder.encode(buf.glyphs, buf.attrs, buf.width, buf.height)
+                    if data:
+                        out.write(json.dumps([round(buf.t, 6), "o", data.decode("utf-8")]) + "\n")
+                finally:
+                    self._free.put(buf)
+                if self._work.empty():
+                    out.flush()
+        finally:
+            out.close()
@@ -0,0 +1,206 @@
+"""Spectator broadcast over a Unix domain socket.
+
+`SpectatorServer` is a frame sink for `TeeRenderer`. Like the recorder, the
+game thread only copies the mirrored frame into a pooled buffer; a
+background thread encodes it once with `AnsiEncoder` and sends the same delta
+bytes to every viewer over non-blocking sockets. The stream is plain ANSI,
+so a viewer only has to copy it to its terminal (see `turkey_invaders.watch`).
+
+A viewer that cannot take a whole message keeps at most that one message
+pending; the frames it misses meanwhile are not buffered. Once it drains, it
+gets a keyframe (full redraw) and continues with the shared deltas. New
+viewers start with a keyframe too.
+"""
+from __future__ import annotations
+
+import errno
+import os
+import queue
+import selectors
+import socket
+import stat
+import tempfile
+import threading
+from typing import List, Optional
+
+from .ansi_renderer import AnsiEncoder
+from .recorder import FrameCopy
+
+
+def default_socket_path() -> str:
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"turkey_invaders-{os.getuid()}.sock")
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a socket left behind by a previous run, and nothing else.
+
+    Raises if `path` is something other than a socket, or a socket another
+    server still accepts connections on.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, "exists and is not a socket", path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)  # nobody listening: stale
+        return
+    except FileNotFoundError:
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "another spectator server is running", path)
+
+
+class _Viewer:
+    __slots__ = ("sock", "pending", "need_key")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.pending: Optional[memoryview] = None
+        self.need_key = True
+
+    def send(self, data) -> bool:
+        """Send as much as possible; False if the connection is gone."""
+        view = memoryview(data)
+        try:
+            n = self.sock.send(view)
+        except BlockingIOError:
+            n = 0
+        except OSError:
+            return False
+        self.pending = view[n:] if n < len(view) else None
+        return True
+
+    def flush(self) -> bool:
+        if self.pending is None:
+            return True
+        return self.send(self.pending)
+
+
+class SpectatorServer:
+    """Frame sink broadcasting ANSI deltas to viewers on a Unix socket."""
+
+    def __init__(self, path: Optional[str] = None, *, queue_size: int = 4, max_viewers: int = 16) -> None:
+        self.path = path or default_socket_path()
+        self.max_viewers = max_viewers
+        self.frames = 0
+        self.dropped = 0
+        self.keyframes = 0
+        self.viewers: List[_Viewer] = []
+        _remove_stale_socket(self.path)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self._listener.listen(max_viewers)
+        self._listener.setblocking(False)
+        self._free: "queue.Queue[FrameCopy]" = queue.Queue()
+        self._work: "queue.Queue[Optional[FrameCopy]]" = queue.Queue(maxsize=max(1, queue_size) + 1)
+        for _ in range(max(1, queue_size)):
+            self._free.put(FrameCopy())
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="spectator", daemon=True)
+        self._thread.start()
+
+    # --- game thread ---
+    def on_frame(self, frame) -> None:
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            # Writer is behind; its next delta covers this frame's changes
+            self.dropped += 1
+            return
+        buf.load(frame, 0.0)
+        self.frames += 1
+        self._work.put_nowait(buf)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._work.put(None)
+        self._thread.join()
+
+    # --- server thread ---
+    def _run(self) -> None:
+        delta_enc = AnsiEncoder(scale=1, sync=True)
+        key_enc = AnsiEncoder(scale=1, sync=True)
+        sel = selectors.DefaultSelector()
+        sel.register(self._listener, selectors.EVENT_READ)
+        try:
+            while True:
+                try:
+                    buf = self._work.get(timeout=0.05)
+                except queue.Empty:
+                    buf = False
+                if buf is None:
+                    break
+                if sel.select(0):
+                    self._accept()
+                if buf is False:
+                    self._drain()
+                    continue
+                try:
+                    self._broadcast(buf, delta_enc, key_enc)
+                finally:
+                    self._free.put(buf)
+        finally:
+            sel.close()
+            for v in self.viewers:
+                v.sock.close()
+            self.viewers.clear()
+            self._listener.close()
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            if len(self.viewers) >= self.max_viewers:
+                sock.close()
+                continue
+            sock.setblocking(False)
+            self.viewers.append(_Viewer(sock))
+
+    def _drain(self) -> None:
+        self._drop([v for v in self.viewers if not v.flush()])
+
+    def _broadcast(self, buf: FrameCopy, delta_enc: AnsiEncoder, key_enc: AnsiEncoder) -> None:
+        # Always advance the shared delta, even with nobody watching
+        delta = delta_enc.encode(buf.glyphs, buf.attrs, buf.width, buf.height)
+        key = None
+        gone = []
+        for v in self.viewers:
+            if not v.flush():
+                gone.append(v)
+                continue
+            if v.pending is not None:
+                v.need_key = True  # still busy with an older message: skip, resync later
+                continue
+            if v.need_key:
+                if key is None:
+                    key_enc.reset()
+                    key = key_enc.encode(buf.glyphs, buf.attrs, buf.width, buf.height)
+                    self.keyframes += 1
+                v.need_key = False
+                ok = v.send(key)
+            else:
+                ok = v.send(delta) if delta else True
+            if not ok:
+                gone.append(v)
+        self._drop(gone)
+
+    def _drop(self, gone: List[_Viewer]) -> None:
+        for v in gone:
+            v.sock.close()
+            self.viewers.remove(v)
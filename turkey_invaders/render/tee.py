@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Tuple
+
+from .array_renderer import ArrayRenderer
+
+
+class TeeRenderer:
+    """Forwards draw calls to a renderer and mirrors them for frame sinks.
+
+    Every call goes to `inner` unchanged and into an `ArrayRenderer` mirror of
+    the same logical size. On `end_frame` each sink's `on_frame(mirror)` is
+    called; sinks must copy what they need and return quickly (the mirror is
+    cleared at the next `begin_frame`). Works with any renderer backend.
+    """
+
+    def __init__(self, inner, sinks: Iterable = ()) -> None:
+        self.inner = inner
+        self.sinks: List = list(sinks)
+        w, h = inner.get_size()
+        self.mirror = ArrayRenderer(width=w, height=h, scale=getattr(inner, "scale", 1))
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.inner.get_size()
+
+    def begin_frame(self) -> None:
+        self.inner.begin_frame()
+        w, h = self.inner.get_size()
+        self.mirror.resize(w, h)
+        self.mirror.begin_frame()
+
+    def draw_text(self, x: int, y: int, text: str, color_pair: int | None = None, bold: bool = False) -> None:
+        self.inner.draw_text(x, y, text, color_pair=color_pair, bold=bold)
+        self.mirror.draw_text(x, y, text, color_pair=color_pair, bold=bold)
+
+    def end_frame(self) -> None:
+        self.inner.end_frame()
+        self.mirror.end_frame()
+        for sink in self.sinks:
+            sink.on_frame(self.mirror)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
@@ -0,0 +1,268 @@
+"""Renderer throughput benchmark: `python -m turkey_invaders.renderbench`.
+
+Records endless-mode gameplay frames once per logical screen size (the draw
+calls a `GameplayScene` makes, with the soak test's scripted player), then
+replays the same frames through each backend for every terminal size and
+scale:
+
+- curses: `CursesRenderer` on a `FakeScreen`, so no TTY is needed
+- stdout: `StdoutRenderer` with stdout captured
+- ansi: `AnsiRenderer` with its writes captured
+- array: `ArrayRenderer` (draw cost only, nothing is sent anywhere)
+
+Each case reports microseconds per frame (best of `--repeat` passes),
+bytes per frame that would reach the terminal, and for curses the
+`addnstr` calls per frame. `--save` writes the results as JSON;
+`--baseline` compares against such a file and exits 1 when a case got
+slower or chattier by more than `--threshold` (and, for time, by more than
+`--min-us`, so sub-microsecond jitter never fails a run).
+
+    python -m turkey_invaders.renderbench --save bench.json
+    python -m turkey_invaders.renderbench --baseline bench.json --threshold 0.25
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import platform
+import signal
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import Config
+from .render.ansi_renderer import AnsiRenderer
+from .render.array_renderer import ArrayRenderer
+from .render.curses_renderer import CursesRenderer
+from .render.fakescreen import FakeScreen
+from .render.stdout_renderer import StdoutRenderer
+from .scenes.gameplay import GameplayScene
+from .soak import scripted_action
+
+
+BACKENDS = ("curses", "stdout", "ansi", "array")
+SIZES = ((80, 24), (160, 50), (300, 100))
+SCALES = (1, 2, 3, 4)
+
+# One draw_text call: x, y, text, color_pair, bold
+Call = Tuple[int, int, str, Optional[int], bool]
+
+
+class CallRecorder:
+    """Renderer that keeps every frame's draw calls for later replay."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.frames: List[List[Call]] = []
+        self._frame: List[Call] = []
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def begin_frame(self) -> None:
+        self._frame = []
+
+    def draw_text(self, x: int, y: int, text: str, color_pair: int | None = None, bold: bool = False) -> None:
+        self._frame.append((x, y, text, color_pair, bold))
+
+    def end_frame(self) -> None:
+        self.frames.append(self._frame)
+
+
+def record_frames(width: int, height: int, frames: int, *, seed: int = 1, fps: int = 60) -> List[List[Call]]:
+    """Draw calls of `frames` ticks of endless gameplay at a logical size."""
+    scene = GameplayScene(Config(), endless=True)
+    scene.spawner.reset(seed)
+    # Particle effects draw from their own RNG; pin it so runs are comparable
+    scene._particles._rng.seed(seed)
+    rec = CallRecorder(width, height)
+    dt = 1.0 / fps
+    for _ in range(frames):
+        if scene.player is not None:
+            # Refill before the update: a hit costs one life at most per tick
+            # (invulnerability), so the scene never reaches game over, which
+            # would record a score and tear down the particle subscription
+            scene.player.lives = 3
+            scene.handle_actions(scripted_action(scene))
+        scene.update(dt)
+        if scene.next_scene is not None:
+            raise RuntimeError("benchmark gameplay left the scene")
+        rec.begin_frame()
+        scene.render(rec)
+        rec.end_frame()
+    scene._close()
+    return rec.frames
+
+
+class _ByteCounter:
+    """File-like sink (for stdout) and write callback (for ansi) that counts bytes."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    def write(self, data) -> int:
+        self.bytes += len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class _FakeTerm:
+    def __init__(self, cols: int, rows: int) -> None:
+        self.cols, self.rows = cols, rows
+
+    def size(self) -> Tuple[int, int]:
+        return self.cols, self.rows
+
+    def write(self, data: bytes) -> None:  # noqa: ARG002
+        pass
+
+
+def _make_backend(name: str, cols: int, rows: int, scale: int):
+    """(renderer, counters() -> (bytes, calls), stdout replacement or None)."""
+    if name == "curses":
+        screen = FakeScreen(cols, rows)
+        return CursesRenderer(screen, scale=scale), lambda: (screen.bytes, screen.calls), None
+    if name == "stdout":
+        out = _ByteCounter()
+        r = StdoutRenderer(width=cols // scale, height=rows // scale, scale=scale)
+        return r, lambda: (out.bytes, None), out
+    if name == "ansi":
+        out = _ByteCounter()
+        r = AnsiRenderer(_FakeTerm(cols, rows), scale=scale, write=out.write)
+        return r, lambda: (out.bytes, None), None
+    if name == "array":
+        r = ArrayRenderer(width=max(1, cols // scale), height=max(1, rows // scale), scale=scale)
+        return r, lambda: (0, None), None
+    raise ValueError(f"unknown backend {name!r}")
+
+
+def bench_case(name: str, frames: Sequence[List[Call]], cols: int, rows: int, scale: int,
+               repeat: int = 3) -> Dict[str, Any]:
+    """Replay `frames` through a fresh backend `repeat` times; best time wins."""
+    clock = time.perf_counter
+    best = float("inf")
+    sent = calls = None
+    for _ in range(max(1, repeat)):
+        r, counters, sink = _make_backend(name, cols, rows, scale)
+        with contextlib.redirect_stdout(sink) if sink is not None else contextlib.nullcontext():
+            t0 = clock()
+            for frame in frames:
+                r.begin_frame()
+                for x, y, text, pair, bold in frame:
+                    r.draw_text(x, y, text, color_pair=pair, bold=bold)
+                r.end_frame()
+            best = min(best, clock() - t0)
+        sent, calls = counters()
+    n = max(1, len(frames))
+    return {
+        "backend": name,
+        "size": f"{cols}x{rows}",
+        "scale": scale,
+        "us_frame": round(best * 1e6 / n, 2),
+        "bytes_frame": round(sent / n, 1),
+        "calls_frame": None if calls is None else round(calls / n, 1),
+    }
+
+
+def run(*, backends: Sequence[str] = BACKENDS, sizes: Sequence[Tuple[int, int]] = SIZES,
+        scales: Sequence[int] = SCALES, frames: int = 200, repeat: int = 3, seed: int = 1,
+        echo=None) -> List[Dict[str, Any]]:
+    recorded: Dict[Tuple[int, int], List[List[Call]]] = {}
+    results: List[Dict[str, Any]] = []
+    # AnsiRenderer installs a SIGWINCH handler; put the previous one back
+    winch = getattr(signal, "SIGWINCH", None)
+    saved = signal.getsignal(winch) if winch is not None else None
+    try:
+        for cols, rows in sizes:
+            for scale in scales:
+                logical = (max(1, cols // scale), max(1, rows // scale))
+                if logical not in recorded:
+                    recorded[logical] = record_frames(*logical, frames, seed=seed)
+                for name in backends:
+                    res = bench_case(name, recorded[logical], cols, rows, scale, repeat)
+                    results.append(res)
+                    if echo is not None:
+                        print(_format(res), file=echo, flush=True)
+    finally:
+        if winch is not None:
+            signal.signal(winch, saved)
+    return results
+
+
+def _key(res: Dict[str, Any]) -> str:
+    return f"{res['backend']} {res['size']} x{res['scale']}"
+
+
+def _format(res: Dict[str, Any]) -> str:
+    calls = "" if res["calls_frame"] is None else f"  {res['calls_frame']:>7} calls"
+    return f"{_key(res):<22} {res['us_frame']:>10.1f} us/frame  {res['bytes_frame']:>9.1f} B/frame{calls}"
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], *,
+            threshold: float = 0.25, min_us: float = 20.0) -> List[str]:
+    """Regressions of `results` against `baseline`, one message per case."""
+    base = {_key(b): b for b in baseline}
+    out: List[str] = []
+    for res in results:
+        b = base.get(_key(res))
+        if b is None:
+            continue
+        rise = res["us_frame"] - b["us_frame"]
+        if rise > min_us and rise > threshold * b["us_frame"]:
+            out.append(f"{_key(res)}: {b['us_frame']} -> {res['us_frame']} us/frame")
+        if res["bytes_frame"] > b["bytes_frame"] * (1.0 + threshold):
+            out.append(f"{_key(res)}: {b['bytes_frame']} -> {res['bytes_frame']} B/frame")
+    return out
+
+
+def _parse_sizes(text: str) -> List[Tuple[int, int]]:
+    sizes = []
+    for part in text.split(","):
+        w, _, h = part.strip().lower().partition("x")
+        sizes.append((int(w), int(h)))
+    return sizes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m turkey_invaders.renderbench",
+                                 description="Replay recorded gameplay frames through the renderers.")
+    ap.add_argument("--backends", default=",".join(BACKENDS), help="comma-separated subset of " + ", ".join(BACKENDS))
+    ap.add_argument("--sizes", default=",".join(f"{w}x{h}" for w, h in SIZES), help="terminal sizes, e.g. 80x24,300x100")
+    ap.add_argument("--scales", default=",".join(map(str, SCALES)))
+    ap.add_argument("--frames", type=int, default=200, help="gameplay frames recorded per logical size")
+    ap.add_argument("--repeat", type=int, default=3, help="passes per case; the fastest counts")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    ap.add_argument("--baseline", metavar="PATH", help="results JSON to compare against")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed fractional rise over the baseline")
+    ap.add_argument("--min-us", type=float, default=20.0, help="time rises below this never count")
+    args = ap.parse_args(argv)
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    for b in backends:
+        if b not in BACKENDS:
+            ap.error(f"unknown backend {b!r}")
+    results = run(backends=backends, sizes=_parse_sizes(args.sizes),
+                  scales=[max(1, int(s)) for s in args.scales.split(",")],
+                  frames=max(1, args.frames), repeat=args.repeat, seed=args.seed, echo=sys.stdout)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "platform": platform.platform(),
+                       "frames": args.frames, "results": results}, f, indent=1)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, threshold=args.threshold, min_us=args.min_us)
+    for msg in regressions:
+        print("REGRESSION", msg)
+    print("FAIL" if regressions else "PASS")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+"""Seekable replay archives for `Simulation` sessions.
+
+A replay stores the input stream, not frames: the simulation is
+deterministic, so a run is rebuilt from its start state and actions. To make
+random access cheap, the file also stores compressed full snapshots
+(keyframes) and an index of them at the end. A keyframe is written every
+`keyframe_every` ticks, or sooner once the entity updates simulated since
+the last one reach `keyframe_work`, so that a seek replays about the same
+amount of work late in a busy endless run as early in a quiet one.
+
+Layout (little-endian, v3):
+    header   magic "TIRP", u16 version, u16 flags (bit 0: endless), u16 width,
+             u16 height, u16 fps, u16 reserved, f64 power/bomb drop rates,
+             u32 max keyframe interval, u16 length + UTF-8 waves path ("" = default)
+    blocks   u8 type + varint payload length + payload:
+               'K' keyframe: varint tick, then a zlib-compressed
+                   `Simulation.snapshot()` blob
+               'A' actions for the ticks after the preceding keyframe, as
+                   varint (action mask, run length) pairs
+    index    (u64 tick, u64 offset of the 'K' block) per keyframe
+    trailer  u64 index offset, u32 keyframe count, u64 total ticks, "TIRX"
+
+`ReplayReader` maps the file with `mmap`, bisects the index for the nearest
+keyframe at or before the requested tick, restores it and simulates only the
+ticks in between. A file without a trailer (writer killed mid-run) is still
+readable: the blocks are scanned to rebuild the index.
+
+    python -m turkey_invaders.replay record run.tirp --ticks 216000
+    python -m turkey_invaders.replay seek run.tirp 144000
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import mmap
+import random
+import struct
+import sys
+import time
+import zlib
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from .core.actions import GAMEPLAY_MASK
+from .simulation import Simulation
+
+
+MAGIC = b"TIRP"
+TRAILER_MAGIC = b"TIRX"
+VERSION = 3  # v2: fixed-point kinematics, v3: finer fixed-point unit (older runs no longer reproduce)
+FLAG_ENDLESS = 1
+
+_HEADER = struct.Struct("<4sHHHHHHddIH")
+_INDEX_ENTRY = struct.Struct("<QQ")
+_TRAILER = struct.Struct("<QIQ4s")
+
+BLOCK_KEYFRAME = ord("K")
+BLOCK_ACTIONS = ord("A")
+
+# Entity updates between keyframes; well under 0.1 s to replay on a desktop CPU
+DEFAULT_KEYFRAME_WORK = 40000
+
+# Observation code -> glyph, for printing frames
+_GLYPHS = " ^U|!PB"
+
+
+class ReplayError(ValueError):
+    """Raised for files that are not replays this version can read."""
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(buf, pos: int) -> Tuple[int, int]:
+    """Decode one varint at `pos`; returns (value, next position)."""
+    result = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+class ReplayWriter:
+    """Records a session; call `record(action)` right before `sim.step(action)`."""
+
+    def __init__(self, path: str, sim: Simulation, *, keyframe_every: int = 600,
+                 keyframe_work: int = DEFAULT_KEYFRAME_WORK) -> None:
+        self.sim = sim
+        self.keyframe_every = max(1, int(keyframe_every))
+        self.keyframe_work = max(1, int(keyframe_work))
+        self.ticks = 0
+        self._work = 0
+        self._f: BinaryIO = open(path, "wb")
+        self._offset = 0
+        self._index: List[Tuple[int, int]] = []
+        self._runs = bytearray()
+        self._run_action = -1
+        self._run_len = 0
+        self._last_tick: Optional[int] = None
+        waves = (sim.waves_path or "").encode("utf-8")
+        flags = FLAG_ENDLESS if sim.endless else 0
+        fps = int(round(1.0 / sim.dt))
+        self._emit(_HEADER.pack(MAGIC, VERSION, flags, sim.width, sim.height, fps, 0,
+                                sim.p_power, sim.p_bomb, self.keyframe_every, len(waves)) + waves)
+
+    def record(self, action: int) -> None:
+        """Log `action` for the current tick; an `Input.poll()` mask is fine.
+
+        Only the gameplay bits are kept, so menu keys do not break runs.
+        """
+        action = int(action) & GAMEPLAY_MASK
+        tick = self.sim.tick
+        if self._last_tick is not None and tick != self._last_tick + 1:
+            raise ReplayError(f"non-consecutive tick {tick} after {self._last_tick}")
+        self._last_tick = tick
+        if (not self._index or tick - self._index[-1][0] >= self.keyframe_every
+                or self._work >= self.keyframe_work):
+            self._flush_actions()
+            self._keyframe(tick)
+            self._work = 0
+        self._work += len(self.sim.world.entities)
+        if action == self._run_action:
+            self._run_len += 1
+        else:
+            self._end_run()
+            self._run_action = action
+            self._run_len = 1
+        self.ticks = tick + 1
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        self._flush_actions()
+        index_offset = self._offset
+        self._emit(b"".join(_INDEX_ENTRY.pack(t, o) for t, o in self._index))
+        self._emit(_TRAILER.pack(index_offset, len(self._index), self.ticks, TRAILER_MAGIC))
+        self._f.close()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _keyframe(self, tick: int) -> None:
+        payload = bytearray()
+        write_varint(payload, tick)
+        payload += zlib.compress(self.sim.snapshot(), 1)
+        self._index.append((tick, self._offset))
+        self._block(BLOCK_KEYFRAME, payload)
+
+    def _end_run(self) -> None:
+        if self._run_len:
+            write_varint(self._runs, self._run_action)
+            write_varint(self._runs, self._run_len)
+        self._run_len = 0
+
+    def _flush_actions(self) -> None:
+        self._end_run()
+        self._run_action = -1
+        if self._runs:
+            self._block(BLOCK_ACTIONS, self._runs)
+            self._runs = bytearray()
+
+    def _block(self, kind: int, payload) -> None:
+        head = bytearray((kind,))
+        write_varint(head, len(payload))
+        self._emit(bytes(head))
+        self._emit(bytes(payload))
+
+    def _emit(self, data: bytes) -> None:
+        self._f.write(data)
+        self._offset += len(data)
+
+
+class ReplayReader:
+    """Random access to a replay through a read-only memory map."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self._mm
+        if len(mm) < _HEADER.size or mm[:4] != MAGIC:
+            self.close()
+            raise ReplayError("not a Turkey Invaders replay")
+        (_, version, flags, width, height, fps, _, p_power, p_bomb,
+         self.keyframe_every, path_len) = _HEADER.unpack_from(mm, 0)
+        if version != VERSION:
+            self.close()
+            raise ReplayError(f"unsupported replay version {version}")
+        self._body = _HEADER.size + path_len
+        self.waves_path = bytes(mm[_HEADER.size:self._body]).decode("utf-8") or None
+        self.endless = bool(flags & FLAG_ENDLESS)
+        self.sim = Simulation(width=width, height=height, fps=fps, waves_path=self.waves_path,
+                              drops={"power": p_power, "bomb": p_bomb}, endless=self.endless)
+        self.complete = self._read_trailer()
+        if not self.complete:
+            self._scan()
+        self._kf_ticks = [t for t, _ in self._index]
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "ReplayReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def keyframes(self) -> int:
+        return len(self._index)
+
+    def seek(self, tick: int) -> Simulation:
+        """Simulation state just before the action of `tick` (0 <= tick <= ticks).
+
+        The returned Simulation belongs to the reader and is reused by the
+        next seek; do not step it yourself.
+        """
+        if not 0 <= tick <= self.ticks:
+            raise IndexError(f"tick {tick} outside 0..{self.ticks}")
+        sim = self.sim
+        k = bisect.bisect_right(self._kf_ticks, tick) - 1
+        kf_tick = self._kf_ticks[k]
+        # Stepping on from the current state beats a restore if it is closer
+        if not (kf_tick <= sim.tick <= tick and self._loaded):
+            sim.restore(self._snapshot(k))
+            self._loaded = True
+        for action in self._actions_from(k, sim.tick, tick):
+            sim.step(action)
+        return sim
+
+    def actions(self, start: int = 0, stop: Optional[int] = None) -> Iterator[int]:
+        """Decoded action masks for ticks start..stop-1."""
+        stop = self.ticks if stop is None else min(stop, self.ticks)
+        k = bisect.bisect_right(self._kf_ticks, start) - 1
+        while start < stop and k < len(self._index):
+            end = self._kf_ticks[k + 1] if k + 1 < len(self._index) else self.ticks
+            yield from self._actions_from(k, start, min(stop, end))
+            start = end
+            k += 1
+
+    # --- internals ---
+    _loaded = False
+
+    def _read_trailer(self) -> bool:
+        mm = self._mm
+        if len(mm) < self._body + _TRAILER.size:
+            return False
+        index_offset, count, ticks, magic = _TRAILER.unpack_from(mm, len(mm) - _TRAILER.size)
+        if magic != TRAILER_MAGIC or index_offset + count * _INDEX_ENTRY.size != len(mm) - _TRAILER.size:
+            return False
+        self._index = [_INDEX_ENTRY.unpack_from(mm, index_offset + i * _INDEX_ENTRY.size) for i in range(count)]
+        self._end = index_offset
+        self.ticks = ticks
+        return bool(count)
+
+    def _scan(self) -> None:
+        # No usable trailer: walk the blocks, stopping at a truncated one
+        mm = self._mm
+        pos, end = self._body, len(mm)
+        index: List[Tuple[int, int]] = []
+        ticks = 0
+        try:
+            while pos < end:
+                kind = mm[pos]
+                size, data = read_varint(mm, pos + 1)
+                if data + size > end or kind not in (BLOCK_KEYFRAME, BLOCK_ACTIONS):
+                    break
+                if kind == BLOCK_KEYFRAME:
+                    tick, _ = read_varint(mm, data)
+                    index.append((tick, pos))
+                    ticks = tick
+                else:
+                    p = data
+                    while p < data + size:
+                        _, p = read_varint(mm, p)
+                        run, p = read_varint(mm, p)
+                        ticks += run
+                pos = data + size
+        except IndexError:
+            pass
+        if not index:
+            self.close()
+            raise ReplayError("replay has no keyframes")
+        self._index = index
+        self._end = pos
+        self.ticks = ticks
+
+    def _block_at(self, offset: int) -> Tuple[int, int, int]:
+        kind = self._mm[offset]
+        size, data = read_varint(self._mm, offset + 1)
+        return kind, data, data + size
+
+    def _snapshot(self, k: int) -> bytes:
+        _, data, end = self._block_at(self._index[k][1])
+        _, start = read_varint(self._mm, data)
+        return zlib.decompress(self._mm[start:end])
+
+    def _actions_from(self, k: int, start: int, stop: int) -> Iterator[int]:
+        """Actions for ticks [start, stop) inside keyframe k's segment."""
+        if start >= stop:
+            return
+        _, _, pos = self._block_at(self._index[k][1])
+        if pos >= self._end:
+            return
+        kind, p, end = self._block_at(pos)
+        if kind != BLOCK_ACTIONS:
+            return
+        mm = self._mm
+        tick = self._kf_ticks[k]
+        while p < end and tick < stop:
+            action, p = read_varint(mm, p)
+            run, p = read_varint(mm, p)
+            lo, hi = max(tick, start), min(tick + run, stop)
+            for _ in range(hi - lo):
+                yield action
+            tick += run
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m turkey_invaders.replay", description="Record or seek replays.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    rec = sub.add_parser("record", help="record a session with random actions")
+    rec.add_argument("path")
+    rec.add_argument("--ticks", type=int, default=216000, help="default: one hour at 60 fps")
+    rec.add_argument("--seed", type=int, default=1)
+    rec.add_argument("--keyframe-every", type=int, default=600, help="max ticks between keyframes")
+    rec.add_argument("--keyframe-work", type=int, default=DEFAULT_KEYFRAME_WORK,
+                     help="entity updates between keyframes")
+    rec.add_argument("--endless", action="store_true")
+    seek = sub.add_parser("seek", help="jump to a tick and print the frame")
+    seek.add_argument("path")
+    seek.add_argument("tick", type=int)
+    args = ap.parse_args(argv)
+
+    if args.cmd == "record":
+        sim = Simulation(endless=args.endless)
+        sim.reset(args.seed)
+        rng = random.Random(args.seed)
+        action = 0
+        with ReplayWriter(args.path, sim, keyframe_every=args.keyframe_every,
+                          keyframe_work=args.keyframe_work) as rec_:
+            for _ in range(args.ticks):
+                if rng.random() < 0.1:  # hold inputs for a while, like a person
+                    action = rng.randrange(64)
+                rec_.record(action)
+                sim.step(action)
+        print(f"recorded {args.ticks} ticks to {args.path}")
+        return 0
+
+    with ReplayReader(args.path) as replay:
+        start = time.perf_counter()
+        sim = replay.seek(args.tick)
+        elapsed = time.perf_counter() - start
+        w = sim.width
+        for y in range(sim.height):
+            print("".join(_GLYPHS[c] for c in sim.obs[y * w:(y + 1) * w]).rstrip())
+        print(f"tick {sim.tick}/{replay.ticks} score {sim.score} lives {sim.player.lives} "
+              f"({replay.keyframes} keyframes, seek {elapsed * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from typing import Iterable
-
 
 class Scene:
     """Base scene interface.
 
     Subclasses set `next_scene` to transition, or `exit_program = True` to quit.
+    The loop sets `low_detail` when rendering is over budget; scenes should
+    then skip non-essential decoration.
     """
 
     def __init__(self) -> None:
         self.next_scene = None
         self.exit_program = False
+        self.low_detail = False
+
+    def enter(self) -> None:
+        """Prepare a reused scene instance to be shown again."""
+        self.next_scene = None
+        self.exit_program = False
 
-    def handle_actions(self, actions: Iterable[str]) -> None:  # noqa: D401
-        """Consume per-frame action list."""
+    def handle_actions(self, actions: int) -> None:  # noqa: D401
+        """Consume the per-frame action bitmask (see `core.actions`)."""
         pass
 
     def update(self, dt: float) -> None:  # noqa: D401
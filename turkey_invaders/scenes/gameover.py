@@ -1,21 +1,50 @@
 from __future__ import annotations
 
+import sqlite3
+from typing import List, Optional
+
 from .base import Scene
+from ..core.actions import FIRE, QUIT, START
+from ..leaderboard import Leaderboard, ScoreEntry
 
 
 class GameOverScene(Scene):
-    def __init__(self, score: int) -> None:
+    def __init__(self, score: int, *, seed: Optional[int] = None, wave: int = 0,
+                 wave_pack: str = "default") -> None:
         super().__init__()
         self.score = score
+        self.seed = seed
+        self.wave = wave
+        self.wave_pack = wave_pack
+        self.top: List[ScoreEntry] = []
+
+    def record(self, path: Optional[str] = None) -> None:
+        """Save the score to the leaderboard and load the top 5 for this pack."""
+        # The leaderboard is best effort: a locked or unwritable store must not end the game
+        try:
+            with Leaderboard(path) as board:
+                board.add(self.score, seed=self.seed, wave=self.wave, wave_pack=self.wave_pack)
+                self.top = board.top(5, wave_pack=self.wave_pack)
+        except (sqlite3.Error, OSError):
+            self.top = []
 
     def handle_actions(self, actions):
-        if 'quit' in actions or 'start' in actions or 'fire' in actions:
+        if actions & (QUIT | START | FIRE):
             self.exit_program = True
 
     def render(self, r) -> None:
         w, h = r.get_size()
+        top_y = h // 2 - 1 - (len(self.top) + 1 if self.top else 0) // 2
         title = "Game Over"
-        r.draw_text(max(0, w // 2 - len(title) // 2), h // 2 - 1, title, color_pair=3, bold=True)
+        r.draw_text(max(0, w // 2 - len(title) // 2), top_y, title, color_pair=3, bold=True)
         msg = f"Score: {self.score}"
-        r.draw_text(max(0, w // 2 - len(msg) // 2), h // 2 + 0, msg)
-        r.draw_text(max(0, w // 2 - 11), h // 2 + 2, "Press Q to exit")
+        r.draw_text(max(0, w // 2 - len(msg) // 2), top_y + 1, msg)
+        y = top_y + 3
+        if self.top:
+            head = "High Scores"
+            r.draw_text(max(0, w // 2 - len(head) // 2), y, head, color_pair=1, bold=True)
+            for i, e in enumerate(self.top, start=1):
+                line = f"{i}. {e.score:>7}  wave {e.wave + 1}"
+                r.draw_text(max(0, w // 2 - len(line) // 2), y + i, line)
+            y += len(self.top) + 2
+        r.draw_text(max(0, w // 2 - 7), y, "Press Q to exit")
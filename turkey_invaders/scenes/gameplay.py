@@ -2,29 +2,52 @@ from __future__ import annotations
 
 from .base import Scene
 from .gameover import GameOverScene
+from ..assets import registry
+from ..core.actions import BOMB, DOWN, FIRE, HELP, LEFT, PAUSE, QUIT, RIGHT, UP
+from ..core.camera import Camera
+from ..core.spatial import SpatialGrid
 from ..core.world import World
+from ..render.compositor import RowCompositor
+from ..render.particles import ParticleSystem
 from ..entities.player import Player
-from ..entities.projectile import Projectile
-from ..entities.powerup import PowerUp
+from ..systems.activity import ActivityZones
 from ..systems.collision import resolve_collisions
+from ..systems.parallel import EntityUpdater
+from ..systems.scoring import award_kills
+from ..systems.snapshot import restore, snapshot
 from ..systems.spawner import Spawner
+from ..systems.wavegen import EndlessWaves
 from ..config import Config
 
 
 class GameplayScene(Scene):
     """Gameplay with entities, collisions, and a basic spawner."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, *, endless: bool = False) -> None:
         super().__init__()
         self.world = World()
         self.player: Player | None = None
-        self.spawner: Spawner | None = None
+        # Wave pack comes from the asset registry (preloaded by the menu);
+        # endless mode keeps its seed but generates waves procedurally
+        waves = EndlessWaves() if endless else None
+        self.spawner: Spawner | None = Spawner(self.world, pack=registry.wave_pack(), waves=waves)
         self.score = 0
         self.paused = False
         self.help_open = False
         self._was_paused = False
         self._bomb_flash = 0.0
+        self._layer = RowCompositor()
+        # Explosion debris etc. is fed by gameplay events and never enters the World
+        self._particles = ParticleSystem()
+        self.world.events.subscribe(self._particles.on_events)
+        self._updater = EntityUpdater(config.workers)
+        # Worlds larger than the screen scroll; zones are set up on first render
+        self._camera = Camera()
+        self._zones: ActivityZones | None = None
         self.config = config
+        # Drop rates cannot change mid-game (Options is only reachable from the menu)
+        self._p_power = float(config.drops.get('power', 0.20))
+        self._p_bomb = float(config.drops.get('bomb', 0.05))
         # per-frame movement intent (-1, 0, +1) for dt-based motion
         self._intent_x = 0
         self._intent_y = 0
@@ -32,16 +55,35 @@ class GameplayScene(Scene):
     def _ensure_initialized(self, w: int, h: int) -> None:
         if self.player is not None:
             return
-        self.world.width = w
-        self.world.height = h
-        self.player = Player(self.world.next_id(), x=w // 2, y=h - 2)
-        self.world.player = self.player
-        self.world.add(self.player)
-        self.spawner = Spawner(self.world)
+        world = self.world
+        if world.width > w or world.height > h:
+            # Scrolling stage: index entities, update only those near the camera
+            world.attach_index(SpatialGrid())
+            self._zones = ActivityZones()
+        self.player = Player(world.next_id(), x=world.width // 2, y=world.height - 2)
+        world.player = self.player
+        world.add(self.player)
+
+    def snapshot(self) -> bytes:
+        """Binary snapshot of world, spawner and score (for rewind/crash dumps)."""
+        if self.player is None:
+            raise RuntimeError("gameplay not initialized yet")
+        return snapshot(self.world, self.spawner, score=self.score, bomb_flash=self._bomb_flash)
+
+    def restore(self, data: bytes) -> None:
+        """Replace the running game with a state produced by `snapshot()`."""
+        state = restore(data, self.spawner)
+        self.world = state.world
+        self.player = state.world.player
+        self.score = state.score
+        self._bomb_flash = state.bomb_flash
+        self._particles.clear()
+        if self._zones is not None:
+            self.world.attach_index(SpatialGrid())
 
     def handle_actions(self, actions):
         # Toggle help overlay (pauses game while open)
-        if 'help' in actions:
+        if actions & HELP:
             if not self.help_open:
                 self._was_paused = self.paused
                 self.paused = True
@@ -50,13 +92,14 @@ class GameplayScene(Scene):
                 self.help_open = False
                 self.paused = self._was_paused
             return
-        if 'quit' in actions and self.paused:
+        if actions & QUIT and self.paused:
             # from pause, quit back to menu
             # Lazy import to avoid circular import with menu -> gameplay
             from .menu import MenuScene  # type: ignore
-            self.next_scene = MenuScene(config=self.config)
+            self._close()
+            self.next_scene = MenuScene.shared(self.config)
             return
-        if 'pause' in actions:
+        if actions & PAUSE:
             self.paused = not self.paused
             return
         if self.paused:
@@ -64,46 +107,18 @@ class GameplayScene(Scene):
         if self.player is None:
             return
         # Movement: record intent; applied during update(dt)
-        ix = 0
-        iy = 0
-        if 'left' in actions:
-            ix -= 1
-        if 'right' in actions:
-            ix += 1
-        if 'up' in actions:
-            iy -= 1
-        if 'down' in actions:
-            iy += 1
-        self._intent_x = ix
-        self._intent_y = iy
+        self._intent_x = (1 if actions & RIGHT else 0) - (1 if actions & LEFT else 0)
+        self._intent_y = (1 if actions & DOWN else 0) - (1 if actions & UP else 0)
         # Fire
-        if 'fire' in actions and self.player.can_fire():
-            self.player.did_fire()
-            # Fire pattern based on power (0:1, 1:2, >=2:3)
-            xs: list[int]
-            if self.player.power <= 0:
-                xs = [self.player.x]
-            elif self.player.power == 1:
-                xs = [self.player.x - 1, self.player.x + 1]
-            else:
-                xs = [self.player.x - 1, self.player.x, self.player.x + 1]
-            for x in xs:
-                x = max(1, min(self.world.width - 2, x))
-                pid = self.world.next_id()
-                self.world.add(Projectile(pid, x, self.player.y - 1, owner="player", vy=-18.0))
+        if actions & FIRE and self.player.can_fire():
+            self.player.fire(self.world)
         # Bomb clears enemy bullets; only consumes a bomb if something was cleared
-        if 'bomb' in actions and self.player and getattr(self.player, 'bombs', 0) > 0:
-            cleared = 0
-            for p in list(self.world.by_kind.get('proj_enemy', [])):
-                if p.alive:
-                    p.alive = False
-                    cleared += 1
-            if cleared > 0:
-                self.player.bombs -= 1
-                self._bomb_flash = 0.6
+        if actions & BOMB and self.player.use_bomb(self.world):
+            self._bomb_flash = 0.6
 
     def update(self, dt: float) -> None:
-        if self.paused:
+        # Nothing to simulate until the first render sizes the world
+        if self.paused or self.player is None:
             return
         if self._bomb_flash > 0:
             self._bomb_flash = max(0.0, self._bomb_flash - dt)
@@ -114,9 +129,14 @@ class GameplayScene(Scene):
         # Reset intent for next frame
         self._intent_x = 0
         self._intent_y = 0
-        # Update entities
-        for e in list(self.world.entities):
-            e.update(dt, self.world)
+        # Update entities (serially, or chunked across worker threads); on a
+        # scrolling stage only those near the view, and far ones less often
+        if self._zones is None:
+            self._updater.update(self.world, dt)
+        else:
+            cam, world = self._camera, self.world
+            cam.follow(self.player.x, self.player.y, cam.width, cam.height, world.width, world.height)
+            self._zones.update(world, self._updater, cam, dt)
 
         # Spawner
         if self.spawner:
@@ -126,31 +146,39 @@ class GameplayScene(Scene):
         resolve_collisions(self.world)
 
         # Scoring, drops, and cleanup: enemies that died -> score and occasional drops
-        for e in list(self.world.by_kind.get("enemy", [])):
-            if not e.alive:
-                self.score += 10
-                # Drops based on config
-                rng = self.spawner.rng if self.spawner else None
-                roll = rng.random() if rng else 0.0
-                p_power = float(self.config.drops.get('power', 0.20))
-                p_bomb = float(self.config.drops.get('bomb', 0.05))
-                if roll < p_power:
-                    kid = self.world.next_id()
-                    self.world.add(PowerUp(kid, e.x, e.y, kind='power'))
-                elif roll < p_power + p_bomb:
-                    kid = self.world.next_id()
-                    self.world.add(PowerUp(kid, e.x, e.y, kind='bomb'))
+        rng = self.spawner.rng if self.spawner else None
+        self.score += award_kills(self.world, rng, self._p_power, self._p_bomb)
         self.world.remove_dead()
+        self.world.events.end_tick()
+        self._particles.update(dt)
 
         # Lives / game over
         if self.player and self.player.lives <= 0:
-            self.next_scene = GameOverScene(self.score)
+            sp = self.spawner
+            self._close()
+            over = GameOverScene(
+                self.score,
+                seed=sp.seed if sp else None,
+                wave=sp.wave_index if sp else 0,
+                wave_pack=sp.pack if sp else "default",
+            )
+            over.record()
+            self.next_scene = over
+
+    def _close(self) -> None:
+        """Release the worker pool and event subscription when leaving the game."""
+        self._updater.close()
+        self.world.events.unsubscribe(self._particles.on_events)
 
     def render(self, r) -> None:
         w, h = r.get_size()
-        self.world.width = w
-        self.world.height = h
+        world_w, world_h = self.config.world_size
+        world = self.world
+        world.width = max(w, world_w)
+        world.height = max(h, world_h)
         self._ensure_initialized(w, h)
+        cam = self._camera
+        cam.follow(self.player.x, self.player.y, w, h, world.width, world.height)
 
         # HUD
         wave_id = self.spawner.current_id() if self.spawner else ""
@@ -159,14 +187,19 @@ class GameplayScene(Scene):
         r.draw_text(max(0, w // 2 - 5), 0, f"Wave: {wave_id}", color_pair=1)
         r.draw_text(w - 14, 0, f"Lives: {lives}", color_pair=1)
 
-        # Borders
-        r.draw_text(0, 1, "-" * w)
-        r.draw_text(0, h - 1, "-" * w)
-
-        # Draw entities
-        for e in self.world.entities:
-            ch, color, bold = e.sprite()
-            r.draw_text(e.x, e.y, ch, color_pair=color, bold=bold)
+        # Borders and entities are composited per row, then drawn in runs
+        layer = self._layer
+        # Row 0 is the HUD; a scrolled playfield must not composite over it
+        layer.begin(w, h, top=1)
+        if not self.low_detail:
+            layer.put(0, 1 - cam.y, "-" * w)
+            layer.put(0, world.height - 1 - cam.y, "-" * w)
+            layer.draw_particles(self._particles, cam.x, cam.y)
+        if world.index is not None:
+            layer.draw_entities(world.index.query(*cam.rect()), cam.x, cam.y)
+        else:
+            layer.draw_entities(world.entities, cam.x, cam.y)
+        layer.flush(r)
 
         # HUD extras
         if self.player:
@@ -175,7 +208,7 @@ class GameplayScene(Scene):
             r.draw_text(w - 16, 0, f"Bombs: {getattr(self.player, 'bombs', 0)}", color_pair=1)
 
         # Bomb flash overlay
-        if self._bomb_flash > 0:
+        if self._bomb_flash > 0 and not self.low_detail:
             msg = "BOMB!"
             r.draw_text(max(0, w // 2 - len(msg) // 2), max(1, h // 2 - 1), msg, color_pair=1, bold=True)
 
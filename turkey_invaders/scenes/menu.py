@@ -3,6 +3,8 @@ from __future__ import annotations
 from .base import Scene
 from .gameplay import GameplayScene
 from .options import OptionsScene
+from ..assets import registry
+from ..core.actions import ENDLESS, FIRE, HELP, OPTIONS, PAUSE, QUIT, START
 from ..config import Config
 
 
@@ -10,28 +12,48 @@ TITLE = "Turkey Invaders"
 
 
 class MenuScene(Scene):
+    _shared: "MenuScene | None" = None
+
     def __init__(self, config: Config) -> None:
         super().__init__()
         self.config = config
         self.show_help = False
+        # Parse wave data off-thread while the title screen is up
+        registry.preload()
+
+    @classmethod
+    def shared(cls, config: Config) -> "MenuScene":
+        """The menu instance for `config`, reset for re-entry."""
+        menu = cls._shared
+        if menu is None or menu.config is not config:
+            menu = cls._shared = cls(config)
+        menu.enter()
+        return menu
+
+    def enter(self) -> None:
+        super().enter()
+        self.show_help = False
 
     def handle_actions(self, actions):
         # If help is open, only toggle help/quit
         if self.show_help:
-            if 'help' in actions or 'start' in actions or 'pause' in actions:
+            if actions & (HELP | START | PAUSE):
                 self.show_help = False
-            if 'quit' in actions:
+            if actions & QUIT:
                 self.exit_program = True
             return
 
-        if 'quit' in actions:
+        if actions & QUIT:
             self.exit_program = True
-        if 'start' in actions or 'fire' in actions:
+        # One scene per tick: a GameplayScene holds its worker pool until closed
+        if actions & (START | FIRE):
             self.next_scene = GameplayScene(config=self.config)
-        if 'options' in actions:
+        elif actions & ENDLESS:
+            self.next_scene = GameplayScene(config=self.config, endless=True)
+        elif actions & OPTIONS:
             # Options runs and returns to menu on save/quit; we recreate menu on return
             self.next_scene = OptionsScene(self.config)
-        if 'help' in actions:
+        if actions & HELP:
             self.show_help = True
 
     def render(self, r) -> None:
@@ -39,7 +61,7 @@ class MenuScene(Scene):
         cx = max(0, w // 2 - len(TITLE) // 2)
         r.draw_text(cx, h // 2 - 1, TITLE, color_pair=1, bold=True)
         r.draw_text(max(0, w // 2 - 12), h // 2 + 1, "Enter/Space: Start", color_pair=1)
-        r.draw_text(max(0, w // 2 - 8), h // 2 + 2, "O: Options  H: Help", color_pair=1)
+        r.draw_text(max(0, w // 2 - 15), h // 2 + 2, "E: Endless  O: Options  H: Help", color_pair=1)
         r.draw_text(max(0, w // 2 - 12), h // 2 + 3, "Q: Back   Esc: Exit", color_pair=1)
 
         # Quick controls help
@@ -56,6 +78,7 @@ class MenuScene(Scene):
                 "- Fire: Space",
                 "- Bomb: X (clears bullets)",
                 "- Pause: P",
+                "- Endless mode: E",
                 "- Options: O",
                 "- Menu: Q   Exit: Esc",
                 "",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from .base import Scene
+from ..core.actions import DOWN, HELP, LEFT, PAUSE, QUIT, RIGHT, START, UP
 from ..config import Config
 
 
@@ -14,34 +15,34 @@ class OptionsScene(Scene):
     def handle_actions(self, actions):
         # If help overlay is open, allow closing it with H/Enter/P
         if self.show_help:
-            if 'help' in actions or 'start' in actions or 'pause' in actions:
+            if actions & (HELP | START | PAUSE):
                 self.show_help = False
-            if 'quit' in actions:
+            if actions & QUIT:
                 from .menu import MenuScene
-                self.next_scene = MenuScene(config=self.config)
+                self.next_scene = MenuScene.shared(self.config)
             return
 
-        if 'quit' in actions:
+        if actions & QUIT:
             # Do not save on quit; return to menu
             from .menu import MenuScene
-            self.next_scene = MenuScene(config=self.config)
+            self.next_scene = MenuScene.shared(self.config)
             return
-        if 'help' in actions:
+        if actions & HELP:
             self.show_help = True
             return
-        if 'up' in actions:
+        if actions & UP:
             self.cursor = (self.cursor - 1) % 4
-        if 'down' in actions:
+        if actions & DOWN:
             self.cursor = (self.cursor + 1) % 4
-        if 'left' in actions:
+        if actions & LEFT:
             self._adjust(-1)
-        if 'right' in actions:
+        if actions & RIGHT:
             self._adjust(+1)
-        if 'start' in actions:
+        if actions & START:
             # save and return to menu
             from .menu import MenuScene
             self.config.save()
-            self.next_scene = MenuScene(config=self.config)
+            self.next_scene = MenuScene.shared(self.config)
 
     def _adjust(self, delta: int) -> None:
         if self.cursor == 0:
@@ -0,0 +1,204 @@
+"""Headless simulation API for bots and automated agents.
+
+Drives the same entities and systems as `GameplayScene` without scenes,
+renderers, or curses. Observations are a preallocated uint8 grid (one byte
+per cell, row-major) that is overwritten in place every step.
+
+Usage:
+    sim = Simulation(width=80, height=24)
+    obs = sim.reset(seed=7)
+    obs, reward, done, info = sim.step(FIRE | LEFT)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+from .assets import registry
+from .config import DEFAULT_CONFIG
+# Action bits accepted by step(), re-exported for callers
+from .core.actions import BOMB, DOWN, FIRE, LEFT, RIGHT, UP  # noqa: F401
+from .core.events import EventBus
+from .core.world import World
+from .entities.player import Player
+from .systems.collision import resolve_collisions
+from .systems.digest import WorldDigest
+from .systems.parallel import EntityUpdater
+from .systems.scoring import award_kills
+from .systems.snapshot import restore, snapshot
+from .systems.spawner import Spawner
+from .systems.wavegen import EndlessWaves
+
+
+# Observation cell codes
+EMPTY = 0
+PLAYER = 1
+ENEMY = 2
+PROJ_PLAYER = 3
+PROJ_ENEMY = 4
+POWERUP_POWER = 5
+POWERUP_BOMB = 6
+
+OBS_CODES: Dict[str, int] = {
+    "player": PLAYER,
+    "enemy": ENEMY,
+    "proj_player": PROJ_PLAYER,
+    "proj_enemy": PROJ_ENEMY,
+    "powerup_power": POWERUP_POWER,
+    "powerup_bomb": POWERUP_BOMB,
+}
+
+
+class Simulation:
+    """Fixed-timestep gameplay loop with an array observation.
+
+    `step()` follows the same order as the interactive game: actions, entity
+    updates, spawner, collisions, scoring/drops, cleanup. The waves file is
+    parsed once; `reset()` only rewinds state.
+    """
+
+    def __init__(
+        self,
+        *,
+        width: int = 80,
+        height: int = 24,
+        fps: int = 60,
+        drops: Optional[Dict[str, float]] = None,
+        waves_path: Optional[str] = None,
+        max_steps: int = 0,
+        life_penalty: int = 50,
+        endless: bool = False,
+        digest: bool = False,
+        workers: int = 0,
+    ) -> None:
+        self.width = max(10, int(width))
+        self.height = max(6, int(height))
+        self.dt = 1.0 / float(max(1, fps))
+        drops = drops if drops is not None else DEFAULT_CONFIG["drops"]
+        self.p_power = float(drops.get("power", 0.20))
+        self.p_bomb = float(drops.get("bomb", 0.05))
+        self.max_steps = int(max_steps)
+        self.life_penalty = int(life_penalty)
+        self.waves_path = waves_path
+        self.endless = endless
+
+        self.obs = bytearray(self.width * self.height)
+        self.obs_view = memoryview(self.obs)
+        self._blank = bytes(len(self.obs))
+        self.info: Dict[str, Any] = {}
+        # Per-simulation event bus (subscribe to collect gameplay events)
+        self.events = EventBus()
+        # Per-tick state digest in info["digest"] (see systems.digest)
+        self.digest: Optional[WorldDigest] = WorldDigest() if digest else None
+        # workers > 1 updates entity chunks on a thread pool (see systems.parallel)
+        self.updater = EntityUpdater(workers)
+
+        self.world = World()
+        self.player: Player | None = None
+        pack = registry.wave_pack(waves_path)
+        self.spawner = Spawner(self.world, pack=pack, waves=EndlessWaves() if endless else None)
+        self.score = 0
+        self.tick = 0
+        self.reset()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Observation shape as (rows, cols)."""
+        return self.height, self.width
+
+    def reset(self, seed: Optional[int] = None) -> bytearray:
+        self.world = World()
+        self.world.events = self.events
+        self.world.width = self.width
+        self.world.height = self.height
+        self.player = Player(self.world.next_id(), x=self.width // 2, y=self.height - 2)
+        self.world.player = self.player
+        self.world.add(self.player)
+        self.spawner.world = self.world
+        self.spawner.reset(seed)
+        self.score = 0
+        self.tick = 0
+        self.events.tick = 0
+        if self.digest is not None:
+            self.digest.reset()
+        self._observe()
+        self._fill_info()
+        return self.obs
+
+    def step(self, action_mask: int) -> Tuple[bytearray, int, bool, Dict[str, Any]]:
+        world = self.world
+        player = self.player
+        dt = self.dt
+        score_before = self.score
+        lives_before = player.lives
+
+        # Actions (mirrors GameplayScene.handle_actions)
+        ix = (1 if action_mask & RIGHT else 0) - (1 if action_mask & LEFT else 0)
+        iy = (1 if action_mask & DOWN else 0) - (1 if action_mask & UP else 0)
+        if action_mask & FIRE and player.can_fire():
+            player.fire(world)
+        if action_mask & BOMB:
+            player.use_bomb(world)
+
+        # Update (mirrors GameplayScene.update)
+        player.move_intent(ix, iy, dt)
+        self.updater.update(world, dt)
+        self.spawner.update(dt)
+        resolve_collisions(world)
+        self.score += award_kills(world, self.spawner.rng, self.p_power, self.p_bomb)
+        world.remove_dead()
+        self.events.end_tick()
+        self.tick += 1
+
+        reward = (self.score - score_before) - self.life_penalty * (lives_before - player.lives)
+        done = player.lives <= 0 or self.cleared() or (0 < self.max_steps <= self.tick)
+        self._observe()
+        self._fill_info()
+        return self.obs, reward, done, self.info
+
+    def snapshot(self) -> bytes:
+        """Binary snapshot of the full simulation state (see systems.snapshot)."""
+        return snapshot(self.world, self.spawner, score=self.score, tick=self.tick)
+
+    def restore(self, data: bytes) -> bytearray:
+        """Rewind to a state produced by `snapshot()`; returns the observation."""
+        state = restore(data, self.spawner)
+        self.world = state.world
+        self.world.events = self.events
+        self.player = state.world.player
+        self.score = state.score
+        self.tick = state.tick
+        self.events.tick = state.tick
+        if self.digest is not None:
+            self.digest.reset()
+        self._observe()
+        self._fill_info()
+        return self.obs
+
+    def close(self) -> None:
+        """Stop the update thread pool, if any."""
+        self.updater.close()
+
+    def cleared(self) -> bool:
+        """True once the last wave is finished (never in endless mode)."""
+        return self.spawner.finished
+
+    def _observe(self) -> None:
+        obs = self.obs
+        obs[:] = self._blank
+        w, h = self.width, self.height
+        codes = OBS_CODES
+        for e in self.world.entities:
+            x, y = e.x, e.y
+            if 0 <= x < w and 0 <= y < h:
+                obs[y * w + x] = codes.get(e.kind, EMPTY)
+
+    def _fill_info(self) -> None:
+        info = self.info
+        info["tick"] = self.tick
+        info["score"] = self.score
+        info["lives"] = self.player.lives
+        info["power"] = self.player.power
+        info["bombs"] = self.player.bombs
+        info["wave"] = self.spawner.wave_index
+        if self.digest is not None:
+            info["digest"] = self.digest.update(self.world, self.spawner, self.score, self.tick)
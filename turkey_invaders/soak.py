@@ -0,0 +1,275 @@
+"""Endurance soak: `python -m turkey_invaders.soak --hours 2 --report soak.jsonl`.
+
+Runs endless-mode gameplay on an unthrottled clock with a scripted player,
+for a given amount of *simulated* time. Every `--interval` simulated seconds
+it records a sample: tick-time percentiles for the window, RSS, tracemalloc
+heap, world size and id counter, `by_kind` keys (and any outside the known
+entity kinds), wave and score. The report
+is JSON lines (header, samples, summary) so it can be archived per release
+and diffed between them.
+
+After a warm-up, each tracked metric's median over the last third of the
+run is compared with its median over the middle third; a rise past both a
+relative and an absolute tolerance counts as drift and the exit status is 1.
+Tick time is judged at a fixed reference population (`REF_ENTITIES`), since
+the waves keep getting busier. By default the player never runs out of
+lives, so a single World lives for the whole run; `--mortal` resets on game
+over instead.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Any, Dict, List, Optional, TextIO
+
+from .simulation import BOMB, FIRE, LEFT, RIGHT, Simulation
+
+
+# Endless mode gets busier as it goes, so raw tick times rise with the
+# population. Timing drift is judged on each window's least-squares fit of
+# tick time against entity count, evaluated at this fixed population.
+REF_ENTITIES = 50
+
+# metric -> (relative tolerance, absolute floor): drift only if both exceeded
+DRIFT_LIMITS: Dict[str, tuple] = {
+    "rss_kb": (0.10, 4096),
+    "heap_kb": (0.10, 1024),
+    "tick_at_ref_us": (0.25, 20.0),
+    # by_kind gains a key whenever a kind first appears, so only keys that
+    # are not entity kinds at all can point at a leak
+    "stray_kinds": (0.0, 0),
+}
+
+# Every entity kind the game creates (entities/*.py)
+KNOWN_KINDS = frozenset({
+    "player", "enemy", "proj_player", "proj_enemy", "powerup_power", "powerup_bomb",
+})
+
+
+def scripted_action(sim: Simulation) -> int:
+    """Chase the lowest enemy's column, fire constantly, bomb close shots."""
+    world = sim.world
+    player = sim.player
+    mask = FIRE
+    enemies = world.by_kind.get("enemy")
+    if enemies:
+        target = max(enemies, key=_lowest)
+        if target.x < player.x:
+            mask |= LEFT
+        elif target.x > player.x:
+            mask |= RIGHT
+    for p in world.by_kind.get("proj_enemy", ()):
+        if abs(p.x - player.x) <= 1 and 0 < player.y - p.y <= 2:
+            mask |= BOMB
+            break
+    return mask
+
+
+def _lowest(e) -> tuple:
+    return e.y, -e.id
+
+
+def rss_kb() -> int:
+    """Current resident set size in KiB (peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[i]
+
+
+def fit_at(xs: array, ys: array, at: float) -> float:
+    """Least-squares line through (xs, ys) evaluated at `at` (mean if flat)."""
+    n = len(xs)
+    if not n:
+        return 0.0
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    var = sum((x - mx) ** 2 for x in xs)
+    if var < n:  # population barely moved: slope is noise
+        return my
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+    return my + slope * (at - mx)
+
+
+def detect_drift(samples: List[Dict[str, Any]], warmup: float = 0.2) -> Dict[str, Dict[str, Any]]:
+    """Compare the last third of post-warm-up samples with the middle third."""
+    body = samples[int(len(samples) * warmup):]
+    third = len(body) // 3
+    verdicts: Dict[str, Dict[str, Any]] = {}
+    if third < 1:
+        return verdicts
+    for metric, (rel, floor) in DRIFT_LIMITS.items():
+        mid = statistics.median(s[metric] for s in body[third:2 * third])
+        last = statistics.median(s[metric] for s in body[-third:])
+        rise = last - mid
+        drift = rise > floor and rise > rel * abs(mid)
+        verdicts[metric] = {"middle": mid, "last": last, "rise": rise, "drift": drift}
+    return verdicts
+
+
+class Soak:
+    def __init__(
+        self,
+        *,
+        seconds: float,
+        interval: float = 60.0,
+        seed: int = 1,
+        fps: int = 60,
+        mortal: bool = False,
+        trace: bool = True,
+        out: Optional[TextIO] = None,
+        echo: Optional[TextIO] = None,
+    ) -> None:
+        self.sim = Simulation(fps=fps, endless=True)
+        self.seed = seed
+        self.ticks = int(seconds * fps)
+        self.window = max(1, int(interval * fps))
+        self.mortal = mortal
+        self.trace = trace
+        self.out = out
+        self.echo = echo
+        self.resets = 0
+        self.samples: List[Dict[str, Any]] = []
+
+    def run(self) -> Dict[str, Any]:
+        sim = self.sim
+        sim.reset(self.seed)
+        if self.trace:
+            tracemalloc.start()
+        self._write({
+            "type": "header",
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "ticks": self.ticks,
+            "window_ticks": self.window,
+            "fps": round(1.0 / sim.dt),
+            "seed": self.seed,
+            "mortal": self.mortal,
+            "tracemalloc": self.trace,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        })
+        times = array("d")
+        counts = array("d")
+        clock = time.perf_counter
+        wall0 = clock()
+        try:
+            for _ in range(self.ticks):
+                action = scripted_action(sim)
+                t0 = clock()
+                sim.step(action)
+                times.append(clock() - t0)
+                counts.append(len(sim.world.entities))
+                if sim.player.lives <= 0:
+                    if self.mortal:
+                        self.resets += 1
+                        sim.reset(self.seed + self.resets)
+                    else:
+                        sim.player.lives = 3
+                if len(times) >= self.window:
+                    self._sample(times, counts, clock() - wall0)
+                    times = array("d")
+                    counts = array("d")
+        finally:
+            if self.trace:
+                tracemalloc.stop()
+            sim.close()
+        verdicts = detect_drift(self.samples)
+        summary = {
+            "type": "summary",
+            "samples": len(self.samples),
+            "wall_s": round(clock() - wall0, 3),
+            "drift": verdicts,
+            "passed": not any(v["drift"] for v in verdicts.values()),
+        }
+        self._write(summary)
+        return summary
+
+    def _sample(self, times: array, counts: array, wall: float) -> None:
+        sim = self.sim
+        world = sim.world
+        ts = sorted(times)
+        gc.collect()
+        heap = tracemalloc.get_traced_memory()[0] // 1024 if self.trace else 0
+        sample = {
+            "type": "sample",
+            "tick": sim.tick,
+            "sim_s": round(sim.tick * sim.dt, 3),
+            "wall_s": round(wall, 3),
+            "tick_p50_us": round(_percentile(ts, 0.50) * 1e6, 2),
+            "tick_p90_us": round(_percentile(ts, 0.90) * 1e6, 2),
+            "tick_p99_us": round(_percentile(ts, 0.99) * 1e6, 2),
+            "tick_max_us": round(ts[-1] * 1e6, 2),
+            "tick_at_ref_us": round(fit_at(counts, times, REF_ENTITIES) * 1e6, 2),
+            "rss_kb": rss_kb(),
+            "heap_kb": heap,
+            "entities": len(world.entities),
+            "next_id": world._next_id,
+            "by_kind_keys": len(world.by_kind),
+            "stray_kinds": sum(1 for k in world.by_kind if k not in KNOWN_KINDS),
+            "wave": sim.spawner.wave_index,
+            "score": sim.score,
+            "resets": self.resets,
+        }
+        self.samples.append(sample)
+        self._write(sample)
+        if self.echo is not None:
+            print(f"t={sample['sim_s']:>9.0f}s  p50={sample['tick_p50_us']:>7.1f}us  p99={sample['tick_p99_us']:>8.1f}us"
+                  f"  ref={sample['tick_at_ref_us']:>7.1f}us  rss={sample['rss_kb']}K heap={sample['heap_kb']}K  ents={sample['entities']}"
+                  f"  wave={sample['wave']}", file=self.echo, flush=True)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self.out is not None:
+            self.out.write(json.dumps(record) + "\n")
+            self.out.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m turkey_invaders.soak",
+                                 description="Run simulated hours of endless mode and check for drift.")
+    ap.add_argument("--hours", type=float, default=1.0, help="simulated hours to run")
+    ap.add_argument("--interval", type=float, default=60.0, help="simulated seconds per sample")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--fps", type=int, default=60)
+    ap.add_argument("--mortal", action="store_true", help="reset on game over instead of refilling lives")
+    ap.add_argument("--no-tracemalloc", action="store_true", help="skip heap tracing (faster, RSS only)")
+    ap.add_argument("--report", metavar="PATH", help="write the JSON-lines report here")
+    args = ap.parse_args(argv)
+
+    out = open(args.report, "w", encoding="utf-8") if args.report else None
+    try:
+        soak = Soak(seconds=args.hours * 3600.0, interval=args.interval, seed=args.seed, fps=args.fps,
+                    mortal=args.mortal, trace=not args.no_tracemalloc, out=out, echo=sys.stdout)
+        summary = soak.run()
+    finally:
+        if out is not None:
+            out.close()
+    for metric, v in summary["drift"].items():
+        flag = "DRIFT" if v["drift"] else "ok"
+        print(f"{metric:>13}: {v['middle']} -> {v['last']}  {flag}")
+    if not summary["drift"]:
+        print("too few samples to judge drift")
+    print("PASS" if summary["passed"] else "FAIL")
+    return 0 if summary["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
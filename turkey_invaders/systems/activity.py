@@ -0,0 +1,94 @@
+"""Camera-relative update frequency for worlds larger than the screen.
+
+`ActivityZones` sorts the occupied cells of the world's spatial index into
+three bands around the camera view:
+
+- active: the view grown by `near` cells; updated every tick
+- slow: out to `far` cells beyond the view; each cell is updated every
+  `slow_every` ticks with a correspondingly longer dt, staggered by cell
+  so the work is spread evenly over the ticks
+- dormant: everything else; updated the same way every `dormant_every`
+  ticks, so formations far away still march at their average speed
+
+Short-lived entities (projectiles and power-ups) ignore the bands and are
+updated every tick wherever they are, so they always reach their off-world
+despawn checks instead of piling up out of view.
+
+Everything updated is re-bucketed in the index afterwards. Entities of one
+band are updated in id order (their order in `World.entities`), so spawns
+and kills still happen in a stable sequence.
+"""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import List, Optional
+
+from ..core.camera import Camera
+from ..core.world import World
+
+
+_by_id = attrgetter("id")
+
+# Kinds updated every tick regardless of the camera
+TRANSIENT_KINDS = ("proj_", "powerup_")
+
+
+class ActivityZones:
+    def __init__(self, *, near: int = 8, far: Optional[int] = None, slow_every: int = 4,
+                 dormant_every: int = 16) -> None:
+        self.near = max(0, int(near))
+        self.far = far  # None: one view size beyond the view
+        self.slow_every = max(1, int(slow_every))
+        self.dormant_every = max(self.slow_every, int(dormant_every))
+        self.tick = 0
+        # Entities updated by the last call, per band (for metrics)
+        self.active = 0
+        self.slowed = 0
+        self.dormant = 0
+
+    def update(self, world: World, updater, camera: Camera, dt: float) -> None:
+        """Update the entities near `camera` through `updater` and re-index them."""
+        index = world.index
+        near = self.near
+        far_x = camera.width if self.far is None else max(near, self.far)
+        far_y = camera.height if self.far is None else max(near, self.far)
+        ax0, ay0, ax1, ay1 = camera.rect(near, near)
+        fx0, fy0, fx1, fy1 = camera.rect(far_x, far_y)
+        cw, ch = index.cell_w, index.cell_h
+        every, dormant_every = self.slow_every, self.dormant_every
+        phase = self.tick % every
+        dormant_phase = self.tick % dormant_every
+        self.tick += 1
+        active: List = []
+        slow: List = []
+        dormant: List = []
+        for (cx, cy), bucket in index.cells():
+            x0, y0 = cx * cw, cy * ch
+            if x0 < ax1 and x0 + cw > ax0 and y0 < ay1 and y0 + ch > ay0:
+                active.extend(bucket)
+            elif x0 < fx1 and x0 + cw > fx0 and y0 < fy1 and y0 + ch > fy0:
+                if (cx + cy) % every == phase:
+                    slow.extend(e for e in bucket if not e.kind.startswith(TRANSIENT_KINDS))
+            elif (cx + cy) % dormant_every == dormant_phase:
+                dormant.extend(e for e in bucket if not e.kind.startswith(TRANSIENT_KINDS))
+        # Transient entities outside the active cells still run every tick
+        for kind, members in world.by_kind.items():
+            if not kind.startswith(TRANSIENT_KINDS):
+                continue
+            for e in members:
+                x0, y0 = (e.x // cw) * cw, (e.y // ch) * ch
+                if not (x0 < ax1 and x0 + cw > ax0 and y0 < ay1 and y0 + ch > ay0):
+                    active.append(e)
+
+        active.sort(key=_by_id)
+        updater.update(world, dt, active)
+        for band, band_dt in ((slow, dt * every), (dormant, dt * dormant_every)):
+            if band:
+                band.sort(key=_by_id)
+                updater.update(world, band_dt, band)
+        for band in (active, slow, dormant):
+            for e in band:
+                index.move(e)
+        self.active = len(active)
+        self.slowed = len(slow)
+        self.dormant = len(dormant)
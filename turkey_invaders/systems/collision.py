@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Iterable, List, Tuple
 
+from ..core import events
+from ..core.world import CAUSE_CONTACT, CAUSE_PICKUP, CAUSE_SHOT, CAUSE_SPENT
 from ..core.entity import BaseEntity
 
 
@@ -17,41 +19,57 @@ def resolve_collisions(world) -> None:
     - Player projectiles vs enemies -> damage/destroy, score increment handled in scene.
     - Enemy contact vs player -> player hit.
     - Enemy projectiles vs player -> player hit.
+
+    With a spatial index on the world, candidates come from the cells at
+    each shot and at the player instead of full scans (same order, so the
+    same outcome).
     """
     player = world.player
     if player is None:
         return
 
     player_bb = player.bbox()
+    ev = world.events
+    index = world.index
+
+    def near(bb, kind_prefix: str) -> List[BaseEntity]:
+        x, y, w, h = bb
+        return [e for e in index.query(x, y, x + w, y + h) if e.kind.startswith(kind_prefix)]
 
     # Enemy vs player contact
-    for e in list(world.by_kind.get("enemy", [])):
+    enemies_at_player = near(player_bb, "enemy") if index is not None else list(world.by_kind.get("enemy", []))
+    for e in enemies_at_player:
         if aabb_intersect(e.bbox(), player_bb):
-            player.on_player_hit()
-            e.alive = False
+            player.on_player_hit(world)
+            world.kill(e, CAUSE_CONTACT)
 
     # Enemy projectile vs player
     for p in list(world.by_kind.get("proj_enemy", [])):
         if aabb_intersect(p.bbox(), player_bb):
-            player.on_player_hit()
-            p.alive = False
+            player.on_player_hit(world)
+            world.kill(p, CAUSE_CONTACT)
 
     # Player projectiles vs enemies
     for p in list(world.by_kind.get("proj_player", [])):
         pbb = p.bbox()
-        for e in list(world.by_kind.get("enemy", [])):
+        for e in near(pbb, "enemy") if index is not None else list(world.by_kind.get("enemy", [])):
             if aabb_intersect(pbb, e.bbox()):
-                e.on_hit(p.damage, source="player")
-                p.alive = False
+                world.touch(e)
+                if e.on_hit(p.damage, source="player"):
+                    world.kill(e, CAUSE_SHOT)
+                world.kill(p, CAUSE_SPENT)
                 break
 
     # Player vs power-ups
-    for item in list(world.entities):
+    for item in near(player_bb, "powerup_") if index is not None else list(world.entities):
         if not item.kind.startswith("powerup_"):
             continue
         if aabb_intersect(player_bb, item.bbox()):
             if item.kind == "powerup_power":
                 world.player.power = min(5, world.player.power + 1)
+                ev.emit(events.PICKUP, item.id, item.x, item.y, events.ITEM_POWER)
             elif item.kind == "powerup_bomb":
                 world.player.bombs = min(9, getattr(world.player, 'bombs', 0) + 1)
-            item.alive = False
+                ev.emit(events.PICKUP, item.id, item.x, item.y, events.ITEM_BOMB)
+            world.kill(item, CAUSE_PICKUP)
+
@@ -0,0 +1,127 @@
+"""Incremental per-tick digest of gameplay state.
+
+`WorldDigest.update()` folds live entity records (kind, id, position, hp),
+player state, score, tick and the spawner RNG state into one 64-bit value.
+Entities are combined with XOR, so each tick only the records that changed
+since the last call are rehashed. Which ones changed comes from
+`world.changed`: the world notes added and killed entities itself, movers
+and collisions call `world.touch(e)`, so a tick costs time proportional to
+what moved rather than to the population. The first update on a world
+hashes every entity and starts the tracking. Killed entities are dropped
+from the digest at that point, so call it after `remove_dead()`.
+
+The value depends only on the state, not
+on how it was reached, so two runs that agree on a tick agree on its digest
+(and restoring a snapshot gives the same digest as the original run).
+
+Hashes come from `hash()` on tuples of ints and floats. Those are not
+randomized per process, but they do depend on the platform word size, so
+compare digests between runs on the same kind of host.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import Any, Dict, List, Tuple
+
+
+MASK = (1 << 64) - 1
+
+_PLAYER_FIELDS = ("lives", "power", "bombs", "invuln", "_cooldown", "_mx", "_my")
+
+
+_kind_codes: Dict[str, int] = {}
+
+
+def _kind_code(kind: str) -> int:
+    code = _kind_codes.get(kind)
+    if code is None:
+        # str hashes are salted per process; crc32 is not
+        code = _kind_codes[kind] = zlib.crc32(kind.encode("utf-8"))
+    return code
+
+
+class WorldDigest:
+    def __init__(self) -> None:
+        self.value = 0
+        self.rehashed = 0  # entity records rehashed by the last update
+        self._acc = 0
+        self._rows: Dict[int, Tuple[Tuple, int]] = {}
+        self._next_id = -1
+        self._rng_hash = 0
+        self._world = None
+
+    def reset(self) -> None:
+        """Forget cached records (call when the world object is replaced)."""
+        self.__init__()
+
+    def update(self, world, spawner, score: int, tick: int) -> int:
+        """Fold in what changed since the last call; returns the digest."""
+        rows = self._rows
+        acc = self._acc
+        changed = world.changed
+        if changed is None or world is not self._world:
+            # New world: hash everything once, then follow its touches
+            self._world = world
+            world.changed = changed = set()
+            rows.clear()
+            acc = 0
+            todo = world.entities
+        else:
+            todo = changed
+        rehashed = 0
+        removed = False
+        kc = _kind_codes
+        for e in todo:
+            if not e.alive:
+                old = rows.pop(e.id, None)
+                if old is not None:
+                    acc ^= old[1]
+                removed = True
+                continue
+            code = kc.get(e.kind)
+            if code is None:
+                code = _kind_code(e.kind)
+            rec = (code, e.id, e.x, e.y, e.hp)
+            old = rows.get(e.id)
+            if old is not None:
+                if old[0] == rec:
+                    continue
+                acc ^= old[1]
+            h = hash(rec)
+            rows[e.id] = (rec, h)
+            acc ^= h
+            rehashed += 1
+        changed.clear()
+
+        # Copying the 625-word MT state costs more than the rest of the
+        # update, so only do it on ticks that could have drawn: every draw
+        # site spawns an entity (new id) or rolls for a dead enemy (removal)
+        if removed or world._next_id != self._next_id:
+            self._next_id = world._next_id
+            self._rng_hash = hash(spawner.rng.getstate()[1])
+        player = world.player
+        p = tuple(getattr(player, f, 0) for f in _PLAYER_FIELDS) if player is not None else ()
+        self._acc = acc
+        self.rehashed = rehashed
+        self.value = hash((acc, p, score, tick, spawner.wave_index, self._rng_hash)) & MASK
+        return self.value
+
+
+def dump_state(world, spawner, score: int, tick: int) -> Dict[str, Any]:
+    """Plain-data view of the digested state plus each entity's own fields.
+
+    Used to explain a digest mismatch; numbers and strings only.
+    """
+    entities: List[Dict[str, Any]] = []
+    for e in world.entities:
+        row = {k: v for k, v in vars(e).items() if isinstance(v, (int, float, str, bool))}
+        row["class"] = type(e).__name__
+        entities.append(row)
+    words = spawner.rng.getstate()[1]
+    return {
+        "tick": tick,
+        "score": score,
+        "wave_index": spawner.wave_index,
+        "rng": hash(words) & MASK,
+        "entities": entities,
+    }
@@ -0,0 +1,171 @@
+"""Partitioned entity update on a thread pool.
+
+Meant for free-threaded CPython on many-core hosts; under the GIL it is
+correct but not faster. `EntityUpdater.update()` splits the entity list into
+contiguous chunks and updates each chunk on a worker thread against a
+`_ChunkWorld` stand-in. Anything an update does to shared state (reserving
+ids, spawning, killing, hitting the player, emitting events) is recorded in
+the chunk's op buffer instead of applied. Afterwards the buffers are
+replayed against the real World in chunk order, which is exactly the order
+the serial loop would have performed them in, so the result is
+bit-identical to `for e in list(world.entities): e.update(dt, world)`.
+
+Entity updates may read the world size and the player, and touch the
+world only through `next_id`, `add`, `kill`, `touch`, `events.emit` and
+`player.on_player_hit`. Entities up to and including the player run
+serially first, because later ones read the player's updated position.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.world import World
+
+
+# Op tags
+_ID = 0
+_ADD = 1
+_KILL = 2
+_HIT = 3
+_EMIT = 4
+_TOUCH = 5
+
+Op = Tuple[Any, ...]
+
+
+class _Events:
+    __slots__ = ("_ops",)
+
+    def __init__(self, ops: List[Op]) -> None:
+        self._ops = ops
+
+    def emit(self, *args: Any, **kwargs: Any) -> None:
+        self._ops.append((_EMIT, args, kwargs))
+
+
+class _Player:
+    """Read-through view of the player that defers hits."""
+
+    __slots__ = ("_player", "_ops")
+
+    def __init__(self, player, ops: List[Op]) -> None:
+        object.__setattr__(self, "_player", player)
+        object.__setattr__(self, "_ops", ops)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._player, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("the player is read-only during a parallel update")
+
+    def on_player_hit(self, world=None) -> None:  # noqa: ARG002 - replayed with the real world
+        self._ops.append((_HIT,))
+
+
+class _ChunkWorld:
+    """World stand-in for one chunk; side effects go to `ops`."""
+
+    def __init__(self, world: World, ops: List[Op]) -> None:
+        self.width = world.width
+        self.height = world.height
+        self.player = _Player(world.player, ops) if world.player is not None else None
+        self.events = _Events(ops)
+        self._ops = ops
+        self._provisional = 0
+
+    def next_id(self) -> int:
+        # Provisional ids are negative; real ones are assigned at merge time
+        self._provisional -= 1
+        self._ops.append((_ID, self._provisional))
+        return self._provisional
+
+    def add(self, e) -> None:
+        self._ops.append((_ADD, e))
+
+    def kill(self, e, cause: str) -> None:
+        self._ops.append((_KILL, e, cause))
+
+    def touch(self, e) -> None:
+        self._ops.append((_TOUCH, e))
+
+
+def _run_chunk(chunk: List, dt: float, world: World) -> List[Op]:
+    ops: List[Op] = []
+    proxy = _ChunkWorld(world, ops)
+    for e in chunk:
+        e.update(dt, proxy)
+    return ops
+
+
+def _replay(world: World, ops: List[Op]) -> None:
+    ids: Dict[int, int] = {}
+    for op in ops:
+        tag = op[0]
+        if tag == _ID:
+            ids[op[1]] = world.next_id()
+        elif tag == _ADD:
+            e = op[1]
+            if e.id in ids:
+                e.id = ids[e.id]
+            world.add(e)
+        elif tag == _KILL:
+            world.kill(op[1], op[2])
+        elif tag == _HIT:
+            world.player.on_player_hit(world)
+        elif tag == _TOUCH:
+            world.touch(op[1])
+        else:
+            world.events.emit(*op[1], **op[2])
+
+
+class EntityUpdater:
+    """Runs the per-tick entity update serially or across `workers` threads.
+
+    Worlds smaller than `min_chunk` entities per worker are updated
+    serially; the pool only pays off once chunks are large.
+    """
+
+    def __init__(self, workers: int = 0, *, min_chunk: int = 128) -> None:
+        if workers < 0:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.min_chunk = max(1, min_chunk)
+        self.parallel_ticks = 0
+        self._pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(workers, thread_name_prefix="entity-update") if workers > 1 else None
+        )
+
+    def update(self, world: World, dt: float, entities: Optional[List] = None) -> None:
+        """Update `entities` (default: the whole world) in list order."""
+        entities = list(world.entities) if entities is None else entities
+        pool = self._pool
+        if pool is None or len(entities) < 2 * self.min_chunk:
+            for e in entities:
+                e.update(dt, world)
+            return
+
+        # Serial prefix: everything up to the player sees it before its move
+        start = 0
+        player = world.player
+        if player is not None:
+            for i, e in enumerate(entities):
+                if e is player:
+                    start = i + 1
+                    break
+        for e in entities[:start]:
+            e.update(dt, world)
+
+        rest = len(entities) - start
+        size = max(self.min_chunk, -(-rest // self.workers))
+        futures = [pool.submit(_run_chunk, entities[i:i + size], dt, world) for i in range(start, len(entities), size)]
+        # Merge strictly in chunk order, whatever order the chunks finished in
+        for f in futures:
+            _replay(world, f.result())
+        self.parallel_ticks += 1
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
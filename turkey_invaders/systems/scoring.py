@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import random
+from operator import attrgetter
+
+from ..core import events
+from ..entities.powerup import PowerUp
+
+
+KILL_POINTS = 10
+
+
+def award_kills(world, rng: random.Random | None, p_power: float, p_bomb: float) -> int:
+    """Score enemies in this tick's death queue and roll their drops.
+
+    Must run before `world.remove_dead()`. Every enemy death scores, whatever
+    its cause. Drops are rolled in spawn order (entity id), not in the order
+    systems reported the deaths, so the RNG stream does not depend on system
+    order. Returns the points earned.
+    """
+    points = 0
+    ev = world.events
+    dead = [e for e, _ in world.deaths if e.kind == "enemy"]
+    if len(dead) > 1:
+        dead.sort(key=attrgetter("id"))
+    for e in dead:
+        points += KILL_POINTS
+        ev.emit(events.KILL, e.id, e.x, e.y, KILL_POINTS)
+        roll = rng.random() if rng else 0.0
+        if roll < p_power:
+            kid = world.next_id()
+            world.add(PowerUp(kid, e.x, e.y, kind='power'))
+            ev.emit(events.DROP, kid, e.x, e.y, events.ITEM_POWER)
+        elif roll < p_power + p_bomb:
+            kid = world.next_id()
+            world.add(PowerUp(kid, e.x, e.y, kind='bomb'))
+            ev.emit(events.DROP, kid, e.x, e.y, events.ITEM_BOMB)
+    return points
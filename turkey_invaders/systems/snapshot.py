@@ -0,0 +1,184 @@
+"""Compact binary snapshots of the full gameplay state.
+
+Packs `World` entities, the player, the spawner cursor (including its RNG
+state) and scene score into a versioned little-endian blob built with
+`struct`/`array`, and rebuilds the exact state from it. Entities are rebuilt
+without calling their constructors, so restoring never consumes RNG draws.
+
+Layout (v4):
+    header   magic "TISN", u16 version, u16 reserved
+    globals  width, height, next_id, entity count, score, tick, bomb flash
+    spawner  wave_index, timer, spawn_accum, spawned_once, spawned, seed,
+             RNG version, 625 u32 words, optional gauss_next
+    entities one record per entity in world order: u8 type code, common
+             fields (id, x, y, hp, alive), then per-type fields; speeds
+             and sub-cell fractions are fixed-point ints (see core.fixed)
+
+Wave definitions and path tables are not stored (path enemies keep their
+path id); restore into a spawner that loaded the same wave pack.
+"""
+from __future__ import annotations
+
+import random
+import struct
+import sys
+from array import array
+from operator import attrgetter
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from ..core.world import World
+from ..entities.enemy import DiveEnemy, GruntEnemy, PathEnemy, ShooterEnemy
+from ..entities.player import Player
+from ..entities.powerup import PowerUp
+from ..entities.projectile import Projectile
+
+
+MAGIC = b"TISN"
+VERSION = 4  # v4: fractions and speeds in 1/65536 cells (v3 used 1/256)
+
+_HEADER = struct.Struct("<4sHH")
+_GLOBALS = struct.Struct("<iiqIqqd")
+_SPAWNER = struct.Struct("<idd?iqi?d")
+_COMMON = struct.Struct("<Bqiii?")
+_COMMON_FIELDS = ("id", "x", "y", "hp", "alive")
+_RNG_WORDS = 625
+
+
+class SnapshotError(ValueError):
+    """Raised when a blob is not a snapshot this version can restore."""
+
+
+class Restored(NamedTuple):
+    world: World
+    score: int
+    tick: int
+    bomb_flash: float
+
+
+class _Spec:
+    def __init__(self, code: int, cls: type, kind: str, fmt: str, fields: Tuple[str, ...], **fixed: Any) -> None:
+        self.code = code
+        self.cls = cls
+        self.kind = kind
+        self.struct = struct.Struct("<" + fmt)
+        self.fields = fields
+        self.get = attrgetter(*fields)
+        self.fixed = fixed
+
+
+_SPECS: List[_Spec] = [
+    _Spec(1, Player, "player", "idddiiiii",
+          ("speed", "fire_cd", "_cooldown", "invuln", "_mx", "_my", "power", "lives", "bombs")),
+    _Spec(2, GruntEnemy, "enemy", "iiii", ("speed", "dir", "_ax", "_wave")),
+    _Spec(3, DiveEnemy, "enemy", "iiii", ("speed", "_step", "_ay", "_wave")),
+    _Spec(4, ShooterEnemy, "enemy", "iiddiii",
+          ("speed", "dir", "fire_interval", "_cooldown", "_ax", "_ay", "_wave")),
+    _Spec(5, Projectile, "proj_player", "iii", ("vy", "_ay", "damage"), owner="player"),
+    _Spec(6, Projectile, "proj_enemy", "iii", ("vy", "_ay", "damage"), owner="enemy"),
+    _Spec(7, PowerUp, "powerup_power", "i", ("_ay",), type="power"),
+    _Spec(8, PowerUp, "powerup_bomb", "i", ("_ay",), type="bomb"),
+    _Spec(9, PathEnemy, "enemy", "iiqqiii", ("speed", "path_id", "_ox", "_oy", "_step", "_pa", "_wave")),
+]
+_BY_CODE: Dict[int, _Spec] = {s.code: s for s in _SPECS}
+_BY_KEY: Dict[Tuple[type, str], _Spec] = {(s.cls, s.kind): s for s in _SPECS}
+_get_common = attrgetter(*_COMMON_FIELDS)
+
+
+def snapshot(world: World, spawner, *, score: int = 0, tick: int = 0, bomb_flash: float = 0.0) -> bytes:
+    """Pack world, spawner and score state into a versioned binary blob."""
+    parts: List[bytes] = [
+        _HEADER.pack(MAGIC, VERSION, 0),
+        _GLOBALS.pack(world.width, world.height, world._next_id, len(world.entities), score, tick, bomb_flash),
+    ]
+
+    version, words, gauss = spawner.rng.getstate()
+    parts.append(_SPAWNER.pack(spawner.wave_index, spawner.timer, spawner.spawn_accum, spawner._spawned_once,
+                               spawner.spawned,
+                               spawner.seed, version, gauss is not None, gauss or 0.0))
+    parts.append(_rng_bytes(words))
+
+    common = _COMMON
+    for e in world.entities:
+        spec = _BY_KEY.get((type(e), e.kind))
+        if spec is None:
+            raise SnapshotError(f"cannot snapshot entity {type(e).__name__} ({e.kind})")
+        parts.append(common.pack(spec.code, *_get_common(e)))
+        values = spec.get(e)
+        parts.append(spec.struct.pack(*values) if len(spec.fields) > 1 else spec.struct.pack(values))
+    return b"".join(parts)
+
+
+def restore(data: bytes, spawner) -> Restored:
+    """Rebuild the state packed by `snapshot()`.
+
+    Returns a fresh World and the scene counters; `spawner` is rewound in
+    place and re-pointed at the new world.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise SnapshotError("truncated snapshot")
+    magic, version, _ = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise SnapshotError("not a Turkey Invaders snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    off = _HEADER.size
+
+    try:
+        width, height, next_id, count, score, tick, bomb_flash = _GLOBALS.unpack_from(view, off)
+        off += _GLOBALS.size
+        wave_index, timer, accum, spawned_once, spawned, seed, rng_version, has_gauss, gauss = _SPAWNER.unpack_from(view, off)
+        off += _SPAWNER.size
+        words = array("I")
+        words.frombytes(view[off:off + 4 * _RNG_WORDS])
+        if sys.byteorder != "little":
+            words.byteswap()
+        off += 4 * _RNG_WORDS
+
+        world = World()
+        world.width = width
+        world.height = height
+        entities = world.entities
+        by_kind = world.by_kind
+        common = _COMMON
+        for _ in range(count):
+            code, *base = common.unpack_from(view, off)
+            off += common.size
+            spec = _BY_CODE[code]
+            values = spec.struct.unpack_from(view, off)
+            off += spec.struct.size
+            e = spec.cls.__new__(spec.cls)
+            d = e.__dict__
+            d.update(kind=spec.kind, w=1, h=1, vx=0.0, vy=0.0)
+            d.update(zip(_COMMON_FIELDS, base))
+            d.update(zip(spec.fields, values))
+            if spec.fixed:
+                d.update(spec.fixed)
+            entities.append(e)
+            by_kind.setdefault(e.kind, []).append(e)
+            if code == 1:
+                world.player = e
+            elif code == 9:
+                d["path"] = spawner.path_list[d["path_id"]]
+    except (struct.error, KeyError, IndexError) as exc:
+        raise SnapshotError(f"corrupt snapshot: {exc}") from exc
+    world._next_id = next_id
+
+    rng = random.Random()
+    rng.setstate((rng_version, tuple(words), gauss if has_gauss else None))
+    spawner.world = world
+    spawner.rng = rng
+    spawner.seed = seed
+    spawner.seek(wave_index)
+    spawner.timer = timer
+    spawner.spawn_accum = accum
+    spawner._spawned_once = spawned_once
+    spawner.spawned = spawned
+    return Restored(world, score, tick, bomb_flash)
+
+
+def _rng_bytes(words: Tuple[int, ...]) -> bytes:
+    arr = array("I", words)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
@@ -1,47 +1,97 @@
 from __future__ import annotations
 
-import json
-import os
+import itertools
 import random
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from ..assets import WavePack, load_wave_pack
+from ..core import events
 from ..core.world import World
-from ..entities.enemy import GruntEnemy, DiveEnemy, ShooterEnemy
+from ..core.paths import PathTable
+from ..entities.enemy import GruntEnemy, DiveEnemy, PathEnemy, ShooterEnemy
 
 
 class Spawner:
-    def __init__(self, world: World, waves_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        world: World,
+        waves_path: Optional[str] = None,
+        *,
+        pack: Optional[WavePack] = None,
+        waves: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> None:
+        """Use a preloaded `pack` (see assets.registry) or read `waves_path`.
+
+        `waves` replaces the pack's wave list with any iterable of wave specs
+        (e.g. `wavegen.EndlessWaves()`); it is consumed one wave at a time.
+        Sources with an `iter_waves(seed, start)` method follow the run seed.
+        A plain iterator works too but cannot be rewound by `reset`/`seek`.
+        """
         self.world = world
-        self.waves: List[Dict[str, Any]] = []
         self.wave_index = 0
         self.timer = 0.0
         self.spawn_accum = 0.0
-        self.rng = random.Random(1337)
+        self.spawned = 0  # enemies streamed in by the current wave
         self._spawned_once = False  # for one-shot formation waves
-        if waves_path is None:
-            waves_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "waves.json")
-        self._load_waves(waves_path)
+        if pack is None and (waves is None or waves_path is not None):
+            pack = load_wave_pack(waves_path)
+        # Wave pack name (file stem), used to group leaderboard entries
+        self.pack = getattr(waves, "name", None) or (pack.name if pack else "custom")
+        # Seed from the wave file; reset() falls back to it
+        self.file_seed = pack.seed if pack else 1337
+        self.seed = self.file_seed
+        self.rng = random.Random(self.seed)
+        # Baked motion paths, by name and in id order
+        self.paths: Dict[str, PathTable] = pack.paths if pack else {}
+        self.path_list: Tuple[PathTable, ...] = pack.path_list if pack else ()
+        self.waves: Iterable[Dict[str, Any]] = list(pack.waves) if waves is None else waves
+        self._wave_iter: Optional[Iterator[Dict[str, Any]]] = None
+        self._wave: Optional[Dict[str, Any]] = None
+        self.seek(0)
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Rewind to the first wave and reseed the RNG (default: file seed)."""
+        self.seed = int(seed) if seed is not None else self.file_seed
+        self.rng = random.Random(self.seed)
+        self.timer = 0.0
+        self.spawn_accum = 0.0
+        self.spawned = 0
+        self._spawned_once = False
+        self.seek(0)
 
-    def _load_waves(self, path: str) -> None:
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
-            data = {"seed": 1337, "waves": [{"id": "wave1", "type": "formation", "rows": 1, "cols": 6, "speed": 2.0}]}
-        self.rng = random.Random(int(data.get("seed", 1337)))
-        self.waves = list(data.get("waves", []))
-        if not self.waves:
-            self.waves = [{"id": "wave1", "type": "formation", "rows": 1, "cols": 6, "speed": 2.0}]
+    def seek(self, index: int) -> None:
+        """Make wave `index` current by reopening the wave source."""
+        src = self.waves
+        if iter(src) is src:
+            # One-shot iterator: only "staying put" is possible
+            if self._wave_iter is not None and index == self.wave_index:
+                return
+            if self._wave_iter is not None:
+                raise ValueError("wave iterator cannot be rewound; pass a re-iterable source")
+            it = iter(src)
+            for _ in range(index):
+                next(it, None)
+        else:
+            opener = getattr(src, "iter_waves", None)
+            it = opener(self.seed, index) if opener else itertools.islice(iter(src), index, None)
+        self._wave_iter = it
+        self._wave = next(it, None)
+        self.wave_index = index
+
+    @property
+    def finished(self) -> bool:
+        """True once the wave source is exhausted (never, in endless mode)."""
+        return self._wave is None
 
     def current_id(self) -> str:
-        if 0 <= self.wave_index < len(self.waves):
-            return str(self.waves[self.wave_index].get("id", f"wave{self.wave_index+1}"))
+        if self._wave is not None:
+            return str(self._wave.get("id", f"wave{self.wave_index+1}"))
         return ""
 
     def update(self, dt: float) -> None:
-        if self.wave_index >= len(self.waves):
+        wave = self._wave
+        if wave is None:
             return
-        wave = self.waves[self.wave_index]
         self.timer += dt
 
         if wave.get("type") == "formation":
@@ -49,23 +99,27 @@ class Spawner:
             if not self._spawned_once:
                 self._spawn_formation(wave)
                 self._spawned_once = True
+            all_in = True
         else:
             rate = float(wave.get("spawn_rate", 1.0))
             count = int(wave.get("count", 10))
-            spawned = len([e for e in self.world.by_kind.get("enemy", []) if getattr(e, "_wave", None) == self.wave_index])
             self.spawn_accum += rate * dt
-            while self.spawn_accum >= 1.0 and spawned < count:
+            while self.spawn_accum >= 1.0 and self.spawned < count:
                 self.spawn_accum -= 1.0
                 self._spawn_one(wave)
-                spawned += 1
+                self.spawned += 1
+            all_in = self.spawned >= count
 
-        # Check wave completion
-        if not self.world.by_kind.get("enemy", []) and self.timer > 0.1:
+        # Check wave completion (streamed waves only once all have spawned)
+        if all_in and not self.world.by_kind.get("enemy", []) and self.timer > 0.1:
             # advance to next wave
             self.wave_index += 1
+            self._wave = next(self._wave_iter, None)
             self.timer = 0.0
             self.spawn_accum = 0.0
+            self.spawned = 0
             self._spawned_once = False
+            self.world.events.emit(events.WAVE, arg=self.wave_index)
 
     # --- spawn helpers ---
     def _spawn_formation(self, wave: Dict[str, Any]) -> None:
@@ -87,7 +141,11 @@ class Spawner:
         w = self.world.width
         x = self.rng.randint(1, max(1, w - 2))
         etype = wave.get("type", "dive")
-        if etype == "dive":
+        path = self.paths.get(wave.get("path", "")) if etype == "path" else None
+        if path is not None:
+            eid = self.world.next_id()
+            e = PathEnemy(eid, x, 1, path, speed=float(wave.get("speed", 1.0)))
+        elif etype == "dive":
             eid = self.world.next_id()
             e = DiveEnemy(eid, x, 1, speed=float(wave.get("speed", 3.0)))
         elif etype == "mixed":
@@ -95,7 +153,10 @@ class Spawner:
             choice = self._weighted_choice(patterns)
             if choice == "shooter":
                 eid = self.world.next_id()
-                e = ShooterEnemy(eid, x, 1, speed=float(wave.get("speed", 2.0)), fire_interval=float(wave.get("fire_interval", 2.0)))
+                e = ShooterEnemy(eid, x, 1, speed=float(wave.get("speed", 2.0)), fire_interval=float(wave.get("fire_interval", 2.0)), rng=self.rng)
+            elif choice == "dive":
+                eid = self.world.next_id()
+                e = DiveEnemy(eid, x, 1, speed=float(wave.get("speed", 3.0)))
             else:
                 eid = self.world.next_id()
                 e = GruntEnemy(eid, x, 1, speed=float(wave.get("speed", 2.0)))
@@ -0,0 +1,76 @@
+"""Procedural waves for endless mode.
+
+`EndlessWaves` is an infinite, lazily generated wave sequence. Wave `i`
+depends only on (seed, i), so a run is reproducible from its seed, memory
+stays constant however long it lasts, and the spawner can jump straight to
+any wave (snapshots only store the wave index).
+
+Difficulty ramps with the wave number: more enemies, faster movement,
+shorter shooter `fire_interval`, and a pattern mix that shifts from grunts
+towards shooters and divers.
+"""
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Dict, Iterator, Optional
+
+
+class EndlessWaves:
+    """Re-iterable source of generated waves.
+
+    With `seed=None` the sequence follows the spawner's run seed.
+    """
+
+    name = "endless"
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed = seed
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_waves(0 if self.seed is None else self.seed)
+
+    def iter_waves(self, seed: int, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """Waves `start, start+1, ...` for `seed` (ignored if fixed at init)."""
+        if self.seed is not None:
+            seed = self.seed
+        return (wave_at(seed, i) for i in itertools.count(start))
+
+
+def wave_at(seed: int, index: int) -> Dict[str, Any]:
+    """Wave `index` (0-based) of the endless sequence for `seed`."""
+    # String seeds hash with SHA-512: stable across processes and platforms
+    rng = random.Random(f"endless:{seed}:{index}")
+    tier = index
+    speed_scale = min(2.5, 1.0 + 0.06 * tier)
+    wave: Dict[str, Any] = {"id": f"endless{index + 1}"}
+
+    # Every fourth wave is a formation; the rest alternate weighted types
+    if index % 4 == 0:
+        wave.update(
+            type="formation",
+            rows=min(5, 2 + tier // 6),
+            cols=min(12, 6 + tier // 4),
+            speed=round(2.0 * speed_scale, 2),
+        )
+        return wave
+
+    kind = rng.choices(["dive", "mixed"], weights=[2, 2 + tier // 3])[0]
+    count = min(60, 10 + 2 * tier + rng.randint(0, 4))
+    spawn_rate = round(min(4.0, 1.0 + 0.12 * tier), 2)
+    if kind == "dive":
+        wave.update(type="dive", count=count, spawn_rate=spawn_rate, speed=round(3.0 * speed_scale, 2))
+        return wave
+    wave.update(
+        type="mixed",
+        count=count,
+        spawn_rate=spawn_rate,
+        speed=round(2.0 * speed_scale, 2),
+        fire_interval=round(max(0.6, 2.0 * 0.94 ** tier), 2),
+        patterns=[
+            {"type": "grunt", "weight": max(1, 6 - tier // 4)},
+            {"type": "shooter", "weight": 1 + tier // 3},
+            {"type": "dive", "weight": tier // 5},
+        ],
+    )
+    return wave
@@ -0,0 +1,63 @@
+"""Spectator client: `python -m turkey_invaders.watch [SOCKET]`.
+
+Connects to a game started with `TI_SPECTATE` and copies the ANSI stream to
+this terminal. Press `q` (or Ctrl-C) to stop watching.
+"""
+from __future__ import annotations
+
+import argparse
+import selectors
+import socket
+import sys
+from typing import List, Optional
+
+from .render.ansi_renderer import RawTerminal
+from .render.spectator import default_socket_path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m turkey_invaders.watch", description="Watch a live game.")
+    ap.add_argument("socket", nargs="?", default=None, help=f"server socket (default: {default_socket_path()})")
+    args = ap.parse_args(argv)
+    path = args.socket or default_socket_path()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError as exc:
+        print(f"cannot connect to {path}: {exc}", file=sys.stderr)
+        return 1
+
+    reason = "game ended"
+    sel = selectors.DefaultSelector()
+    try:
+        with RawTerminal() as term:
+            sel.register(sock, selectors.EVENT_READ)
+            sel.register(term.fd_in, selectors.EVENT_READ)
+            watching = True
+            while watching:
+                for key, _ in sel.select():
+                    if key.fileobj is sock:
+                        data = sock.recv(65536)
+                        if not data:
+                            watching = False
+                            break
+                        term.write(data)
+                    else:
+                        ch = term.getch()
+                        while ch != -1:
+                            if ch in (ord("q"), ord("Q")):
+                                reason = "stopped watching"
+                                watching = False
+                            ch = term.getch()
+    except KeyboardInterrupt:
+        reason = "stopped watching"
+    finally:
+        sel.close()
+        sock.close()
+    print(reason)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())